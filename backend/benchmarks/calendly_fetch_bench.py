@@ -0,0 +1,108 @@
+"""
+Calendly invitee fetch benchmark against benchmarks/fake_calendly.py.
+
+Times fetching invitees for every scheduled event:
+
+  serial    the old sync loop: one requests.get per event, new connection
+            each time, first page only
+  pool-N    CalendlyClient with N workers (keep-alive sessions, pagination,
+            shared rate limiter)
+
+A second, rate-limited fake server checks that the pool still completes
+without errors when it has to back off.
+
+Usage (from backend/):
+  python -m benchmarks.calendly_fetch_bench --events 500 --latency-ms 30
+"""
+import argparse
+import time
+
+import requests
+
+from benchmarks.common import emit, setup_django
+from benchmarks.fake_calendly import start_server
+
+
+def fetch_serial(base_url: str, events: list) -> dict:
+    headers = {"Authorization": "Bearer fake", "Content-Type": "application/json"}
+    invitees = 0
+    for event in events:
+        response = requests.get(f"{event['uri']}/invitees", headers=headers)
+        response.raise_for_status()
+        invitees += len(response.json().get("collection", []))
+    return {"invitees": invitees, "errors": 0}
+
+
+def fetch_pool(base_url: str, events: list, workers: int) -> dict:
+    from lodore.calendly_app.client import CalendlyClient
+
+    client = CalendlyClient(token="fake", base_url=base_url, workers=workers)
+    results = client.invitees_for_events(events)
+    return {
+        "invitees": sum(len(invitees) for _, invitees, _ in results),
+        "errors": sum(1 for _, _, error in results if error is not None),
+        "requests": client.requests_made,
+        "retries": client.retries,
+        "rate_limit_pauses": client.rate_limiter.throttled,
+    }
+
+
+def timed(fn, *args) -> dict:
+    start = time.perf_counter()
+    result = fn(*args)
+    result["wall_s"] = round(time.perf_counter() - start, 3)
+    return result
+
+
+def run(events: int, latency_ms: float, workers: list[int], rate_limit: int) -> dict:
+    from lodore.calendly_app.client import CalendlyClient
+
+    report = {
+        "benchmark": "calendly_fetch",
+        "events": events,
+        "latency_ms": latency_ms,
+        "runs": {},
+    }
+
+    server, app = start_server(events=events, latency_ms=latency_ms, invitees_per_event=3, max_page_size=2)
+    try:
+        listing = CalendlyClient(token="fake", base_url=app.base_url)
+        event_list = listing.scheduled_events(listing.current_user()["uri"])
+        report["runs"]["serial"] = timed(fetch_serial, app.base_url, event_list)
+        for n in workers:
+            report["runs"][f"pool-{n}"] = timed(fetch_pool, app.base_url, event_list, n)
+    finally:
+        server.shutdown()
+
+    if rate_limit:
+        server, app = start_server(
+            events=events, latency_ms=latency_ms, invitees_per_event=3,
+            max_page_size=2, rate_limit=rate_limit, rate_window=1,
+        )
+        try:
+            listing = CalendlyClient(token="fake", base_url=app.base_url)
+            event_list = listing.scheduled_events(listing.current_user()["uri"])
+            n = max(workers)
+            result = timed(fetch_pool, app.base_url, event_list, n)
+            result["server_rejected"] = app.rejected
+            report["runs"][f"pool-{n}-rate-limited-{rate_limit}/s"] = result
+        finally:
+            server.shutdown()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=30.0)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 8, 16])
+    parser.add_argument("--rate-limit", type=int, default=200, help="Requests/s for the rate-limited run, 0 to skip.")
+    parser.add_argument("--out", help="Also write the JSON report to this path.")
+    args = parser.parse_args()
+
+    setup_django()
+    emit(run(args.events, args.latency_ms, args.workers, args.rate_limit), args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Shared helpers for the backend benchmarks.
+
+Run benchmarks from the backend directory as modules, e.g.:
+  python -m benchmarks.search_bench --rows 500000
+
+Benchmarks that need data seed it inside a transaction and roll it back,
+so they can be pointed at a development database without leaving rows
+behind. Results are printed as JSON so runs can be diffed between commits.
+"""
+import json
+import math
+import os
+import sys
+import time
+
+
+def setup_django():
+    """Configure Django the same way manage.py does."""
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if backend_dir not in sys.path:
+        sys.path.insert(0, backend_dir)
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "lodore.settings")
+    import django
+    django.setup()
+
+
+class Rollback(Exception):
+    """Raised at the end of a benchmark to discard its seeded data."""
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of ``samples`` (0 < pct <= 100)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(samples_ms: list[float]) -> dict:
+    """Latency summary in milliseconds."""
+    return {
+        "n": len(samples_ms),
+        "mean_ms": round(sum(samples_ms) / len(samples_ms), 3) if samples_ms else 0.0,
+        "p50_ms": round(percentile(samples_ms, 50), 3),
+        "p95_ms": round(percentile(samples_ms, 95), 3),
+        "p99_ms": round(percentile(samples_ms, 99), 3),
+    }
+
+
+def time_calls(fn, repeat: int, warmup: int = 1) -> list[float]:
+    """Call ``fn`` ``repeat`` times and return per-call wall time in ms."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def emit(report: dict, out: str | None = None):
+    """Print the report as JSON, and write it to ``out`` if given."""
+    text = json.dumps(report, indent=2, ensure_ascii=False, default=str)
+    print(text)
+    if out:
+        with open(out, "w", encoding="utf-8") as fh:
+            fh.write(text + "\n")
@@ -0,0 +1,193 @@
+"""
+Deterministic benchmark dataset: VIPs, invitations, bookings and OTP requests.
+
+Every seeded phone number starts with one of BENCH_PREFIXES, so a dataset
+can be removed again (--flush) without touching other rows; the load
+suite's Excel upload scenario uses the same block. Counts scale
+independently, and the same --seed always produces the same rows.
+
+Usage (from backend/):
+  python -m benchmarks.dataset --vips 200000 --invitations 100000 --bookings 50000 --otps 50000
+  python -m benchmarks.dataset --flush
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.common import emit, setup_django
+
+VIP_PREFIX = "0590"
+INVITED_PREFIX = "0591"
+UPLOAD_PREFIX = "0592"
+BENCH_PREFIXES = (VIP_PREFIX, INVITED_PREFIX, UPLOAD_PREFIX)
+BATCH_SIZE = 10_000
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+FIRST_NAMES = ["محمد", "سارة", "خالد", "فاطمة", "عبدالله", "نورة", "Ahmed", "Sara", "Omar", "Lina"]
+LAST_NAMES = ["العتيبي", "القحطاني", "الشمري", "الدوسري", "Alharbi", "Alzahrani", "Almutairi"]
+DOMAINS = ["gmail.com", "hotmail.com", "outlook.com", "lodore.com"]
+
+
+def vip_phone(n: int) -> str:
+    return f"{VIP_PREFIX}{n:06d}"
+
+
+def invited_phone(n: int) -> str:
+    return f"{INVITED_PREFIX}{n:06d}"
+
+
+def upload_phone(n: int) -> str:
+    return f"{UPLOAD_PREFIX}{n:06d}"
+
+
+def _name(rng) -> str:
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+
+def _bulk(model, objects):
+    batch = []
+    for obj in objects:
+        batch.append(obj)
+        if len(batch) == BATCH_SIZE:
+            model.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    if batch:
+        model.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+def _vips(rng, count):
+    from lodore.auth_app.models import VIPPhone
+
+    for n in range(count):
+        yield VIPPhone(
+            phone=vip_phone(n),
+            full_name=_name(rng),
+            email=f"vip{n}@{rng.choice(DOMAINS)}" if n % 3 else "",
+            # Keep most VIPs unbooked so the OTP scenario has phones to use
+            booked=n % 10 == 0,
+            bookings_count=1 if n % 10 == 0 else 0,
+        )
+
+
+def _invitations(rng, count, vips):
+    from lodore.auth_app.models import InvitedContact
+
+    statuses = [choice for choice, _ in InvitedContact.STATUS_CHOICES]
+    for n in range(count):
+        yield InvitedContact(
+            inviter_phone=vip_phone(rng.randrange(vips)),
+            invited_phone=invited_phone(n),
+            invited_name=_name(rng),
+            approved=n % 4 == 0,
+            status=rng.choice(statuses),
+        )
+
+
+def _bookings(rng, count, vips):
+    from lodore.calendly_app.models import BookingLog
+
+    statuses = [choice for choice, _ in BookingLog.STATUS_CHOICES]
+    for n in range(count):
+        phone = vip_phone(rng.randrange(vips))
+        status = rng.choice(statuses)
+        yield BookingLog(
+            event_type="invitee.canceled" if status == BookingLog.STATUS_CANCELED else "invitee.created",
+            payload={"event": "invitee.created", "payload": {"tracking": {"utm_content": phone}}},
+            phone=phone,
+            guest_name=_name(rng),
+            guest_email=f"guest{n}@{rng.choice(DOMAINS)}",
+            scheduled_at=EPOCH + timedelta(hours=rng.randrange(24 * 365)),
+            status=status,
+            calendly_event_uri=f"https://api.calendly.com/scheduled_events/bench-{n}/invitees/{n}",
+        )
+
+
+def _otps(rng, count, vips):
+    from lodore.auth_app.models import OTPRequest
+
+    statuses = [choice for choice, _ in OTPRequest.STATUS_CHOICES]
+    for n in range(count):
+        yield OTPRequest(
+            phone=vip_phone(rng.randrange(vips)),
+            reference_id=f"BENCH-{n:012d}",
+            status=rng.choice(statuses),
+            attempts_count=rng.randrange(3),
+            expires_at=EPOCH + timedelta(minutes=n),
+        )
+
+
+def seed(vips: int, invitations: int = 0, bookings: int = 0, otps: int = 0, seed: int = 42) -> dict:
+    """Insert the dataset (rows that already exist are left alone)."""
+    from lodore.auth_app import vip_profiles
+    from lodore.auth_app.models import InvitedContact, OTPRequest, VIPPhone
+    from lodore.calendly_app.models import BookingLog
+
+    if vips < 1 and (invitations or bookings or otps):
+        raise ValueError("invitations, bookings and OTP requests reference VIPs; seed at least one")
+    rng = random.Random(seed)
+    timings = {}
+    for label, model, objects in (
+        ("vips", VIPPhone, _vips(rng, vips)),
+        ("invitations", InvitedContact, _invitations(rng, invitations, vips)),
+        ("bookings", BookingLog, _bookings(rng, bookings, vips)),
+        ("otps", OTPRequest, _otps(rng, otps, vips)),
+    ):
+        start = time.perf_counter()
+        _bulk(model, objects)
+        timings[label] = round(time.perf_counter() - start, 3)
+    vip_profiles.clear()
+    return timings
+
+
+def flush() -> dict:
+    """Delete every row in the benchmark phone block."""
+    from django.db.models import Q
+    from lodore.auth_app import vip_profiles
+    from lodore.auth_app.models import InvitedContact, OTPRequest, VIPPhone
+    from lodore.calendly_app.models import BookingLog
+
+    def in_block(field):
+        condition = Q()
+        for prefix in BENCH_PREFIXES:
+            condition |= Q(**{f"{field}__startswith": prefix})
+        return condition
+
+    flushed = {
+        "vips": VIPPhone.objects.filter(in_block("phone")).delete()[0],
+        "invitations": InvitedContact.objects.filter(
+            in_block("inviter_phone") | in_block("invited_phone")
+        ).delete()[0],
+        "bookings": BookingLog.objects.filter(in_block("phone")).delete()[0],
+        "otps": OTPRequest.objects.filter(in_block("phone")).delete()[0],
+    }
+    # After the deletes, so a concurrent /me cannot re-cache a deleted VIP
+    vip_profiles.clear()
+    return flushed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--vips", type=int, default=100_000)
+    parser.add_argument("--invitations", type=int, default=50_000)
+    parser.add_argument("--bookings", type=int, default=50_000)
+    parser.add_argument("--otps", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--flush", action="store_true", help="Delete the benchmark rows instead.")
+    args = parser.parse_args()
+
+    setup_django()
+    if args.flush:
+        emit({"flushed": flush()})
+        return
+    emit({
+        "seeded": {
+            "vips": args.vips, "invitations": args.invitations,
+            "bookings": args.bookings, "otps": args.otps, "seed": args.seed,
+        },
+        "seconds": seed(args.vips, args.invitations, args.bookings, args.otps, args.seed),
+    })
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Database connection mode benchmark.
+
+Starts a gunicorn server per DB_POOL_MODE (off / persistent / pgbouncer)
+and times sequential requests to a staff endpoint over HTTP, so Django's
+per-request connection handling (close_old_connections, health checks)
+is exercised exactly as in production. Reports p50/p95/p99 per mode.
+
+The pgbouncer mode only means something when --pgbouncer-host/--port
+point at a PgBouncer running in transaction pooling mode in front of the
+same database; without them it is skipped.
+
+Usage (from backend/):
+  python -m benchmarks.db_connection_bench --requests 500 --staff-user admin
+  python -m benchmarks.db_connection_bench --pgbouncer-host 127.0.0.1 --pgbouncer-port 6432
+"""
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+from benchmarks.common import emit, setup_django, summarize
+
+PATH = "/api/auth/management/vip/list?page=1&page_size=20"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_ready(url: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(url, timeout=1)
+            return
+        except urllib.error.HTTPError:
+            return  # the server answered
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server at {url} did not start")
+
+
+def _access_token(username: str) -> str:
+    from django.contrib.auth import get_user_model
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    user = get_user_model().objects.get(username=username, is_staff=True)
+    return str(RefreshToken.for_user(user).access_token)
+
+
+def run_mode(mode: str, env_overrides: dict, token: str, requests: int, warmup: int) -> dict:
+    port = _free_port()
+    env = {**os.environ, "DB_POOL_MODE": mode, **env_overrides}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "lodore.wsgi:application",
+         "--bind", f"127.0.0.1:{port}", "--workers", "1", "--log-level", "warning"],
+        env=env,
+    )
+    try:
+        base = f"http://127.0.0.1:{port}"
+        _wait_ready(base + PATH)
+        request = urllib.request.Request(base + PATH, headers={"Authorization": f"Bearer {token}"})
+
+        def call():
+            with urllib.request.urlopen(request) as resp:
+                resp.read()
+
+        for _ in range(warmup):
+            call()
+        samples = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            call()
+            samples.append((time.perf_counter() - start) * 1000)
+        return summarize(samples)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--staff-user", required=True, help="Username of an existing staff user.")
+    parser.add_argument("--pgbouncer-host")
+    parser.add_argument("--pgbouncer-port")
+    parser.add_argument("--out", help="Also write the JSON report to this path.")
+    args = parser.parse_args()
+
+    setup_django()
+    token = _access_token(args.staff_user)
+
+    modes = {"off": {}, "persistent": {}}
+    if args.pgbouncer_host or args.pgbouncer_port:
+        modes["pgbouncer"] = {
+            key: value for key, value in (
+                ("POSTGRES_HOST", args.pgbouncer_host), ("POSTGRES_PORT", args.pgbouncer_port),
+            ) if value
+        }
+
+    report = {"benchmark": "db_connection", "path": PATH, "requests": args.requests, "modes": {}}
+    for mode, env_overrides in modes.items():
+        report["modes"][mode] = run_mode(mode, env_overrides, token, args.requests, args.warmup)
+    emit(report, args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+BookingLog duplicate cleanup benchmark.
+
+Seeds Calendly BookingLog rows with SQL (rolled back at the end), a share
+of which repeat an earlier invitee URI, then times
+``manage.py cleanup_duplicates`` end to end and checks one row per URI is
+left.
+
+Usage (from backend/):
+  python -m benchmarks.dedupe_bench --rows 1000000 --duplicate-ratio 0.1
+"""
+import argparse
+import io
+import time
+
+from benchmarks.common import Rollback, emit, setup_django
+
+
+def seed(rows: int, duplicate_ratio: float):
+    from django.db import connection
+    from lodore.calendly_app.models import BookingLog
+
+    unique = max(1, int(rows * (1 - duplicate_ratio)))
+    with connection.cursor() as cursor:
+        # Rows past ``unique`` reuse the URI of an earlier row; every third
+        # one is canceled so both keep rules are exercised.
+        cursor.execute(
+            f"""
+            INSERT INTO {BookingLog._meta.db_table}
+                (provider, event_type, payload, received_at, phone, guest_name,
+                 guest_email, scheduled_at, status, calendly_event_uri)
+            SELECT 'calendly',
+                   'invitee.created',
+                   jsonb_build_object('n', n, 'note', repeat('x', 200)),
+                   now() - (n || ' seconds')::interval,
+                   '05' || lpad((n %% %(unique)s)::text, 8, '0'),
+                   'Guest ' || n,
+                   'guest' || n || '@example.com',
+                   now() + (n %% 1000 || ' hours')::interval,
+                   CASE WHEN n > %(unique)s AND n %% 3 = 0 THEN 'canceled' ELSE 'scheduled' END,
+                   'https://api.calendly.com/scheduled_events/E/invitees/' || (n %% %(unique)s)
+            FROM generate_series(1, %(rows)s) AS n
+            """,
+            {"rows": rows, "unique": unique},
+        )
+        cursor.execute(f"ANALYZE {BookingLog._meta.db_table}")
+    return unique
+
+
+def run(rows: int, duplicate_ratio: float, batch_size: int) -> dict:
+    from django.core.management import call_command
+    from django.db import transaction
+    from django.db.models import Count
+    from lodore.calendly_app.models import BookingLog
+
+    report = {"benchmark": "dedupe", "rows": rows, "duplicate_ratio": duplicate_ratio}
+    try:
+        with transaction.atomic():
+            start = time.perf_counter()
+            unique = seed(rows, duplicate_ratio)
+            report["seed_s"] = round(time.perf_counter() - start, 3)
+
+            out = io.StringIO()
+            start = time.perf_counter()
+            call_command("cleanup_duplicates", dry_run=True, stdout=out)
+            report["dry_run_s"] = round(time.perf_counter() - start, 3)
+
+            start = time.perf_counter()
+            call_command("cleanup_duplicates", batch_size=batch_size, stdout=out)
+            report["cleanup_s"] = round(time.perf_counter() - start, 3)
+
+            remaining = BookingLog.objects.count()
+            report["rows_remaining"] = remaining
+            report["expected_remaining"] = unique
+            report["max_rows_per_uri"] = (
+                BookingLog.objects.values("calendly_event_uri")
+                .annotate(n=Count("id")).order_by("-n").values_list("n", flat=True).first()
+            )
+            report["output"] = out.getvalue().strip().splitlines()[-1]
+            raise Rollback
+    except Rollback:
+        pass
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.1)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--out", help="Also write the JSON report to this path.")
+    args = parser.parse_args()
+
+    setup_django()
+    emit(run(args.rows, args.duplicate_ratio, args.batch_size), args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""
+Local stand-in for the parts of the Calendly API v2 that the sync uses.
+
+Serves deterministic data with configurable latency, page size and rate
+limit, so the sync client can be exercised and benchmarked without a real
+token:
+
+  GET /users/me
+  GET /scheduled_events?user=&status=&min_start_time=&count=&page_token=
+  GET /scheduled_events/<id>/invitees?count=&page_token=
+
+Responses carry X-RateLimit-Limit / -Remaining / -Reset like the real API,
+and requests over the limit get a 429. ``--fail-requests N`` answers the
+first N requests with ``--fail-status`` (503 by default, optionally with a
+Retry-After header) to exercise the client's retries; the calendly_app
+tests use it the same way.
+
+Usage (from backend/):
+  python -m benchmarks.fake_calendly --port 8765 --events 2000 --latency-ms 30
+  python manage.py sync_calendly --full --base-url http://127.0.0.1:8765
+"""
+import argparse
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+EPOCH = datetime(2026, 1, 1, 9, 0, tzinfo=timezone.utc)
+GUEST_NAMES = ["محمد العتيبي", "سارة القحطاني", "Omar Alharbi", "Lina Alzahrani", "خالد الشمري"]
+
+
+class FakeCalendly:
+    """Dataset and rate-limit state shared by all handler threads."""
+
+    def __init__(self, events=1000, invitees_per_event=2, latency_ms=20.0,
+                 max_page_size=100, rate_limit=0, rate_window=60,
+                 fail_requests=0, fail_status=503, retry_after=None):
+        self.events = events
+        self.invitees_per_event = invitees_per_event
+        self.latency = latency_ms / 1000
+        self.max_page_size = max_page_size
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.fail_requests = fail_requests
+        self.fail_status = fail_status
+        self.retry_after = retry_after
+        self.base_url = ""
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._window_used = 0
+        self.requests = 0
+        self.rejected = 0
+        self.failed = 0
+
+    def take_failure(self):
+        """Count an injected failure; returns its headers, or None to serve normally."""
+        with self._lock:
+            if self.failed >= self.fail_requests:
+                return None
+            self.failed += 1
+            return {} if self.retry_after is None else {"Retry-After": str(self.retry_after)}
+
+    def take(self):
+        """Count a request; returns (allowed, rate-limit headers)."""
+        with self._lock:
+            self.requests += 1
+            if not self.rate_limit:
+                return True, {}
+            now = time.monotonic()
+            if now - self._window_start >= self.rate_window:
+                self._window_start, self._window_used = now, 0
+            reset = max(1, int(self._window_start + self.rate_window - now + 0.999))
+            allowed = self._window_used < self.rate_limit
+            if allowed:
+                self._window_used += 1
+            else:
+                self.rejected += 1
+            headers = {
+                "X-RateLimit-Limit": str(self.rate_limit),
+                "X-RateLimit-Remaining": str(max(0, self.rate_limit - self._window_used)),
+                "X-RateLimit-Reset": str(reset),
+            }
+            return allowed, headers
+
+    def event(self, i):
+        start = EPOCH + timedelta(hours=i)
+        return {
+            "uri": f"{self.base_url}/scheduled_events/EV{i:06d}",
+            "name": "Villa Visit",
+            "status": "active",
+            "start_time": start.strftime("%Y-%m-%dT%H:%M:%S.000000Z"),
+            "end_time": (start + timedelta(minutes=30)).strftime("%Y-%m-%dT%H:%M:%S.000000Z"),
+        }
+
+    def invitee(self, event_index, j):
+        n = event_index * self.invitees_per_event + j
+        return {
+            "uri": f"{self.base_url}/scheduled_events/EV{event_index:06d}/invitees/IN{j:03d}",
+            "name": GUEST_NAMES[n % len(GUEST_NAMES)],
+            "email": f"guest{n}@example.com",
+            "status": "canceled" if n % 10 == 9 else "active",
+            "questions_and_answers": [
+                {"question": "Phone number", "answer": f"05{n % 10**8:08d}"},
+            ],
+            "tracking": {"utm_content": ""},
+        }
+
+    def page(self, path, query, items_total, build):
+        count = min(int(query.get("count", ["20"])[0]), self.max_page_size)
+        offset = int(query.get("page_token", ["0"])[0] or 0)
+        end = min(offset + count, items_total)
+        next_page = None
+        if end < items_total:
+            params = {k: v[0] for k, v in query.items()}
+            params.update(count=count, page_token=end)
+            next_page = f"{self.base_url}{path}?{urlencode(params)}"
+        return {
+            "collection": [build(k) for k in range(offset, end)],
+            "pagination": {
+                "count": end - offset,
+                "next_page": next_page,
+                "next_page_token": str(end) if next_page else None,
+            },
+        }
+
+    def first_event_at_or_after(self, min_start_time):
+        if not min_start_time:
+            return 0
+        moment = datetime.fromisoformat(min_start_time.replace("Z", "+00:00"))
+        hours = (moment - EPOCH).total_seconds() / 3600
+        return min(self.events, max(0, int(hours + 0.999999)))
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so session reuse is measurable
+    # Headers and body are written separately; without this, delayed ACKs
+    # add ~40ms to every keep-alive response
+    disable_nagle_algorithm = True
+    app: FakeCalendly = None
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body, headers=None):
+        raw = json.dumps(body, ensure_ascii=False).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def do_GET(self):
+        app = self.app
+        allowed, headers = app.take()
+        if app.latency:
+            time.sleep(app.latency)
+        if not allowed:
+            self._send(429, {"title": "Too Many Requests"}, headers)
+            return
+        failure = app.take_failure()
+        if failure is not None:
+            self._send(app.fail_status, {"title": "Injected failure"}, {**headers, **failure})
+            return
+
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        parts = [p for p in url.path.split("/") if p]
+
+        if parts == ["users", "me"]:
+            body = {"resource": {"uri": f"{app.base_url}/users/ME", "name": "Lodore", "email": "villa@example.com"}}
+        elif parts == ["scheduled_events"]:
+            first = app.first_event_at_or_after(query.get("min_start_time", [None])[0])
+            body = app.page(url.path, query, app.events - first, lambda k: app.event(first + k))
+        elif len(parts) == 3 and parts[0] == "scheduled_events" and parts[2] == "invitees":
+            index = int(parts[1][2:])
+            body = app.page(url.path, query, app.invitees_per_event, lambda k: app.invitee(index, k))
+        else:
+            self._send(404, {"title": "Resource Not Found"}, headers)
+            return
+        self._send(200, body, headers)
+
+
+def start_server(port=0, **options):
+    """Start a fake Calendly in a daemon thread. Returns (server, app)."""
+    app = FakeCalendly(**options)
+    handler = type("BoundHandler", (Handler,), {"app": app})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    app.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--events", type=int, default=1000)
+    parser.add_argument("--invitees-per-event", type=int, default=2)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--max-page-size", type=int, default=100)
+    parser.add_argument("--rate-limit", type=int, default=0, help="Requests per window, 0 for none.")
+    parser.add_argument("--rate-window", type=int, default=60, help="Rate-limit window in seconds.")
+    parser.add_argument("--fail-requests", type=int, default=0, help="Fail this many requests first.")
+    parser.add_argument("--fail-status", type=int, default=503)
+    parser.add_argument("--retry-after", type=int, default=None, help="Retry-After on injected failures.")
+    args = parser.parse_args()
+
+    server, app = start_server(
+        port=args.port,
+        events=args.events,
+        invitees_per_event=args.invitees_per_event,
+        latency_ms=args.latency_ms,
+        max_page_size=args.max_page_size,
+        rate_limit=args.rate_limit,
+        rate_window=args.rate_window,
+        fail_requests=args.fail_requests,
+        fail_status=args.fail_status,
+        retry_after=args.retry_after,
+    )
+    print(f"Fake Calendly listening on {app.base_url} ({app.events} events)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Local stand-in for the Unifonic SMS endpoint send_otp() posts to.
+
+Answers every POST with Unifonic's success body after a configurable
+latency (or an error for a configurable share of requests), and keeps
+the last message per recipient so a benchmark can read the OTP code
+back and complete the verify step:
+
+  POST /rest/SMS/messages         AppSid, SenderID, Recipient, Body
+  GET  /messages?recipient=<...>  {"body": ..., "code": "123456"}
+
+Point the backend at it with UNIFONIC_SMS_URL and a non-placeholder
+UNIFONIC_APP_SID (so send_otp() leaves mock mode).
+
+Usage (from backend/):
+  python -m benchmarks.fake_unifonic --port 8766 --latency-ms 150
+  UNIFONIC_SMS_URL=http://127.0.0.1:8766/rest/SMS/messages UNIFONIC_APP_SID=bench ...
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+SMS_PATH = "/rest/SMS/messages"
+CODE_RE = re.compile(r"\b(\d{6})\b")
+
+
+def recipient_key(recipient: str) -> str:
+    """Last 9 digits, so +9665…, 9665… and 05… spellings match."""
+    return re.sub(r"\D", "", recipient)[-9:]
+
+
+class FakeUnifonic:
+    """Message store and counters shared by all handler threads."""
+
+    def __init__(self, latency_ms=100.0, error_rate=0.0, seed=7):
+        self.latency = latency_ms / 1000
+        self.error_rate = error_rate
+        self.base_url = ""
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.messages = {}
+        self.sent = 0
+        self.failed = 0
+
+    def send(self, recipient, body):
+        """Record a message; returns False when this request should fail."""
+        with self._lock:
+            if self.error_rate and self._rng.random() < self.error_rate:
+                self.failed += 1
+                return False
+            self.sent += 1
+            self.messages[recipient_key(recipient)] = body
+            return True
+
+    def last_code(self, recipient):
+        with self._lock:
+            body = self.messages.get(recipient_key(recipient), "")
+        match = CODE_RE.search(body)
+        return body, match.group(1) if match else None
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    app: FakeUnifonic = None
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body):
+        raw = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        form = parse_qs(self.rfile.read(length).decode())
+        if urlsplit(self.path).path != SMS_PATH:
+            self._send(404, {"success": False, "message": "Not found"})
+            return
+        if self.app.latency:
+            time.sleep(self.app.latency)
+        recipient = form.get("Recipient", [""])[0]
+        if not self.app.send(recipient, form.get("Body", [""])[0]):
+            self._send(200, {"success": False, "message": "Insufficient balance", "errorCode": "ER-20"})
+            return
+        self._send(200, {
+            "success": True,
+            "message": "",
+            "errorCode": "ER-00",
+            "data": {"MessageID": uuid.uuid4().hex, "Status": "Queued", "Recipient": recipient},
+        })
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path != "/messages":
+            self._send(404, {"success": False, "message": "Not found"})
+            return
+        recipient = parse_qs(url.query).get("recipient", [""])[0]
+        body, code = self.app.last_code(recipient)
+        self._send(200 if code else 404, {"body": body, "code": code})
+
+
+def start_server(port=0, **options):
+    """Start a fake Unifonic in a daemon thread. Returns (server, app)."""
+    app = FakeUnifonic(**options)
+    handler = type("BoundHandler", (Handler,), {"app": app})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    app.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--latency-ms", type=float, default=100.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of sends that fail (0-1).")
+    args = parser.parse_args()
+
+    server, app = start_server(port=args.port, latency_ms=args.latency_ms, error_rate=args.error_rate)
+    print(f"Fake Unifonic listening on {app.base_url}{SMS_PATH}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
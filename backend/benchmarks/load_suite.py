@@ -0,0 +1,350 @@
+"""
+End-to-end load suite: scripted scenarios against a local gunicorn.
+
+Runs entirely offline. Unifonic is replaced by benchmarks/fake_unifonic.py
+and Calendly webhooks are replayed from benchmarks/payloads/. Seed the
+dataset first (benchmarks/dataset.py); the scenarios use its phone block:
+
+  otp_request    burst of POST /api/auth/request-otp for distinct unbooked VIPs
+  otp_verify     POST /api/auth/verify-otp with the codes the stub received
+  webhook_flood  recorded Calendly payloads posted to /api/calendly/webhook
+  dashboard      staff dashboard polling
+  lists          VIP / reservation / nomination lists, with and without search
+  export         nominations export of a fixed id set
+  upload         Excel VIP upload of generated rows
+
+Each scenario reports throughput and p50/p95/p99 latency plus status
+code counts as JSON, so runs can be diffed between commits. Scenarios
+change data (OTP requests, bookings, uploaded VIPs) inside the benchmark
+block only; `python -m benchmarks.dataset --flush` removes it all.
+
+Usage (from backend/):
+  python -m benchmarks.dataset --vips 100000 --invitations 50000 --bookings 50000 --otps 50000
+  python -m benchmarks.load_suite --staff-user admin --requests 500 --concurrency 8
+  python -m benchmarks.load_suite --staff-user admin --scenarios dashboard lists --out run.json
+"""
+import argparse
+import io
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from urllib.parse import quote, urlencode
+
+from benchmarks import dataset
+from benchmarks.common import emit, setup_django, summarize
+from benchmarks.fake_unifonic import SMS_PATH, start_server as start_unifonic
+
+SCENARIOS = ("otp_request", "otp_verify", "webhook_flood", "dashboard", "lists", "export", "upload")
+PAYLOADS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "payloads", "calendly_webhooks.json")
+WEBHOOK_SECRET = "bench-webhook-secret"
+
+
+class Client:
+    """Minimal urllib client (one connection per request); returns (status, body bytes)."""
+
+    def __init__(self, base_url, token=None):
+        self.base_url = base_url
+        self.headers = {"Authorization": f"Bearer {token}"} if token else {}
+
+    def request(self, method, path, body=None, headers=None, content_type="application/json"):
+        data = body
+        if body is not None and not isinstance(body, bytes):
+            data = json.dumps(body).encode()
+        request = urllib.request.Request(self.base_url + path, data=data, method=method)
+        for name, value in {**self.headers, **(headers or {})}.items():
+            request.add_header(name, value)
+        if data is not None:
+            request.add_header("Content-Type", content_type)
+        try:
+            with urllib.request.urlopen(request, timeout=120) as resp:
+                return resp.status, resp.read()
+        except urllib.error.HTTPError as exc:
+            return exc.code, exc.read()
+
+
+def run_calls(calls, concurrency) -> dict:
+    """Run ``calls`` (each returning an HTTP status) and summarize them."""
+
+    def timed(call):
+        start = time.perf_counter()
+        status = call()
+        return (time.perf_counter() - start) * 1000, status
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(timed, calls))
+    wall = time.perf_counter() - start
+    return {
+        **summarize([ms for ms, _ in results]),
+        "wall_s": round(wall, 3),
+        "throughput_rps": round(len(results) / wall, 1) if wall else 0.0,
+        "statuses": dict(Counter(str(status) for _, status in results)),
+    }
+
+
+# --------------------------------------------------------------- scenarios
+
+
+def otp_phones(vips, count, run_id):
+    """Unbooked VIPs (dataset books every 10th), rotated per run to dodge the resend cooldown."""
+    candidates = [n for n in range(vips // 2) if n % 10]
+    offset = (run_id * count) % max(1, len(candidates))
+    return [dataset.vip_phone(candidates[(offset + i) % len(candidates)]) for i in range(count)]
+
+
+def scenario_otp(ctx):
+    client, stub = ctx["anon"], ctx["unifonic"]
+    phones = otp_phones(ctx["vips"], ctx["requests"], ctx["run_id"])
+    reference_ids = {}
+
+    def request_otp(phone):
+        def call():
+            status, body = client.request("POST", "/api/auth/request-otp", {"phone": phone})
+            if status == 200:
+                reference_ids[phone] = json.loads(body).get("requestId")
+            return status
+        return call
+
+    def verify_otp(phone):
+        def call():
+            _, code = stub.last_code(phone)
+            status, _ = client.request("POST", "/api/auth/verify-otp", {
+                "phone": phone, "requestId": reference_ids[phone], "code": code,
+            })
+            return status
+        return call
+
+    report = {"otp_request": run_calls([request_otp(p) for p in phones], ctx["concurrency"])}
+    if "otp_verify" in ctx["scenarios"]:
+        verifiable = [p for p in phones if p in reference_ids]
+        report["otp_verify"] = run_calls([verify_otp(p) for p in verifiable], ctx["concurrency"])
+    return report
+
+
+def webhook_bodies(count, vips):
+    with open(PAYLOADS, encoding="utf-8") as fh:
+        templates = [json.dumps(payload, ensure_ascii=False) for payload in json.load(fh)]
+    start = datetime(2026, 6, 1, 9, 0, tzinfo=timezone.utc)
+    for i in range(count):
+        # Upper half of the VIP block, away from the OTP phones
+        n = vips - 1 - (i // len(templates)) % max(1, vips // 2)
+        event_start = start + timedelta(hours=i)
+        values = {
+            "phone": dataset.vip_phone(n),
+            "name": f"ضيف {n}",
+            "email": f"vip{n}@example.com",
+            "uuid": f"BENCH{n:07d}",
+            "invitee_uuid": uuid.uuid4().hex[:16].upper(),
+            "start_time": event_start.strftime("%Y-%m-%dT%H:%M:%S.000000Z"),
+            "end_time": (event_start + timedelta(minutes=45)).strftime("%Y-%m-%dT%H:%M:%S.000000Z"),
+        }
+        body = templates[i % len(templates)]
+        for key, value in values.items():
+            body = body.replace("{{%s}}" % key, value)
+        yield body.encode()
+
+
+def scenario_webhook_flood(ctx):
+    client = ctx["anon"]
+
+    def post(body):
+        return lambda: client.request(
+            "POST", "/api/calendly/webhook", body, headers={"X-Webhook-Secret": WEBHOOK_SECRET}
+        )[0]
+
+    return {"webhook_flood": run_calls(
+        [post(body) for body in webhook_bodies(ctx["requests"], ctx["vips"])], ctx["concurrency"]
+    )}
+
+
+def scenario_dashboard(ctx):
+    client = ctx["staff"]
+
+    def call():
+        return client.request("GET", "/api/auth/management/dashboard/stats")[0]
+
+    return {"dashboard": run_calls([call] * ctx["requests"], ctx["concurrency"])}
+
+
+LIST_PATHS = (
+    "/api/auth/management/vip/list?page_size=20",
+    "/api/auth/management/vip/list?page_size=20&search=" + quote("محمد"),
+    "/api/auth/management/vip/list?page_size=20&search=0590001",
+    "/api/auth/management/reservations?page_size=20",
+    "/api/auth/management/reservations?page_size=20&search=gmail",
+    "/api/auth/management/nominations?page_size=20",
+    "/api/auth/management/nominations?page_size=20&status=pending&search=" + quote("سارة"),
+)
+
+
+def scenario_lists(ctx):
+    client = ctx["staff"]
+    calls = [
+        (lambda path=LIST_PATHS[i % len(LIST_PATHS)]: client.request("GET", path)[0])
+        for i in range(ctx["requests"])
+    ]
+    return {"lists": run_calls(calls, ctx["concurrency"])}
+
+
+def scenario_export(ctx):
+    from lodore.auth_app.models import InvitedContact
+
+    ids = list(
+        InvitedContact.objects.filter(invited_phone__startswith=dataset.INVITED_PREFIX)
+        .order_by("id").values_list("id", flat=True)[:ctx["export_rows"]]
+    )
+    path = "/api/auth/management/nominations/export?" + urlencode({"ids": ",".join(map(str, ids))})
+    client = ctx["staff"]
+    # Exports are heavy; a tenth of the request count is plenty
+    calls = [lambda: client.request("GET", path)[0]] * max(1, ctx["requests"] // 10)
+    return {"export": {**run_calls(calls, ctx["concurrency"]), "rows": len(ids)}}
+
+
+def upload_workbook(rows) -> bytes:
+    import openpyxl
+
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(["Phone", "Name", "Email"])
+    for n in range(rows):
+        sheet.append([dataset.upload_phone(n), f"عميل {n}", f"upload{n}@example.com"])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def scenario_upload(ctx):
+    boundary = uuid.uuid4().hex
+    body = (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="vips.xlsx"\r\n'
+        "Content-Type: application/vnd.openxmlformats-officedocument.spreadsheetml.sheet\r\n\r\n"
+    ).encode() + upload_workbook(ctx["upload_rows"]) + f"\r\n--{boundary}--\r\n".encode()
+    client = ctx["staff"]
+
+    def call():
+        return client.request(
+            "POST", "/api/auth/management/vip/upload", body,
+            content_type=f"multipart/form-data; boundary={boundary}",
+        )[0]
+
+    calls = [call] * max(1, ctx["requests"] // 50)
+    # Sequential: concurrent uploads of the same rows would only measure row locks
+    return {"upload": {**run_calls(calls, 1), "rows": ctx["upload_rows"]}}
+
+
+# ------------------------------------------------------------------ server
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_backend(port, workers, unifonic_url):
+    env = {
+        **os.environ,
+        "UNIFONIC_SMS_URL": unifonic_url,
+        "UNIFONIC_APP_SID": "bench-app-sid",
+        "CALENDLY_WEBHOOK_SECRET": WEBHOOK_SECRET,
+        "THROTTLE_RATE_USER": "1000000/day",
+        "THROTTLE_RATE_ANON": "1000000/day",
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "lodore.wsgi:application",
+         "--bind", f"127.0.0.1:{port}", "--workers", str(workers), "--log-level", "warning"],
+        env=env, stdout=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(base_url + "/api/auth/me", timeout=1)
+            break
+        except urllib.error.HTTPError:
+            break  # answered
+        except OSError:
+            time.sleep(0.2)
+    else:
+        server.terminate()
+        raise RuntimeError("backend did not start")
+    return server, base_url
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--staff-user", required=True, help="Username of an existing staff user.")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--requests", type=int, default=200, help="Requests per scenario.")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--server-workers", type=int, default=2)
+    parser.add_argument("--unifonic-latency-ms", type=float, default=100.0)
+    parser.add_argument("--export-rows", type=int, default=500)
+    parser.add_argument("--upload-rows", type=int, default=1000)
+    parser.add_argument("--out", help="Also write the JSON report to this path.")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.contrib.auth import get_user_model
+    from lodore.auth_app.models import VIPPhone
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    vips = VIPPhone.objects.filter(phone__startswith=dataset.VIP_PREFIX).count()
+    if not vips:
+        parser.error("no benchmark dataset; run `python -m benchmarks.dataset` first")
+    staff = get_user_model().objects.get(username=args.staff_user, is_staff=True)
+    token = str(RefreshToken.for_user(staff).access_token)
+
+    stub_server, stub = start_unifonic(latency_ms=args.unifonic_latency_ms)
+    backend, base_url = start_backend(_free_port(), args.server_workers, stub.base_url + SMS_PATH)
+    ctx = {
+        "anon": Client(base_url),
+        "staff": Client(base_url, token),
+        "unifonic": stub,
+        "vips": vips,
+        "run_id": int(time.time()) // 60,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "export_rows": args.export_rows,
+        "upload_rows": args.upload_rows,
+        "scenarios": set(args.scenarios),
+    }
+    report = {
+        "benchmark": "load_suite",
+        "dataset_vips": vips,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "server_workers": args.server_workers,
+        "scenarios": {},
+    }
+    runners = (
+        ({"otp_request", "otp_verify"}, scenario_otp),
+        ({"webhook_flood"}, scenario_webhook_flood),
+        ({"dashboard"}, scenario_dashboard),
+        ({"lists"}, scenario_lists),
+        ({"export"}, scenario_export),
+        ({"upload"}, scenario_upload),
+    )
+    try:
+        for names, runner in runners:
+            if names & ctx["scenarios"]:
+                report["scenarios"].update(runner(ctx))
+    finally:
+        backend.terminate()
+        backend.wait(timeout=30)
+        stub_server.shutdown()
+    emit(report, args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+VIP row normalization scaling benchmark.
+
+Runs auth_app.vip_rows.normalize_vip_rows over synthetic CSV rows through
+toolkit.pipeline.parallel_map with 1..N worker processes and reports
+rows/s and the speedup over the inline (workers=1) run. No database is
+involved: this isolates the CPU stage the import commands parallelize.
+
+Usage (from backend/):
+  python -m benchmarks.normalize_bench --rows 1000000 --workers 1 2 4 8
+"""
+import argparse
+import logging
+import os
+import random
+import time
+
+from benchmarks.common import emit
+
+FORMATS = ("05{}", "5{}", "9665{}", "+966 5{}", "(05) {}", "05-{}")
+
+
+def make_rows(count: int, seed: int = 7) -> list:
+    """``(row_num, raw_phone, full_name)`` tuples in the mix of formats seen in exports."""
+    rng = random.Random(seed)
+    rows = []
+    for row_num in range(2, count + 2):
+        digits = f"{rng.randrange(10 ** 8):08d}"
+        if rng.random() < 0.01:
+            raw = f"12ab{digits}"
+        else:
+            raw = rng.choice(FORMATS).format(digits)
+        rows.append((row_num, raw, f"  عميل {row_num}  " if rng.random() < 0.7 else ""))
+    return rows
+
+
+def run(rows: int, workers: list[int], chunk_size: int) -> dict:
+    from lodore.auth_app.vip_rows import normalize_vip_rows
+    from lodore.toolkit.pipeline import parallel_map
+    from lodore.toolkit.streaming import chunked
+
+    # Invalid phones log a warning each; keep them out of the timing
+    logging.getLogger("lodore").disabled = True
+
+    data = make_rows(rows)
+    report = {
+        "benchmark": "normalize",
+        "rows": rows,
+        "chunk_size": chunk_size,
+        "cpu_count": os.cpu_count(),
+        "runs": {},
+    }
+    baseline = None
+    for n in workers:
+        start = time.perf_counter()
+        valid = 0
+        for chunk_valid, _, _ in parallel_map(normalize_vip_rows, chunked(data, chunk_size), workers=n):
+            valid += len(chunk_valid)
+        wall = time.perf_counter() - start
+        baseline = baseline or wall
+        report["runs"][f"workers-{n}"] = {
+            "wall_s": round(wall, 3),
+            "rows_per_s": round(rows / wall),
+            "speedup": round(baseline / wall, 2),
+            "valid": valid,
+        }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--out", help="Also write the JSON report to this path.")
+    args = parser.parse_args()
+
+    emit(run(args.rows, sorted(set(args.workers)), args.chunk_size), args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+JSON rendering cost for the hot endpoints' response bodies.
+
+Renders management list pages (VIPs, reservations, nominations; rows
+shaped like serialize_rows output, with Arabic names and ISO dates) at
+several page sizes, plus the constant OTP error body, with:
+
+  drf          rest_framework.renderers.JSONRenderer (the default)
+  fast         lodore.renderers.FastJSONRenderer (orjson when installed)
+  fast_stdlib  FastJSONRenderer's stdlib fallback encoder
+
+and times content negotiation for a browser-style Accept header with
+DRF's DefaultContentNegotiation and JSONOnlyNegotiation. No database is
+involved.
+
+Usage (from backend/):
+  python -m benchmarks.render_bench --page-sizes 20 50 100 --repeat 2000
+"""
+import argparse
+import random
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.common import emit, setup_django, summarize, time_calls
+
+FIRST_NAMES = ["محمد", "سارة", "خالد", "فاطمة", "عبدالله", "نورة", "Ahmed", "Sara"]
+LAST_NAMES = ["العتيبي", "القحطاني", "الشمري", "الدوسري", "Alharbi", "Almutairi"]
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _when(rng) -> str:
+    return (EPOCH + timedelta(seconds=rng.randrange(365 * 86400), microseconds=rng.randrange(10 ** 6))).isoformat()
+
+
+def _name(rng) -> str:
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+
+def _phone(rng) -> str:
+    return f"05{rng.randrange(10 ** 8):08d}"
+
+
+def _vip(rng, n):
+    return {
+        "id": n, "full_name": _name(rng), "phone": _phone(rng), "email": f"vip{n}@example.com",
+        "booked": n % 10 == 0, "bookings_count": int(n % 10 == 0), "created_at": _when(rng),
+    }
+
+
+def _reservation(rng, n):
+    return {
+        "id": n, "guest_name": _name(rng), "phone": _phone(rng), "guest_email": f"guest{n}@example.com",
+        "scheduled_at": _when(rng), "status": rng.choice(["scheduled", "canceled"]),
+        "event_type": "invitee.created", "received_at": _when(rng),
+    }
+
+
+def _nomination(rng, n):
+    return {
+        "id": n, "invited_name": _name(rng), "invited_phone": _phone(rng), "inviter_phone": _phone(rng),
+        "inviter_name": _name(rng), "status": "pending", "approved": False, "created_at": _when(rng),
+    }
+
+
+def _page(rows):
+    return {
+        "ok": True, "results": rows, "count": 48_213, "count_exact": False,
+        "page": 3, "total_pages": 2411, "has_next": True, "has_previous": True,
+    }
+
+
+def run(page_sizes: list[int], repeat: int) -> dict:
+    from django.test import RequestFactory
+    from rest_framework.negotiation import DefaultContentNegotiation
+    from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
+    from rest_framework.request import Request
+
+    from lodore import renderers
+    from lodore.auth_app.views import _GENERIC_DENIED
+
+    drf, fast = JSONRenderer(), renderers.FastJSONRenderer()
+    stdlib = renderers._encoder.encode
+    rng = random.Random(7)
+    bodies = {
+        f"{kind}_page_{size}": _page([make(rng, n) for n in range(size)])
+        for kind, make in (("vips", _vip), ("reservations", _reservation), ("nominations", _nomination))
+        for size in page_sizes
+    }
+
+    report = {
+        "benchmark": "render",
+        "orjson": renderers.orjson is not None,
+        "repeat": repeat,
+        "bodies": {},
+    }
+    for label, body in bodies.items():
+        assert fast.render(body) == drf.render(body)
+        runs = {
+            "drf": summarize(time_calls(lambda: drf.render(body), repeat)),
+            "fast": summarize(time_calls(lambda: fast.render(body), repeat)),
+            "fast_stdlib": summarize(time_calls(lambda: stdlib(body).encode(), repeat)),
+        }
+        report["bodies"][label] = {
+            "bytes": len(drf.render(body)),
+            **runs,
+            "speedup": round(runs["drf"]["mean_ms"] / runs["fast"]["mean_ms"], 2),
+        }
+
+    constant = _GENERIC_DENIED.data
+    report["bodies"]["otp_generic_denied"] = {
+        "bytes": len(_GENERIC_DENIED.content),
+        "drf": summarize(time_calls(lambda: drf.render(constant), repeat)),
+        "fast": summarize(time_calls(lambda: fast.render(_GENERIC_DENIED), repeat)),
+    }
+
+    request = Request(RequestFactory().get(
+        "/api/auth/me", HTTP_ACCEPT="text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
+    ))
+    default_choices = [JSONRenderer(), BrowsableAPIRenderer()]
+    report["negotiation"] = {
+        "drf_default": summarize(time_calls(
+            lambda: DefaultContentNegotiation().select_renderer(request, default_choices), repeat
+        )),
+        "json_only": summarize(time_calls(
+            lambda: renderers.JSONOnlyNegotiation().select_renderer(request, [fast]), repeat
+        )),
+    }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[20, 50, 100])
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--out", help="Also write the JSON report to this path.")
+    args = parser.parse_args()
+
+    setup_django()
+    emit(run(args.page_sizes, args.repeat), args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Staff search benchmark: trigram-indexed search vs. the old icontains scan.
+
+Seeds VIPPhone rows inside a transaction (rolled back at the end), then
+times the first page of the VIP list for typical search-box queries:
+
+  baseline  old OR-ed icontains predicate with bitmap scans disabled, which
+            is how it ran before the pg_trgm GIN indexes existed
+  indexed   lodore.auth_app.search predicate with the GIN/pattern indexes
+
+Usage (from backend/):
+  python -m benchmarks.search_bench --rows 500000 --repeat 20
+"""
+import argparse
+import random
+
+from benchmarks.common import Rollback, emit, setup_django, summarize, time_calls
+
+QUERIES = {
+    "name_fragment": "محم",
+    "latin_name": "ahmed",
+    "email_fragment": "gmail",
+    "phone_prefix": "0551",
+    "phone_intl_prefix": "+96655",
+    "phone_tail": "4567",
+}
+
+FIRST_NAMES = ["محمد", "سارة", "خالد", "فاطمة", "عبدالله", "نورة", "Ahmed", "Sara", "Omar", "Lina"]
+LAST_NAMES = ["العتيبي", "القحطاني", "الشمري", "الدوسري", "Alharbi", "Alzahrani", "Almutairi"]
+DOMAINS = ["gmail.com", "hotmail.com", "outlook.com", "lodore.com"]
+
+
+def seed_vips(rows: int, seed: int = 42):
+    from lodore.auth_app.models import VIPPhone
+
+    rng = random.Random(seed)
+    numbers = rng.sample(range(10**8), rows)
+    batch = []
+    for i, number in enumerate(numbers):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        batch.append(VIPPhone(
+            phone=f"05{number:08d}",
+            full_name=f"{first} {last}",
+            email=f"user{i}@{rng.choice(DOMAINS)}" if i % 3 else "",
+        ))
+        if len(batch) == 10_000:
+            VIPPhone.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    if batch:
+        VIPPhone.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+def run(rows: int, repeat: int) -> dict:
+    from django.db import connection, transaction
+    from django.db.models import Q
+    from lodore.auth_app.models import VIPPhone
+    from lodore.auth_app.search import search_filter
+
+    ordering = ("-created_at", "id")
+    fields = ("id", "full_name", "phone", "email", "booked", "bookings_count", "created_at")
+    report = {"benchmark": "search", "rows": rows, "repeat": repeat, "queries": {}}
+
+    try:
+        with transaction.atomic():
+            seed_vips(rows)
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE auth_app_vipphone")
+
+            for label, query in QUERIES.items():
+                old = VIPPhone.objects.filter(
+                    Q(full_name__icontains=query) | Q(phone__icontains=query) | Q(email__icontains=query)
+                ).order_by(*ordering).values(*fields)
+                new = VIPPhone.objects.filter(
+                    search_filter(query, ("full_name", "email"), ("phone",))
+                ).order_by(*ordering).values(*fields)
+
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL enable_bitmapscan = off")
+                baseline = time_calls(lambda: (list(old[:20]), old.count()), repeat)
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL enable_bitmapscan = on")
+                indexed = time_calls(lambda: (list(new[:20]), new.count()), repeat)
+
+                report["queries"][label] = {
+                    "query": query,
+                    "matches": new.count(),
+                    "baseline": summarize(baseline),
+                    "indexed": summarize(indexed),
+                    "plan": new.explain().splitlines()[0],
+                }
+            raise Rollback
+    except Rollback:
+        pass
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--out", help="Also write the JSON report to this path.")
+    args = parser.parse_args()
+
+    setup_django()
+    emit(run(args.rows, args.repeat), args.out)
+
+
+if __name__ == "__main__":
+    main()
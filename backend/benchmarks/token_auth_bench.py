@@ -0,0 +1,75 @@
+"""
+VIP token authentication cost per request.
+
+Times PhoneJWTAuthentication.authenticate on a bare request for a set of
+distinct access tokens, the way the SPA reuses one token for many calls:
+
+  uncached  PHONE_TOKEN_CACHE_SIZE=0, every call decodes and verifies
+  cached    each token verified once, later calls served from the LRU
+  churn     more live tokens than cache slots (--cache-size), so the
+            cache is evicting; reports the hit rate it settles at
+
+No database is involved.
+
+Usage (from backend/):
+  python -m benchmarks.token_auth_bench --tokens 500 --repeat 20000
+"""
+import argparse
+import random
+
+from benchmarks.common import emit, setup_django, summarize, time_calls
+
+
+def _cache_hits() -> float:
+    from prometheus_client import REGISTRY
+
+    return REGISTRY.get_sample_value("lodore_phone_token_cache_lookups_total", {"result": "hit"}) or 0.0
+
+
+def run(tokens: int, repeat: int, cache_size: int) -> dict:
+    from django.test import RequestFactory, override_settings
+    from lodore.auth_app import authentication
+    from lodore.auth_app.jwt_backend import get_tokens_for_phone
+
+    auth = authentication.PhoneJWTAuthentication()
+    factory = RequestFactory()
+    requests = [
+        factory.get("/api/auth/me", HTTP_AUTHORIZATION=f"Bearer {get_tokens_for_phone(f'05{n:08d}')['access']}")
+        for n in range(tokens)
+    ]
+    rng = random.Random(7)
+
+    def one_call():
+        auth.authenticate(rng.choice(requests))
+
+    report = {"benchmark": "token_auth", "tokens": tokens, "repeat": repeat, "runs": {}}
+    for label, size in (("uncached", 0), ("cached", max(tokens, 1)), ("churn", cache_size)):
+        authentication._verified_tokens.clear()
+        hits_before = _cache_hits()
+        with override_settings(PHONE_TOKEN_CACHE_SIZE=size):
+            samples = time_calls(one_call, repeat, warmup=0)
+        report["runs"][label] = {
+            "cache_size": size,
+            **summarize(samples),
+            "hit_rate": round((_cache_hits() - hits_before) / repeat, 3),
+        }
+    uncached = report["runs"]["uncached"]["mean_ms"]
+    cached = report["runs"]["cached"]["mean_ms"]
+    report["speedup"] = round(uncached / cached, 1) if cached else None
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tokens", type=int, default=500, help="Distinct live access tokens.")
+    parser.add_argument("--repeat", type=int, default=20_000)
+    parser.add_argument("--cache-size", type=int, default=250, help="LRU size for the churn run.")
+    parser.add_argument("--out", help="Also write the JSON report to this path.")
+    args = parser.parse_args()
+
+    setup_django()
+    emit(run(args.tokens, args.repeat, args.cache_size), args.out)
+
+
+if __name__ == "__main__":
+    main()
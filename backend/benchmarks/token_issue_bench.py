@@ -0,0 +1,82 @@
+"""
+JWT issuance throughput: token pairs per second.
+
+Compares jwt_backend's TokenIssuer with minting the same pair through
+simplejwt's Token classes: build a RefreshToken, add the claims, derive
+the access token and serialize both. Runs the VIP pair, the staff pair
+and a refresh-token exchange. No database is involved.
+
+Usage (from backend/):
+  python -m benchmarks.token_issue_bench --repeat 20000
+"""
+import argparse
+import time
+
+from benchmarks.common import emit, setup_django
+
+
+def _simplejwt_pair(claims: dict) -> dict:
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    refresh = RefreshToken()
+    for claim, value in claims.items():
+        refresh[claim] = value
+    return {"access": str(refresh.access_token), "refresh": str(refresh)}
+
+
+def _simplejwt_refresh(raw_refresh: str) -> dict:
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    refresh = RefreshToken(raw_refresh)
+    access = str(refresh.access_token)
+    refresh.set_jti()
+    refresh.set_exp()
+    refresh.set_iat()
+    return {"access": access, "refresh": str(refresh)}
+
+
+def _rate(fn, repeat: int) -> dict:
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    wall = time.perf_counter() - start
+    return {"per_s": round(repeat / wall), "us_per_call": round(wall / repeat * 1e6, 2)}
+
+
+def run(repeat: int) -> dict:
+    from lodore.auth_app.jwt_backend import PHONE_CLAIM, STAFF_CLAIM, token_issuer
+
+    issuer = token_issuer()
+    phone = {"user_id": "0512345678", PHONE_CLAIM: "0512345678"}
+    staff = {"user_id": 1, STAFF_CLAIM: {"username": "bench", "superuser": False}}
+    raw_refresh = issuer.pair(phone)["refresh"]
+
+    cases = {
+        "phone_pair": (lambda: _simplejwt_pair(phone), lambda: issuer.pair(phone)),
+        "staff_pair": (lambda: _simplejwt_pair(staff), lambda: issuer.pair(staff)),
+        "refresh": (lambda: _simplejwt_refresh(raw_refresh), lambda: issuer.refresh(raw_refresh)),
+    }
+    report = {"benchmark": "token_issue", "repeat": repeat, "runs": {}}
+    for label, (baseline, current) in cases.items():
+        before, after = _rate(baseline, repeat), _rate(current, repeat)
+        report["runs"][label] = {
+            "simplejwt": before,
+            "issuer": after,
+            "speedup": round(after["per_s"] / before["per_s"], 2),
+        }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20_000)
+    parser.add_argument("--out", help="Also write the JSON report to this path.")
+    args = parser.parse_args()
+
+    setup_django()
+    emit(run(args.repeat), args.out)
+
+
+if __name__ == "__main__":
+    main()
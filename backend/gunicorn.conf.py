@@ -0,0 +1,23 @@
+"""
+gunicorn settings picked up automatically from the working directory.
+
+Only the Prometheus multiprocess housekeeping lives here (see
+lodore/metrics.py); bind address and worker count stay on the command line.
+"""
+import os
+import shutil
+
+
+def on_starting(server):
+    # Values left by a previous run would be merged into the new one
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if path:
+        shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server, worker):
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
@@ -1,4 +1,5 @@
 from django.contrib import admin
+from . import vip_profiles
 from .models import VIPPhone, OTPRequest, InvitedContact
 
 # Disable timezone selector in admin interface
@@ -12,6 +13,20 @@ class VIPPhoneAdmin(admin.ModelAdmin):
     search_fields = ("phone", "full_name", "email")
     readonly_fields = ("created_at",)
 
+    def save_model(self, request, obj, form, change):
+        old_phone = form.initial.get("phone")
+        super().save_model(request, obj, form, change)
+        vip_profiles.refresh([obj.phone, old_phone])
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        vip_profiles.refresh([obj.phone])
+
+    def delete_queryset(self, request, queryset):
+        phones = list(queryset.values_list("phone", flat=True))
+        super().delete_queryset(request, queryset)
+        vip_profiles.refresh(phones)
+
 
 @admin.register(OTPRequest)
 class OTPRequestAdmin(admin.ModelAdmin):
@@ -45,5 +60,6 @@ class InvitedContactAdmin(admin.ModelAdmin):
             )
             if created:
                 added += 1
+                vip_profiles.refresh([invitation.invited_phone])
         self.message_user(request, f"{added} contact(s) added to VIP list.")
     add_to_vip_list.short_description = "Add approved to VIP list"
@@ -1,14 +1,31 @@
 """
 Custom JWT authentication that does NOT require a Django User object.
-Instead, the phone number is stored directly in the JWT payload.
+
+  PhoneJWTAuthentication  VIP endpoints: the phone number is stored
+                          directly in the JWT payload; verified tokens are
+                          kept in a small per-process LRU until they expire
+  StaffJWTAuthentication  management endpoints: staff flags are stored in
+                          the JWT payload; the User row is only re-read every
+                          STAFF_AUTH_RECHECK_SECONDS, to pick up revocations
 """
+import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import AccessToken
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from lodore.metrics import observe_token_cache
 from .models import VIPPhone
-from .jwt_backend import PHONE_CLAIM
+from .jwt_backend import PHONE_CLAIM, STAFF_CLAIM
 
 logger = logging.getLogger("lodore")
 
@@ -26,6 +43,55 @@ class _PhonePrincipal:
         return self.phone
 
 
+class _VerifiedTokenCache:
+    """
+    Bounded LRU of access tokens that already passed verification.
+
+    Keyed by the SHA-256 of the raw token, so the token itself is not
+    held; each entry is dropped once the token's ``exp`` has passed. Only
+    successfully verified tokens are stored. The size is read from
+    PHONE_TOKEN_CACHE_SIZE on every store (0 disables the cache).
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, raw_token: str):
+        """Return the cached token for ``raw_token``, or None."""
+        key = hashlib.sha256(raw_token.encode()).digest()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, raw_token: str, token):
+        maxsize = settings.PHONE_TOKEN_CACHE_SIZE
+        if maxsize <= 0:
+            return
+        key = hashlib.sha256(raw_token.encode()).digest()
+        with self._lock:
+            self._entries[key] = (token["exp"], token)
+            self._entries.move_to_end(key)
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_verified_tokens = _VerifiedTokenCache()
+
+
 class PhoneJWTAuthentication(BaseAuthentication):
     """
     Authenticate using a JWT that contains a 'phone' claim.
@@ -38,17 +104,87 @@ class PhoneJWTAuthentication(BaseAuthentication):
             return None
 
         raw_token = header.split(" ", 1)[1]
-        try:
-            token = AccessToken(raw_token)
-        except (InvalidToken, TokenError) as exc:
-            logger.warning("Invalid JWT: %s", exc)
-            raise AuthenticationFailed("Invalid or expired token.") from exc
+        token = _verified_tokens.get(raw_token)
+        observe_token_cache(token is not None)
+        if token is None:
+            try:
+                token = AccessToken(raw_token)
+            except (InvalidToken, TokenError) as exc:
+                logger.warning("Invalid JWT: %s", exc)
+                raise AuthenticationFailed("Invalid or expired token.") from exc
 
-        phone = token.get(PHONE_CLAIM)
-        if not phone:
-            raise AuthenticationFailed("Token missing phone claim.")
+            if not token.get(PHONE_CLAIM):
+                raise AuthenticationFailed("Token missing phone claim.")
+            _verified_tokens.put(raw_token, token)
 
-        return (_PhonePrincipal(phone), token)
+        return (_PhonePrincipal(token[PHONE_CLAIM]), token)
 
     def authenticate_header(self, request):
         return "Bearer"
+
+
+class _StaffPrincipal:
+    """request.user for a staff token, built from its claims."""
+    is_authenticated = True
+    is_anonymous = False
+    is_active = True
+
+    def __init__(self, user_id, username: str, is_staff: bool, is_superuser: bool):
+        self.pk = user_id
+        self.id = user_id
+        self.username = username
+        self.is_staff = is_staff
+        self.is_superuser = is_superuser
+
+    def __str__(self):
+        return self.username
+
+
+def _staff_state(user_id):
+    """
+    ``(is_active, is_staff, is_superuser)`` of a user, or None if it no
+    longer exists; cached per process for STAFF_AUTH_RECHECK_SECONDS.
+    """
+    cache = caches["local"]
+    key = f"staff_state:{user_id}"
+    state = cache.get(key)
+    if state is None:
+        row = (
+            get_user_model().objects.filter(pk=user_id)
+            .values_list("is_active", "is_staff", "is_superuser")
+            .first()
+        )
+        state = tuple(row) if row else ()
+        cache.set(key, state, timeout=settings.STAFF_AUTH_RECHECK_SECONDS)
+    return state or None
+
+
+class StaffJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication for the management API without a User fetch per request.
+
+    Tokens issued by StaffLoginView carry a ``staff`` claim, which is
+    trusted for STAFF_AUTH_RECHECK_SECONDS (0 = until the token expires);
+    after that the user's active/staff flags are read again, so
+    deactivating or demoting someone takes effect within that window.
+    Tokens without the claim (issued before it existed) fall back to the
+    usual User lookup.
+    """
+
+    def get_user(self, validated_token):
+        claims = validated_token.get(STAFF_CLAIM)
+        if not claims:
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as exc:
+            raise InvalidToken("Token contained no recognizable user identification") from exc
+
+        principal = _StaffPrincipal(user_id, claims.get("username", ""), True, bool(claims.get("superuser")))
+        if settings.STAFF_AUTH_RECHECK_SECONDS > 0:
+            state = _staff_state(user_id)
+            if state is None or not state[0]:
+                raise AuthenticationFailed("User is inactive or no longer exists.", code="user_inactive")
+            principal.is_staff, principal.is_superuser = state[1], state[2]
+        return principal
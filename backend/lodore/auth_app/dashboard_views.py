@@ -7,15 +7,17 @@ from django.db.models import Count, Q
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.permissions import IsAuthenticated
 
+from .authentication import StaffJWTAuthentication
 from .models import VIPPhone, InvitedContact
+from .permissions import IsStaffUser
 from lodore.calendly_app.models import BookingLog
 
 
 class DashboardStatsView(APIView):
-    """Get dashboard statistics for management panel"""
-    permission_classes = [IsAuthenticated]
+    """Get dashboard statistics for management panel (staff only)"""
+    authentication_classes = [StaffJWTAuthentication]
+    permission_classes = [IsStaffUser]
 
     def get(self, request):
         # Get current time in Saudi Arabia timezone (UTC+3)
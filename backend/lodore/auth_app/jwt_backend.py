@@ -3,38 +3,131 @@ Custom JWT authentication backend.
 
 We don't use Django's User model — instead we embed the normalized phone
 number directly in the JWT payload and validate against VIPPhone.
+
+Tokens are minted by TokenIssuer rather than simplejwt's Token classes;
+they decode and verify with AccessToken / RefreshToken all the same.
 """
+import base64
+import functools
+import json
 import logging
+import time
+from uuid import uuid4
+
+from jwt.algorithms import get_default_algorithms
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.state import token_backend
 from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import get_md5_hash_password
 from .models import VIPPhone
 
 logger = logging.getLogger("lodore")
 
 PHONE_CLAIM = "phone"
+# Staff tokens: {"username": ..., "superuser": bool}, see StaffJWTAuthentication
+STAFF_CLAIM = "staff"
+
+
+def _b64(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+class TokenIssuer:
+    """
+    Mints access + refresh token pairs for a dict of claims.
+
+    What simplejwt recomputes for every token is done once here: the
+    encoded JWT header, the constant claims (token type, audience,
+    issuer), the lifetimes in seconds and the prepared signing key. A pair
+    then costs two json.dumps, two signatures and no Token objects; the
+    access token carries the same claims as the refresh token, as
+    ``RefreshToken.access_token`` would copy them. The token_blacklist
+    app's outstanding-token records are not written.
+    """
+
+    def __init__(self, backend=token_backend):
+        self._algorithm = get_default_algorithms()[backend.algorithm]
+        self._key = self._algorithm.prepare_key(backend.signing_key)
+        self._json_encoder = backend.json_encoder
+        header = json.dumps({"alg": backend.algorithm, "typ": "JWT"}, separators=(",", ":"), sort_keys=True)
+        self._header = _b64(header.encode()) + b"."
+
+        constant = {}
+        if backend.audience is not None:
+            constant["aud"] = backend.audience
+        if backend.issuer is not None:
+            constant["iss"] = backend.issuer
+        type_claim = api_settings.TOKEN_TYPE_CLAIM
+        self._access_claims = {**constant, type_claim: "access"} if type_claim else constant
+        self._refresh_claims = {**constant, type_claim: "refresh"} if type_claim else constant
+        self._access_lifetime = int(api_settings.ACCESS_TOKEN_LIFETIME.total_seconds())
+        self._refresh_lifetime = int(api_settings.REFRESH_TOKEN_LIFETIME.total_seconds())
+        self._jti_claim = api_settings.JTI_CLAIM
+
+    def _encode(self, template: dict, lifetime: int, now: int, claims: dict) -> str:
+        payload = {**template, "exp": now + lifetime, "iat": now, self._jti_claim: uuid4().hex, **claims}
+        segments = self._header + _b64(
+            json.dumps(payload, separators=(",", ":"), cls=self._json_encoder).encode()
+        )
+        return (segments + b"." + _b64(self._algorithm.sign(segments, self._key))).decode()
+
+    def access(self, claims: dict) -> str:
+        return self._encode(self._access_claims, self._access_lifetime, int(time.time()), claims)
+
+    def pair(self, claims: dict) -> dict:
+        now = int(time.time())
+        return {
+            "access": self._encode(self._access_claims, self._access_lifetime, now, claims),
+            "refresh": self._encode(self._refresh_claims, self._refresh_lifetime, now, claims),
+        }
+
+    def refresh(self, raw_refresh: str) -> dict:
+        """
+        New tokens for a refresh token: an access token, plus a new refresh
+        token when ROTATE_REFRESH_TOKENS is on (otherwise the given one is
+        returned). Raises TokenError if it is invalid or expired.
+        """
+        token = RefreshToken(raw_refresh)
+        no_copy = (*RefreshToken.no_copy_claims, "iat")
+        claims = {claim: value for claim, value in token.payload.items() if claim not in no_copy}
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            return self.pair(claims)
+        return {"access": self.access(claims), "refresh": raw_refresh}
+
+
+@functools.cache
+def token_issuer() -> TokenIssuer:
+    """The process-wide TokenIssuer, built on first use."""
+    return TokenIssuer()
 
 
 def get_tokens_for_phone(phone: str) -> dict:
     """
     Generate JWT access + refresh tokens for a verified VIP phone number.
-    We embed the phone in the payload instead of a user_id.
+    The phone is the payload's user id as well as its own claim.
     """
-    # Use a dummy user-like object – simplejwt requires an object with an id
-    # We create a minimal wrapper that satisfies simplejwt's requirements.
-    class PhoneHolder:
-        def __init__(self, phone):
-            self.id = phone  # use phone as the "id"
-            self.pk = phone
-
-    holder = PhoneHolder(phone)
-    refresh = RefreshToken.for_user(holder)
-    # Embed phone explicitly in the payload
-    refresh[PHONE_CLAIM] = phone
-    refresh.access_token[PHONE_CLAIM] = phone
-
-    return {
-        "access": str(refresh.access_token),
-        "refresh": str(refresh),
+    return token_issuer().pair({api_settings.USER_ID_CLAIM: phone, PHONE_CLAIM: phone})
+
+
+def get_tokens_for_staff(user) -> dict:
+    """
+    Generate JWT access + refresh tokens for a staff login.
+    Both tokens carry the staff claim (and refreshed ones keep it), so
+    management requests are authorized from the token.
+    """
+    user_id = getattr(user, api_settings.USER_ID_FIELD)
+    claims = {
+        api_settings.USER_ID_CLAIM: user_id if isinstance(user_id, int) else str(user_id),
+        STAFF_CLAIM: {"username": user.username, "superuser": user.is_superuser},
     }
+    if api_settings.CHECK_REVOKE_TOKEN:
+        claims[api_settings.REVOKE_TOKEN_CLAIM] = get_md5_hash_password(user.password)
+    return token_issuer().pair(claims)
+
+
+def refresh_tokens(raw_refresh: str) -> dict:
+    """Access (and rotated refresh) token for a refresh token; raises TokenError."""
+    return token_issuer().refresh(raw_refresh)
 
 
 def phone_from_token(validated_token) -> str | None:
@@ -0,0 +1,270 @@
+"""
+Management command: check_query_budgets
+
+Calls every API endpoint at two data sizes and compares the number of
+SQL queries with the budgets in lodore/query_budgets.py. Fails when an
+endpoint has no budget, runs more queries than its budget, or runs more
+queries at the larger size (a per-row query).
+
+Everything runs inside one transaction that is rolled back, so it can be
+pointed at a development database; each endpoint also gets its own
+savepoint, so writes by one call never change what the next one sees.
+
+``manage.py test`` runs the same check (lodore/auth_app/tests/test_query_budgets.py).
+
+Usage:
+  python manage.py check_query_budgets
+  python manage.py check_query_budgets --sizes 10 100 --endpoint vip-list dashboard-stats
+"""
+import io
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from lodore.auth_app import urls as auth_urls
+from lodore.auth_app.jwt_backend import get_tokens_for_phone, get_tokens_for_staff
+from lodore.auth_app.models import InvitedContact, OTPRequest, VIPPhone
+from lodore.auth_app.unifonic import MOCK_OTP_CODE, OTP_CACHE_TTL
+from lodore.calendly_app import urls as calendly_urls
+from lodore.calendly_app.models import BookingLog
+from lodore.query_budgets import BUDGETS
+
+DEFAULT_SIZES = (5, 50)
+# Phone blocks used by the fixture (rolled back, but kept clear of real data)
+FIXTURE_PREFIX = "0593"
+NEW_PREFIX = "0594"
+UPLOAD_PREFIX = "0595"
+XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+class Rollback(Exception):
+    pass
+
+
+class Fixture:
+    """Rows the endpoints are called against, ``rows`` of each kind."""
+
+    staff_username = "query-budget-staff"
+    staff_password = "query-budget-password"
+    otp_code = MOCK_OTP_CODE
+
+    def __init__(self, rows):
+        self.vip_phones = [f"{FIXTURE_PREFIX}{n:06d}" for n in range(rows)]
+        VIPPhone.objects.bulk_create(
+            VIPPhone(phone=phone, full_name=f"عميل {n}") for n, phone in enumerate(self.vip_phones)
+        )
+        self.vip_ids = list(
+            VIPPhone.objects.filter(phone__in=self.vip_phones).order_by("id").values_list("id", flat=True)
+        )
+        InvitedContact.objects.bulk_create(
+            InvitedContact(
+                inviter_phone=self.vip_phones[n % rows],
+                invited_phone=f"{NEW_PREFIX}{500000 + n:06d}",
+                invited_name=f"مرشح {n}",
+            )
+            for n in range(rows)
+        )
+        self.nomination_ids = list(
+            InvitedContact.objects.filter(invited_phone__startswith=NEW_PREFIX)
+            .order_by("id").values_list("id", flat=True)
+        )
+        BookingLog.objects.bulk_create(
+            BookingLog(
+                event_type="invitee.created",
+                payload={},
+                phone=f"{NEW_PREFIX}{700000 + n:06d}",
+                guest_name=f"ضيف {n}",
+                guest_email=f"guest{n}@example.com",
+            )
+            for n in range(rows)
+        )
+        self.booking_ids = list(
+            BookingLog.objects.filter(phone__startswith=NEW_PREFIX).order_by("id").values_list("id", flat=True)
+        )
+
+        # verify-otp: a pending request for the first VIP; request-otp uses the second
+        self.unbooked_phone = self.vip_phones[0]
+        self.request_phone = self.vip_phones[1]
+        self.otp_reference = "MOCK-QUERYBUDGET"
+        OTPRequest.objects.create(phone=self.unbooked_phone, reference_id=self.otp_reference)
+        cache.set(
+            f"otp:{self.otp_reference}",
+            {"phone": self.unbooked_phone, "code": MOCK_OTP_CODE},
+            timeout=OTP_CACHE_TTL,
+        )
+
+        tokens = get_tokens_for_phone(self.unbooked_phone)
+        self.vip_access, self.vip_refresh = tokens["access"], tokens["refresh"]
+        staff = get_user_model().objects.create_user(
+            self.staff_username, password=self.staff_password, is_staff=True
+        )
+        self.staff_access = get_tokens_for_staff(staff)["access"]
+
+    def new_phone(self, i):
+        return f"{NEW_PREFIX}{i:06d}"
+
+    def webhook_payload(self):
+        phone = self.vip_phones[2]
+        return {
+            "event": "invitee.created",
+            "payload": {
+                "name": "ضيف",
+                "email": "guest@example.com",
+                "uri": "https://api.calendly.com/scheduled_events/QB/invitees/QB",
+                "scheduled_event": {"start_time": "2026-06-01T09:00:00.000000Z"},
+                "tracking": {"utm_content": phone},
+            },
+        }
+
+    def workbook(self, rows):
+        import openpyxl
+
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet = workbook.create_sheet()
+        sheet.append(["Phone", "Name", "Email"])
+        for n in range(rows):
+            sheet.append([f"{UPLOAD_PREFIX}{n:06d}", f"عميل {n}", ""])
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+        return SimpleUploadedFile("vips.xlsx", buffer.getvalue(), content_type=XLSX_CONTENT_TYPE)
+
+
+def api_url_names():
+    return [
+        pattern.name
+        for module in (auth_urls, calendly_urls)
+        for pattern in module.urlpatterns
+        if pattern.name
+    ]
+
+
+def call(endpoint, name, fixture, size):
+    """Call one endpoint; returns (status code, query count)."""
+    client = Client()
+    headers = dict(endpoint.headers)
+    if endpoint.auth == "staff":
+        headers["HTTP_AUTHORIZATION"] = f"Bearer {fixture.staff_access}"
+    elif endpoint.auth == "vip":
+        headers["HTTP_AUTHORIZATION"] = f"Bearer {fixture.vip_access}"
+
+    path = reverse(name, kwargs=endpoint.kwargs(fixture) if endpoint.kwargs else None)
+    method = getattr(client, endpoint.method)
+    data = endpoint.data(fixture, size) if endpoint.data else None
+    if endpoint.query:
+        kwargs = {"data": endpoint.query(fixture, size)}
+    elif endpoint.multipart:
+        kwargs = {"data": data}
+    elif data is not None:
+        kwargs = {"data": json.dumps(data), "content_type": "application/json"}
+    else:
+        kwargs = {}
+
+    with CaptureQueriesContext(connection) as queries:
+        response = method(path, **kwargs, **headers)
+    return response.status_code, len(queries.captured_queries)
+
+
+def budget_coverage_failures(names):
+    """URL names without a budget, and budgets for URL names that do not exist."""
+    failures = [f"{name}: no budget in lodore/query_budgets.py" for name in names if name not in BUDGETS]
+    failures += [f"{name}: budget for an unknown URL name" for name in BUDGETS if name not in names]
+    return failures
+
+
+def measure(names, small, large):
+    """
+    Call each endpoint in ``names`` at both sizes, each size against its own
+    fixture, and roll everything back; returns ``{name: [(size, status code,
+    query count), ...]}``.
+    """
+    results = {name: [] for name in names}
+    with override_settings(
+        ALLOWED_HOSTS=["testserver"],
+        UNIFONIC_FORCE_MOCK=True,
+        CALENDLY_WEBHOOK_SECRET="query-budget-secret",
+    ):
+        for index, rows in enumerate((small, large)):
+            try:
+                with transaction.atomic():
+                    fixture = Fixture(max(rows, 3))
+                    for name in names:
+                        endpoint = BUDGETS[name]
+                        size = (endpoint.sizes or (small, large))[index]
+                        with transaction.atomic():
+                            results[name].append((size, *call(endpoint, name, fixture, size)))
+                            transaction.set_rollback(True)
+                    raise Rollback
+            except Rollback:
+                pass
+    return results
+
+
+def budget_problems(name, measured):
+    """What is wrong with one endpoint's ``measure()`` result, if anything."""
+    endpoint = BUDGETS[name]
+    (size_a, status_a, count_a), (size_b, status_b, count_b) = measured
+    problems = []
+    if max(count_a, count_b) > endpoint.queries:
+        problems.append(f"over budget ({max(count_a, count_b)} > {endpoint.queries})")
+    if count_b > count_a:
+        problems.append(f"grows with size ({count_a} at {size_a} → {count_b} at {size_b})")
+    if status_a >= 500 or status_b >= 500:
+        problems.append(f"server error ({status_a}/{status_b})")
+    return problems
+
+
+class Command(BaseCommand):
+    help = "Check the SQL query count of every API endpoint against lodore/query_budgets.py."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs=2,
+            default=DEFAULT_SIZES,
+            metavar=("SMALL", "LARGE"),
+            help=f"Data sizes to compare (default {DEFAULT_SIZES[0]} {DEFAULT_SIZES[1]}).",
+        )
+        parser.add_argument("--endpoint", nargs="+", help="Only check these URL names.")
+
+    def handle(self, *args, **options):
+        small, large = sorted(options["sizes"])
+        if small < 1 or small == large:
+            raise CommandError("--sizes needs two different positive sizes.")
+
+        names = api_url_names()
+        failures = budget_coverage_failures(names)
+        selected = [name for name in names if name in BUDGETS]
+        if options["endpoint"]:
+            unknown = set(options["endpoint"]) - set(selected)
+            if unknown:
+                raise CommandError(f"Unknown endpoint(s): {', '.join(sorted(unknown))}")
+            selected = [name for name in selected if name in options["endpoint"]]
+
+        results = measure(selected, small, large)
+
+        self.stdout.write(f"{'endpoint':<28} {'small':>12} {'large':>12} {'budget':>7}")
+        for name in selected:
+            endpoint = BUDGETS[name]
+            (size_a, status_a, count_a), (size_b, status_b, count_b) = results[name]
+            problems = budget_problems(name, results[name])
+            line = (
+                f"{name:<28} {f'{count_a}q @{size_a} [{status_a}]':>12} "
+                f"{f'{count_b}q @{size_b} [{status_b}]':>12} {endpoint.queries:>7}"
+            )
+            if problems:
+                failures.append(f"{name}: {'; '.join(problems)}")
+                self.stdout.write(self.style.ERROR(line))
+            else:
+                self.stdout.write(line)
+
+        if failures:
+            raise CommandError("Query budget check failed:\n  " + "\n  ".join(failures))
+        self.stdout.write(self.style.SUCCESS(f"All {len(selected)} endpoints within budget."))
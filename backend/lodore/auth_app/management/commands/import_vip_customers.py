@@ -0,0 +1,85 @@
+"""
+Management command: import_vip_customers
+
+Usage:
+  python manage.py import_vip_customers                              # data/vip_customers2.csv
+  python manage.py import_vip_customers --file /data/customers.csv --dry-run
+
+CSV format (marketing customer export):
+  Phone,Name
+  512345678,محمد علي
+  0598765432,
+  ...
+
+A leading 0 is added to phones that lack one. New phones are created with
+booked=False; for existing ones the name is updated when the CSV has a
+different non-empty name, otherwise the row is skipped.
+
+The CSV is streamed and written in batches via auth_app.vip_import;
+--workers N cleans the rows in N processes (toolkit.pipeline).
+"""
+import os
+
+from django.conf import settings
+from django.core.management.base import CommandError
+from lodore.auth_app.models import VIPPhone
+from lodore.auth_app.vip_import import NAMES_REPLACE, apply_vip_batch
+from lodore.auth_app.vip_rows import normalize_customer_rows
+from lodore.toolkit.command import BatchCommand
+from lodore.toolkit.pipeline import parallel_map
+from lodore.toolkit.streaming import StreamFormatError, chunked, iter_csv_rows
+
+DEFAULT_CSV = os.path.join(settings.BASE_DIR, "..", "data", "vip_customers2.csv")
+
+
+class Command(BatchCommand):
+    help = "Import VIP customers (Phone, Name) from the marketing CSV export."
+    parallel = True
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--file",
+            type=str,
+            default=DEFAULT_CSV,
+            help="Path to the CSV file (must have a 'Phone' column).",
+        )
+
+    def handle(self, *args, **options):
+        filepath = options["file"]
+        self.dry_run = options["dry_run"]
+
+        if not os.path.isfile(filepath):
+            raise CommandError(f"File not found: {filepath}")
+
+        self.stdout.write(f"Reading VIP customers from: {filepath}")
+        self.announce_dry_run(self.dry_run)
+
+        self.counts = {"added": 0, "updated": 0, "skipped": 0}
+        progress = self.progress("rows")
+        with open(filepath, newline="", encoding="utf-8-sig") as fh:
+            try:
+                raw_rows = (
+                    (row.get("phone") or "", row.get("name") or "") for row in iter_csv_rows(fh)
+                )
+                chunks = chunked(raw_rows, options["batch_size"])
+                for batch in parallel_map(normalize_customer_rows, chunks, workers=options["workers"]):
+                    if batch:
+                        self._apply(batch)
+                    progress.add(len(batch))
+            except StreamFormatError as exc:
+                raise CommandError(str(exc)) from exc
+        progress.finish()
+
+        self.stdout.write("")
+        self.stdout.write(self.style.SUCCESS(
+            f"{'Dry run' if self.dry_run else 'Import'} complete: "
+            f"{self.counts['added']} added, {self.counts['updated']} updated, "
+            f"{self.counts['skipped']} skipped; {VIPPhone.objects.count()} VIPs in database."
+        ))
+
+    def _apply(self, batch):
+        result = apply_vip_batch(batch, names=NAMES_REPLACE, dry_run=self.dry_run)
+        self.counts["added"] += result["created"]
+        self.counts["updated"] += result["updated"]
+        self.counts["skipped"] += result["skipped"]
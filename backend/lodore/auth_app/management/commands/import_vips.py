@@ -3,6 +3,8 @@ Management command: import_vips
 
 Usage:
   python manage.py import_vips --file /data/vips.csv
+  python manage.py import_vips --file /data/vips.csv --batch-size 5000 --dry-run
+  python manage.py import_vips --file /data/vips.csv --copy     # very large lists
 
 CSV format (exported from Excel):
   phone,full_name
@@ -12,22 +14,45 @@ CSV format (exported from Excel):
 
 The 'full_name' column is optional.
 Phone numbers are normalized to 05xxxxxxxx during import.
-Duplicate phones are skipped (upsert by phone).
+Existing phones are kept (upsert by phone); their name is only filled in
+when blank, and --reset-booked clears booked / bookings_count.
+
+The CSV is streamed and written in batches: one lookup of existing phones,
+one bulk insert and one bulk update per batch, with periodic progress
+lines instead of per-row output (-v 2 lists every invalid row). With
+--workers N the phone normalization runs in N processes while this process
+keeps reading the CSV and writing batches.
+
+--copy (PostgreSQL) skips the batches: normalized rows are streamed with
+COPY into an unlogged staging table and merged into auth_app_vipphone with
+a single INSERT ... ON CONFLICT, with the same results.
 """
-import csv
-import os
 import logging
-from django.core.management.base import BaseCommand, CommandError
-from lodore.auth_app.models import VIPPhone
-from lodore.auth_app.utils import normalize_phone
+import os
+from itertools import chain
+
+from django.core.management.base import CommandError
+from django.db import connection
+
+from lodore.auth_app.vip_import import NAMES_FILL_BLANK, apply_vip_batch, copy_vips
+from lodore.auth_app.vip_rows import normalize_vip_rows
+from lodore.toolkit.command import BatchCommand
+from lodore.toolkit.pipeline import parallel_map
+from lodore.toolkit.streaming import StreamFormatError, chunked, csv_reader
 
 logger = logging.getLogger("lodore")
 
+# Invalid rows listed individually at the default verbosity
+MAX_REPORTED_ERRORS = 20
 
-class Command(BaseCommand):
+
+class Command(BatchCommand):
     help = "Import VIP phone numbers from a CSV file into the database."
+    default_batch_size = 5000
+    parallel = True
 
     def add_arguments(self, parser):
+        super().add_arguments(parser)
         parser.add_argument(
             "--file",
             type=str,
@@ -35,125 +60,112 @@ class Command(BaseCommand):
             help="Path to the CSV file (must have a 'phone' column).",
         )
         parser.add_argument(
-            "--dry-run",
+            "--reset-booked",
             action="store_true",
-            help="Parse and validate without saving to the database.",
+            help="Reset booked=False and bookings_count=0 for all imported records.",
         )
         parser.add_argument(
-            "--reset-booked",
+            "--copy",
             action="store_true",
-            help="Reset booked=False and bookings_count=0 for all imported records.",
+            help="Load through COPY and a single merge statement (PostgreSQL; fastest for huge files).",
         )
 
     def handle(self, *args, **options):
         filepath = options["file"]
         dry_run = options["dry_run"]
         reset_booked = options["reset_booked"]
+        verbosity = options["verbosity"]
 
         if not os.path.isfile(filepath):
             raise CommandError(f"File not found: {filepath}")
-
-        created_count = 0
-        updated_count = 0
-        skipped_count = 0
-        error_count = 0
+        if options["copy"] and connection.vendor != "postgresql":
+            raise CommandError("--copy requires PostgreSQL.")
 
         self.stdout.write(f"Reading VIPs from: {filepath}")
-        if dry_run:
-            self.stdout.write(self.style.WARNING("DRY RUN — no changes will be saved."))
+        self.announce_dry_run(dry_run)
+
+        counts = {"created": 0, "updated": 0, "skipped": 0, "errors": 0}
+        progress = self.progress("rows")
 
         with open(filepath, newline="", encoding="utf-8-sig") as csvfile:
-            # Detect delimiter (comma or semicolon)
-            sample = csvfile.read(2048)
-            csvfile.seek(0)
             try:
-                dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
-                csvfile.seek(0)
-                reader = csv.DictReader(csvfile, dialect=dialect)
-            except csv.Error:
-                # If sniffer fails, use default comma delimiter
-                csvfile.seek(0)
-                reader = csv.DictReader(csvfile)
-
-            # Normalize column names to lowercase, strip whitespace
-            if reader.fieldnames is None:
-                raise CommandError("CSV file appears to be empty or has no header row.")
-
-            reader.fieldnames = [f.strip().lower() for f in reader.fieldnames]
-
+                reader = csv_reader(csvfile)
+            except StreamFormatError as exc:
+                raise CommandError(str(exc)) from exc
             if "phone" not in reader.fieldnames and "mobile" not in reader.fieldnames:
                 raise CommandError(
                     f"CSV must contain a 'phone' or 'mobile' column. Found: {reader.fieldnames}"
                 )
 
-            for row_num, row in enumerate(reader, start=2):
-                raw_phone = (row.get("phone") or row.get("mobile") or "").strip()
-                full_name = (row.get("full_name") or row.get("name") or "").strip()
-
-                if not raw_phone:
-                    self.stdout.write(
-                        self.style.WARNING(f"  Row {row_num}: empty phone, skipping.")
-                    )
-                    skipped_count += 1
-                    continue
-
-                normalized = normalize_phone(raw_phone)
-                if not normalized:
-                    self.stdout.write(
-                        self.style.ERROR(
-                            f"  Row {row_num}: cannot normalize '{raw_phone}', skipping."
-                        )
-                    )
-                    error_count += 1
-                    continue
-
-                if dry_run:
-                    self.stdout.write(f"  [DRY] Would import: {normalized} ({full_name})")
-                    created_count += 1
-                    continue
+            # Reader → normalizing workers → this loop, the only writer
+            raw_rows = (
+                (
+                    row_num,
+                    row.get("phone") or row.get("mobile") or "",
+                    row.get("full_name") or row.get("name") or "",
+                )
+                for row_num, row in enumerate(reader, start=2)
+            )
+            results = parallel_map(
+                normalize_vip_rows,
+                chunked(raw_rows, options["batch_size"]),
+                workers=options["workers"],
+            )
+            batches = self._valid_batches(results, counts, verbosity, progress)
 
+            if options["copy"]:
                 try:
-                    obj, created = VIPPhone.objects.get_or_create(
-                        phone=normalized,
-                        defaults={"full_name": full_name},
+                    result = copy_vips(
+                        chain.from_iterable(pairs for _, pairs in batches),
+                        reset_booked=reset_booked,
+                        dry_run=dry_run,
                     )
-
-                    if created:
-                        created_count += 1
-                        self.stdout.write(
-                            self.style.SUCCESS(f"  Created: {normalized} ({full_name})")
-                        )
-                    else:
-                        # Update name if it was blank
-                        changed = False
-                        if full_name and not obj.full_name:
-                            obj.full_name = full_name
-                            changed = True
-                        if reset_booked:
-                            obj.booked = False
-                            obj.bookings_count = 0
-                            changed = True
-                        if changed:
-                            obj.save()
-                            updated_count += 1
-                            self.stdout.write(f"  Updated: {normalized}")
-                        else:
-                            skipped_count += 1
-                            self.stdout.write(f"  Skipped (exists): {normalized}")
-
                 except Exception as exc:
-                    logger.exception("Error importing row %s: %s", row_num, exc)
-                    error_count += 1
-                    self.stdout.write(
-                        self.style.ERROR(f"  Row {row_num}: error — {exc}")
-                    )
+                    logger.exception("Error importing VIPs with COPY: %s", exc)
+                    raise CommandError(f"COPY import failed — {exc}") from exc
+                for key, value in result.items():
+                    counts[key] += value
+            else:
+                for rows, pairs in batches:
+                    try:
+                        result = apply_vip_batch(
+                            pairs, names=NAMES_FILL_BLANK, reset_booked=reset_booked, dry_run=dry_run
+                        )
+                    except Exception as exc:
+                        logger.exception("Error importing rows %s: %s", rows, exc)
+                        raise CommandError(f"Rows {rows}: error — {exc}") from exc
+                    for key, value in result.items():
+                        counts[key] += value
+
+        progress.finish()
+        if counts["errors"] > MAX_REPORTED_ERRORS and verbosity < 2:
+            self.stdout.write(
+                f"  ({counts['errors'] - MAX_REPORTED_ERRORS} more invalid rows not shown; use -v 2)"
+            )
 
         self.stdout.write("")
         self.stdout.write(
             self.style.SUCCESS(
-                f"Import complete: {created_count} created, "
-                f"{updated_count} updated, "
-                f"{skipped_count} skipped, "
-                f"{error_count} errors."
+                f"{'Dry run' if dry_run else 'Import'} complete: {counts['created']} created, "
+                f"{counts['updated']} updated, "
+                f"{counts['skipped']} skipped, "
+                f"{counts['errors']} errors."
             )
         )
+
+    def _valid_batches(self, results, counts, verbosity, progress):
+        """
+        Yield ``("first-last", [(phone, full_name), ...])`` per normalized
+        chunk, counting blank and invalid rows in ``counts`` as they pass.
+        """
+        for valid, blank, invalid in results:
+            counts["skipped"] += blank
+            for row_num, raw_phone in invalid:
+                counts["errors"] += 1
+                if verbosity >= 2 or counts["errors"] <= MAX_REPORTED_ERRORS:
+                    self.stdout.write(self.style.ERROR(
+                        f"  Row {row_num}: cannot normalize '{raw_phone}', skipping."
+                    ))
+            progress.add(len(valid) + blank + len(invalid))
+            if valid:
+                yield f"{valid[0][0]}-{valid[-1][0]}", [(phone, name) for _, phone, name in valid]
@@ -8,6 +8,7 @@ Usage:
   python manage.py seed_vips
 """
 from django.core.management.base import BaseCommand
+from lodore.auth_app import vip_profiles
 from lodore.auth_app.models import VIPPhone
 
 TEST_VIPS = [
@@ -29,6 +30,8 @@ class Command(BaseCommand):
                 phone=entry["phone"],
                 defaults={"full_name": entry["full_name"]},
             )
+            if created:
+                vip_profiles.refresh([obj.phone])
             status = "Created" if created else "Already exists"
             self.stdout.write(
                 self.style.SUCCESS(f"  {status}: {obj.phone} — {obj.full_name}")
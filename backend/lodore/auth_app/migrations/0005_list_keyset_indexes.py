@@ -0,0 +1,25 @@
+# Generated by Django 4.2.9 on 2026-10-19 03:48
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY keeps the tables writable during the build;
+    # it cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('auth_app', '0004_vipphone_email'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='invitedcontact',
+            index=models.Index(fields=['-created_at', 'id'], name='invitedcontact_created_id_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='vipphone',
+            index=models.Index(fields=['-created_at', 'id'], name='vipphone_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.9 on 2026-10-19 03:49
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY: large tables keep taking writes while the
+    # GIN indexes build; it cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('auth_app', '0005_list_keyset_indexes'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name='invitedcontact',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('invited_name'), name='gin_trgm_ops'), name='invitedcontact_name_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='invitedcontact',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('invited_phone'), name='gin_trgm_ops'), name='invitedcontact_invited_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='invitedcontact',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('inviter_phone'), name='gin_trgm_ops'), name='invitedcontact_inviter_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='vipphone',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('full_name'), name='gin_trgm_ops'), name='vipphone_name_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='vipphone',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('phone'), name='gin_trgm_ops'), name='vipphone_phone_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='vipphone',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('email'), name='gin_trgm_ops'), name='vipphone_email_trgm'),
+        ),
+    ]
@@ -1,12 +1,22 @@
 """
 Models for Lodore Villa VIP Booking System.
 """
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils import timezone
 from datetime import timedelta
 from django.conf import settings
 
 
+def trigram_index(field: str, name: str) -> GinIndex:
+    """
+    GIN trigram index on UPPER(field), the expression Django generates for
+    ``icontains`` on PostgreSQL, so staff search boxes avoid full scans.
+    """
+    return GinIndex(OpClass(Upper(field), name="gin_trgm_ops"), name=name)
+
+
 class VIPPhone(models.Model):
     """
     Stores whitelisted VIP phone numbers (normalized to 05xxxxxxxx format).
@@ -22,6 +32,14 @@ class VIPPhone(models.Model):
         verbose_name = "VIP Phone"
         verbose_name_plural = "VIP Phones"
         ordering = ["-created_at"]
+        indexes = [
+            # Keyset pagination order for the management VIP list
+            models.Index(fields=["-created_at", "id"], name="vipphone_created_id_idx"),
+            # Staff search box
+            trigram_index("full_name", "vipphone_name_trgm"),
+            trigram_index("phone", "vipphone_phone_trgm"),
+            trigram_index("email", "vipphone_email_trgm"),
+        ]
 
     def __str__(self):
         return f"{self.phone} ({self.full_name or 'Unknown'})"
@@ -61,6 +79,14 @@ class InvitedContact(models.Model):
         verbose_name_plural = "Invited Contacts"
         ordering = ["-created_at"]
         unique_together = [["inviter_phone", "invited_phone"]]
+        indexes = [
+            # Keyset pagination order for the management nominations list
+            models.Index(fields=["-created_at", "id"], name="invitedcontact_created_id_idx"),
+            # Staff search box
+            trigram_index("invited_name", "invitedcontact_name_trgm"),
+            trigram_index("invited_phone", "invitedcontact_invited_trgm"),
+            trigram_index("inviter_phone", "invitedcontact_inviter_trgm"),
+        ]
 
     def __str__(self):
         approved_text = "✓ Approved" if self.approved else "⏳ Pending"
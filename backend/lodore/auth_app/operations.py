@@ -0,0 +1,469 @@
+"""
+Staff bulk operations shared by the management views and background jobs.
+
+Each operation takes plain data (ids, query params, file bytes) and returns
+the JSON body the view responds with, so a large request can be handed to
+lodore.jobs unchanged and its result polled later. Input problems raise
+OperationError carrying the status code the view should answer with.
+
+Job handlers for the same operations are registered at the bottom.
+"""
+import io
+import logging
+
+from django.conf import settings
+from django.db import DatabaseError, connection
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from lodore.jobs.registry import register
+from lodore.toolkit.pipeline import parallel_map
+from lodore.toolkit.streaming import chunked
+
+from .models import InvitedContact, VIPPhone
+from .search import search_filter
+from .utils import normalize_phone
+from .vip_import import upsert_vip_contacts
+from .vip_rows import normalize_contact_rows
+
+logger = logging.getLogger("lodore")
+
+# Columns selected for nominations — exactly the list / export fields
+NOMINATION_LIST_FIELDS = (
+    "id", "invited_name", "invited_phone", "inviter_phone",
+    "inviter_name", "status", "approved", "created_at",
+)
+# Search box columns: (free-text columns, phone columns)
+NOMINATION_SEARCH = (("invited_name",), ("invited_phone", "inviter_phone"))
+
+# Rows per normalize / write batch in the Excel upload
+UPLOAD_BATCH_SIZE = 2000
+# Report export progress every this many rows
+EXPORT_PROGRESS_ROWS = 1000
+
+XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+class OperationError(Exception):
+    """Bad input for an operation; ``status_code`` is the HTTP answer."""
+
+    def __init__(self, message, status_code=400):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+
+
+def with_inviter_name(queryset):
+    """Annotate nominations with the inviter's VIP name in the same query."""
+    inviter_names = (
+        VIPPhone.objects.filter(phone=OuterRef("inviter_phone"))
+        .order_by()
+        .values("full_name")[:1]
+    )
+    return queryset.annotate(
+        inviter_name=Coalesce(Subquery(inviter_names), Value(""))
+    )
+
+
+def _counts_message(prefix, created, updated, skipped, empty=None):
+    message_parts = []
+    if created > 0:
+        message_parts.append(f"{created} عميل جديد")
+    if updated > 0:
+        message_parts.append(f"{updated} عميل محدث")
+    if skipped > 0:
+        message_parts.append(f"{skipped} تم تخطيه")
+    if not message_parts and empty is not None:
+        return empty
+    return prefix + "، ".join(message_parts)
+
+
+# --------------------------------------------------------------- Excel upload
+
+def import_vip_workbook(data: bytes, progress=None) -> dict:
+    """
+    Upsert VIPs from an Excel workbook (name / phone / optional email
+    columns, Arabic or English headers). ``progress(done)`` is called after
+    every batch with the number of rows processed so far.
+    """
+    from openpyxl import load_workbook
+
+    # Read-only mode streams rows instead of building every cell
+    wb = load_workbook(io.BytesIO(data), read_only=True)
+    try:
+        ws = wb.active
+        sheet_rows = ws.iter_rows(values_only=True)
+
+        # Find header row and column mapping
+        headers = {}
+        for col_idx, value in enumerate(next(sheet_rows, ()), start=1):
+            header = str(value or "").strip().lower()
+            if header in ['الاسم', 'name', 'الاسم الكامل', 'full name']:
+                headers['name'] = col_idx
+            elif header in ['الجوال', 'phone', 'رقم الجوال', 'mobile', 'الهاتف']:
+                headers['phone'] = col_idx
+            elif header in ['البريد الإلكتروني', 'email', 'البريد', 'الإيميل']:
+                headers['email'] = col_idx
+
+        # Validate required columns
+        if 'phone' not in headers:
+            raise OperationError("Missing required column: Phone number (الجوال or Phone)")
+
+        def cell(row, column):
+            index = headers.get(column)
+            if index is None or index > len(row):
+                return ""
+            return str(row[index - 1] or "")
+
+        # Reader → normalizing workers → batched writes here
+        raw_rows = (
+            (row_idx, cell(row, 'phone'), cell(row, 'name'), cell(row, 'email'))
+            for row_idx, row in enumerate(sheet_rows, start=2)
+            if row and not all(value is None or str(value).strip() == '' for value in row)
+        )
+        results = parallel_map(
+            normalize_contact_rows,
+            chunked(raw_rows, UPLOAD_BATCH_SIZE),
+            workers=getattr(settings, "IMPORT_WORKERS", 1),
+        )
+
+        created_count = 0
+        updated_count = 0
+        errors = []
+        for valid, chunk_errors in results:
+            errors.extend(chunk_errors)
+            if valid:
+                counts = upsert_vip_contacts(valid)
+                created_count += counts["created"]
+                updated_count += counts["updated"]
+            if progress is not None:
+                progress(created_count + updated_count + len(errors))
+    finally:
+        wb.close()
+
+    skipped_count = len(errors)
+    return {
+        "ok": True,
+        "message": _counts_message(
+            "تم رفع البيانات: ", created_count, updated_count, skipped_count,
+            empty="لم يتم معالجة أي بيانات",
+        ),
+        "created": created_count,
+        "updated": updated_count,
+        "skipped": skipped_count,
+        "errors": errors[:20],  # Limit errors to first 20
+        "total_errors": len(errors),
+    }
+
+
+# ---------------------------------------------------------- Nominations export
+
+def nominations_export_queryset(params):
+    """
+    Nominations selected by the export query params: ``ids`` (comma
+    separated) unless ``export_all=true``, otherwise ``search`` / ``status``.
+    """
+    search = (params.get("search") or "").strip()
+    status_filter = (params.get("status") or "").strip()
+    ids_param = (params.get("ids") or "").strip()
+    export_all = (params.get("export_all") or "").strip().lower() == "true"
+
+    queryset = InvitedContact.objects.all()
+
+    # Filter by specific IDs if provided
+    if ids_param and not export_all:
+        try:
+            ids = [int(id.strip()) for id in ids_param.split(',') if id.strip()]
+        except ValueError:
+            raise OperationError("Invalid IDs parameter.")
+        queryset = queryset.filter(id__in=ids)
+    else:
+        # Apply search and status filters (for export_all or when no specific IDs)
+        if search:
+            text_fields, phone_fields = NOMINATION_SEARCH
+            queryset = queryset.filter(search_filter(search, text_fields, phone_fields))
+        if status_filter:
+            queryset = queryset.filter(status=status_filter)
+
+    return (
+        with_inviter_name(queryset)
+        .order_by("-created_at")
+        .values(*NOMINATION_LIST_FIELDS)
+    )
+
+
+def export_nominations(params, progress=None) -> tuple[str, bytes]:
+    """Build the nominations workbook; returns ``(filename, xlsx bytes)``."""
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, Alignment, PatternFill
+
+    queryset = nominations_export_queryset(params)
+
+    # Write-only workbook: rows are streamed out instead of kept as cells
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("ترشيحات الضيوف")
+
+    # Adjust column widths
+    for column, width in zip("ABCDEFG", (20, 15, 20, 15, 15, 10, 18)):
+        ws.column_dimensions[column].width = width
+
+    # Define headers (Arabic RTL)
+    headers = ["اسم الضيف", "رقم الضيف", "اسم المرشِّح", "رقم المرشِّح", "الحالة", "موافقة", "تاريخ الإنشاء"]
+
+    # Style for header
+    header_fill = PatternFill(start_color="C4955A", end_color="C4955A", fill_type="solid")
+    header_font = Font(bold=True, color="FFFFFF", size=12)
+    header_alignment = Alignment(horizontal="center", vertical="center")
+
+    header_row = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.fill = header_fill
+        cell.font = header_font
+        cell.alignment = header_alignment
+        header_row.append(cell)
+    ws.append(header_row)
+
+    # Status labels in Arabic
+    status_labels = {
+        "pending": "قيد الانتظار",
+        "contacted": "تم التواصل",
+        "invited": "تم الدعوة",
+        "confirmed": "مؤكد",
+    }
+
+    rows = 0
+    for nomination in queryset.iterator():
+        ws.append([
+            nomination["invited_name"],
+            nomination["invited_phone"],
+            nomination["inviter_name"],
+            nomination["inviter_phone"],
+            status_labels.get(nomination["status"], nomination["status"]),
+            "نعم" if nomination["approved"] else "لا",
+            nomination["created_at"].strftime("%Y-%m-%d %H:%M"),
+        ])
+        rows += 1
+        if progress is not None and rows % EXPORT_PROGRESS_ROWS == 0:
+            progress(rows)
+    if progress is not None:
+        progress(rows, rows)
+
+    excel_file = io.BytesIO()
+    wb.save(excel_file)
+    filename = f'nominations_{timezone.now().strftime("%Y-%m-%d")}.xlsx'
+    return filename, excel_file.getvalue()
+
+
+# ------------------------------------------------------------ Convert to VIP
+
+def _convert_to_vip(label, rows, progress=None) -> dict:
+    """
+    Create / update VIPs from ``(id, phone, name, email)`` source rows.
+
+    Same outcome as calling update_or_create per row in ``rows`` order
+    (name and email overwritten, the last row per phone wins, repeats of a
+    phone count as updates), but with one lookup of existing phones and a
+    bulk insert / bulk update in a single transaction. If that write fails,
+    the rows are converted one at a time so only the failing ones are
+    reported as errors. ``progress(done, total)`` is called before and
+    after the write.
+    """
+    errors = []
+    sources = []
+    for pk, phone, name, email in rows:
+        if not phone:
+            errors.append(f"{label} #{pk}: No phone number")
+            continue
+        sources.append((pk, (phone, name or "", email or "")))
+
+    if progress is not None:
+        progress(0, len(rows))
+    created_count = 0
+    updated_count = 0
+    if sources:
+        try:
+            counts = upsert_vip_contacts(contact for _, contact in sources)
+        except DatabaseError as e:
+            logger.warning(
+                f"Bulk conversion of {len(sources)} {label.lower()}s to VIP failed, "
+                f"converting one at a time: {e}"
+            )
+            for pk, contact in sources:
+                try:
+                    counts = upsert_vip_contacts([contact])
+                except DatabaseError as e:
+                    errors.append(f"{label} #{pk} ({contact[0]}): {str(e)}")
+                    logger.error(f"Failed to convert {contact[0]} to VIP: {e}")
+                else:
+                    created_count += counts["created"]
+                    updated_count += counts["updated"]
+        else:
+            created_count = counts["created"]
+            updated_count = counts["updated"]
+        logger.info(
+            "Converted %d %ss to VIP: %d created, %d updated",
+            created_count + updated_count, label.lower(), created_count, updated_count,
+        )
+    skipped_count = len(rows) - created_count - updated_count
+    if progress is not None:
+        progress(len(rows), len(rows))
+
+    return {
+        "ok": True,
+        "message": _counts_message(
+            "تم تحويل الضيوف إلى VIP: ", created_count, updated_count, skipped_count
+        ),
+        "created": created_count,
+        "updated": updated_count,
+        "skipped": skipped_count,
+        "errors": errors,
+    }
+
+
+def convert_reservations_to_vip(ids, progress=None) -> dict:
+    """Create / update VIPs from the guests of the given BookingLog ids."""
+    from lodore.calendly_app.models import BookingLog
+
+    # Only the guest columns: never load the raw webhook payloads
+    # Model ordering (newest received first), as the per-row loop used,
+    # so the same row wins when several share a phone
+    rows = list(
+        BookingLog.objects.filter(id__in=ids)
+        .values_list("id", "phone", "guest_name", "guest_email")
+    )
+    if not rows:
+        raise OperationError("No reservations found with provided IDs.", status_code=404)
+    return _convert_to_vip("Reservation", rows, progress=progress)
+
+
+def convert_nominations_to_vip(ids, progress=None) -> dict:
+    """Create / update VIPs from the invited guests of the given nominations."""
+    # Model ordering (newest first), as the per-row loop used
+    rows = list(
+        InvitedContact.objects.filter(id__in=ids)
+        .values_list("id", "invited_phone", "invited_name")
+    )
+    if not rows:
+        raise OperationError("No nominations found with provided IDs.", status_code=404)
+    # Nominations carry no email: converted VIPs get a blank one
+    return _convert_to_vip(
+        "Nomination", [(pk, phone, name, "") for pk, phone, name in rows], progress=progress
+    )
+
+
+# ------------------------------------------------------------- Invitations
+
+def submit_invitations(inviter_phone, contacts, already_invited, already_vip):
+    """
+    Store ``contacts`` (``[{"name", "phone"}, ...]``) as invitations from
+    ``inviter_phone``; returns ``(created_count, errors)`` with one error
+    per rejected contact, in request order.
+
+    ``already_invited`` / ``already_vip`` are message templates formatted
+    with ``name`` and ``phone``. All phones are checked with one query
+    against existing invitations and one against VIPs, then inserted with
+    a single INSERT ... ON CONFLICT DO NOTHING: the unique constraint
+    decides, and a contact invited concurrently by another request is
+    reported as already invited rather than counted as created.
+    """
+    # One entry per contact, in request order: an error message, or a
+    # (name, phone, repeated_in_request) candidate
+    entries = []
+    seen = set()
+    for contact in contacts:
+        if not isinstance(contact, dict):
+            contact = {}
+        name = str(contact.get("name") or "").strip()
+        phone = str(contact.get("phone") or "").strip()
+
+        if not name or not phone:
+            entries.append("الاسم ورقم الهاتف مطلوبان لكل جهة اتصال.")
+            continue
+
+        # Normalize phone
+        normalized_phone = normalize_phone(phone)
+        if not normalized_phone:
+            entries.append(f"رقم الهاتف {phone} غير صالح.")
+            continue
+
+        entries.append((name, normalized_phone, normalized_phone in seen))
+        seen.add(normalized_phone)
+
+    phones = list(seen)
+    invited, vips = set(), set()
+    if phones:
+        invited = set(
+            InvitedContact.objects.filter(inviter_phone=inviter_phone, invited_phone__in=phones)
+            .values_list("invited_phone", flat=True)
+        )
+        vips = set(VIPPhone.objects.filter(phone__in=phones).values_list("phone", flat=True))
+
+    to_create = [
+        (entry[0], entry[1]) for entry in entries
+        if isinstance(entry, tuple) and not entry[2]
+        and entry[1] not in invited and entry[1] not in vips
+    ]
+    inserted = _insert_invitations(inviter_phone, to_create)
+
+    errors = []
+    for entry in entries:
+        if isinstance(entry, str):
+            errors.append(entry)
+            continue
+        name, phone, repeated = entry
+        if phone in vips and phone not in invited:
+            errors.append(already_vip.format(name=name, phone=phone))
+        elif repeated or phone not in inserted:
+            # Invited before, earlier in this request, or by a concurrent request
+            errors.append(already_invited.format(name=name, phone=phone))
+    return len(inserted), errors
+
+
+def _insert_invitations(inviter_phone, rows) -> set:
+    """Insert ``(name, phone)`` invitations, returning the phones actually inserted."""
+    if not rows:
+        return set()
+    table = InvitedContact._meta.db_table
+    values = ", ".join(["(%s, %s, %s, FALSE, %s, now())"] * len(rows))
+    params = []
+    for name, phone in rows:
+        params += [inviter_phone, phone, name, InvitedContact.STATUS_PENDING]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {table}
+                (inviter_phone, invited_phone, invited_name, approved, status, created_at)
+            VALUES {values}
+            ON CONFLICT (inviter_phone, invited_phone) DO NOTHING
+            RETURNING invited_phone
+            """,
+            params,
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+
+# ------------------------------------------------------------- Job handlers
+
+@register("vip_upload")
+def vip_upload_job(job):
+    return import_vip_workbook(bytes(job.input_data), progress=job.report_progress)
+
+
+@register("nominations_export")
+def nominations_export_job(job):
+    filename, data = export_nominations(job.params, progress=job.report_progress)
+    job.attach_output(filename, XLSX_CONTENT_TYPE, data)
+    return {"ok": True, "filename": filename}
+
+
+@register("reservations_to_vip")
+def reservations_to_vip_job(job):
+    return convert_reservations_to_vip(job.params["ids"], progress=job.report_progress)
+
+
+@register("nominations_to_vip")
+def nominations_to_vip_job(job):
+    return convert_nominations_to_vip(job.params["ids"], progress=job.report_progress)
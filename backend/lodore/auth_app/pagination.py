@@ -0,0 +1,264 @@
+"""
+Pagination for the management list endpoints.
+
+Two modes share one endpoint:
+
+  page mode (default)
+    ?page=2&page_size=20 — OFFSET pagination with page/total_pages.
+
+  cursor mode
+    ?cursor=&page_size=20 — keyset pagination over the view's ordering.
+    Send an empty ``cursor`` for the first page, then follow ``next_cursor``.
+    Each page is an index range scan regardless of depth, and counting is
+    skipped unless ``with_count=true`` is passed.
+
+Cursors are opaque to clients: base64url-encoded JSON holding the ordering
+values of the last row on the previous page.
+
+Counts
+    ``count=estimate`` (default, see LIST_COUNT_MODE) answers in constant
+    time: unfiltered lists read ``pg_class.reltuples``; filtered lists count
+    at most LIST_COUNT_CAP rows and fall back to the planner's EXPLAIN
+    estimate beyond that. ``count=exact`` always runs COUNT(*). Responses
+    carry ``count_exact`` so the UI can show "~12,000".
+"""
+import base64
+import json
+import math
+import operator
+from functools import reduce
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connection
+from django.db.models import Q
+from rest_framework import status
+from rest_framework.response import Response
+
+DEFAULT_PAGE_SIZE = 20
+# page_size is clamped to 1..MAX_PAGE_SIZE
+MAX_PAGE_SIZE = 200
+
+
+COUNT_EXACT = "exact"
+COUNT_ESTIMATE = "estimate"
+
+
+class InvalidCursor(ValueError):
+    """Raised when a client sends a cursor we did not issue."""
+
+
+def _key_field(model, name):
+    """Model field behind an ordering key, or None for annotations (e.g. rank)."""
+    try:
+        return model._meta.get_field(name.lstrip("-"))
+    except FieldDoesNotExist:
+        return None
+
+
+def encode_cursor(values: list) -> str:
+    raw = json.dumps(
+        [v.isoformat() if hasattr(v, "isoformat") else v for v in values],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, model, ordering) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursor(cursor) from exc
+    if not isinstance(values, list) or len(values) != len(ordering):
+        raise InvalidCursor(cursor)
+
+    decoded = []
+    for name, value in zip(ordering, values):
+        field = _key_field(model, name)
+        try:
+            if value is not None and field is not None:
+                value = field.to_python(value)
+            decoded.append(value)
+        except Exception as exc:
+            raise InvalidCursor(cursor) from exc
+    return decoded
+
+
+def keyset_filter(model, ordering, values) -> Q | None:
+    """
+    Build the "rows strictly after ``values``" predicate for ``ordering``.
+
+    Follows PostgreSQL NULL placement (NULLS LAST for ASC, NULLS FIRST for
+    DESC) so nullable keys such as ``scheduled_at`` page correctly.
+    Returns None when no row can follow the cursor.
+    """
+    branches = []
+    equal = Q()
+    for name, value in zip(ordering, values):
+        descending = name.startswith("-")
+        field = name.lstrip("-")
+        key_field = _key_field(model, name)
+        nullable = key_field.null if key_field is not None else False
+
+        if value is None:
+            after = Q(**{f"{field}__isnull": False}) if descending else None
+            same = Q(**{f"{field}__isnull": True})
+        else:
+            after = Q(**{f"{field}__lt" if descending else f"{field}__gt": value})
+            if nullable and not descending:
+                after |= Q(**{f"{field}__isnull": True})
+            same = Q(**{field: value})
+
+        if after is not None:
+            branches.append(equal & after)
+        equal &= same
+
+    if not branches:
+        return None
+    return reduce(operator.or_, branches)
+
+
+def _table_estimate(model) -> int | None:
+    """Planner row estimate for the whole table, or None if never analyzed."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    if not row or row[0] < 0:
+        return None
+    return row[0]
+
+
+def _explain_estimate(queryset) -> int:
+    """Planner row estimate for a filtered queryset."""
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_rows(queryset, mode: str = COUNT_ESTIMATE) -> tuple[int, bool]:
+    """
+    Count a list queryset. Returns ``(count, exact)``.
+
+    In estimate mode the cost is bounded by LIST_COUNT_CAP rows no matter
+    how large the table is.
+    """
+    if mode == COUNT_EXACT:
+        return queryset.count(), True
+
+    cap = getattr(settings, "LIST_COUNT_CAP", 10_000)
+    # Drop ordering and selected annotations: only row existence matters
+    bare = queryset.order_by().values("pk")
+
+    if not queryset.query.where:
+        estimate = _table_estimate(queryset.model)
+        if estimate is not None and estimate > cap:
+            return estimate, False
+
+    capped = bare[: cap + 1].count()
+    if capped <= cap:
+        return capped, True
+    return max(_explain_estimate(bare), capped), False
+
+
+def _int_param(request, name, default) -> int:
+    """Integer query param; raises ValueError(name) when it is not one."""
+    raw = request.GET.get(name)
+    if raw is None or raw == "":
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        raise ValueError(name) from None
+
+
+def paginate(request, queryset, ordering, serialize) -> Response:
+    """
+    Paginate an ordered ``.values()`` queryset and build the list response.
+
+    ``ordering`` must be a total order (end with a unique column) and every
+    ordering field must be present in the selected values. ``serialize``
+    turns the page's rows into JSON-ready dicts. ``page_size`` is clamped
+    to 1..MAX_PAGE_SIZE; a non-integer ``page`` or ``page_size`` gets a 400.
+    """
+    try:
+        page_size = _int_param(request, "page_size", DEFAULT_PAGE_SIZE)
+        page = _int_param(request, "page", 1)
+    except ValueError as exc:
+        return Response(
+            {"ok": False, "message": f"Invalid {exc}."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    page_size = min(max(page_size, 1), MAX_PAGE_SIZE)
+    cursor = request.GET.get("cursor")
+    count_mode = request.GET.get("count") or getattr(
+        settings, "LIST_COUNT_MODE", COUNT_ESTIMATE
+    )
+
+    if cursor is None:
+        count, count_exact = count_rows(queryset, count_mode)
+        total_pages = max(1, math.ceil(count / page_size))
+
+        # Out-of-range pages fall back to the first/last page like
+        # Paginator.get_page(); an estimated total is never trusted for that.
+        number = max(page, 1)
+        if count_exact:
+            number = min(number, total_pages)
+        offset = (number - 1) * page_size
+        rows = list(queryset[offset: offset + page_size + 1])
+        has_next = len(rows) > page_size
+        if not count_exact:
+            total_pages = max(total_pages, number + has_next)
+
+        return Response(
+            {
+                "ok": True,
+                "results": serialize(rows[:page_size]),
+                "count": count,
+                "count_exact": count_exact,
+                "page": page,
+                "total_pages": total_pages,
+                "has_next": has_next,
+                "has_previous": number > 1,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    model = queryset.model
+    page_qs = queryset
+    if cursor:
+        try:
+            values = decode_cursor(cursor, model, ordering)
+        except InvalidCursor:
+            return Response(
+                {"ok": False, "message": "Invalid cursor."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        after = keyset_filter(model, ordering, values)
+        page_qs = page_qs.filter(after) if after is not None else page_qs.none()
+
+    rows = list(page_qs[: page_size + 1])
+    has_next = len(rows) > page_size
+    rows = rows[:page_size]
+    next_cursor = None
+    if has_next:
+        last = rows[-1]
+        next_cursor = encode_cursor([last[name.lstrip("-")] for name in ordering])
+
+    payload = {
+        "ok": True,
+        "results": serialize(rows),
+        "next_cursor": next_cursor,
+        "has_next": has_next,
+        "has_previous": bool(cursor),
+    }
+    if request.GET.get("with_count", "").lower() == "true":
+        payload["count"], payload["count_exact"] = count_rows(queryset, count_mode)
+    return Response(payload, status=status.HTTP_200_OK)
@@ -0,0 +1,33 @@
+"""
+Permission classes shared by the API views.
+"""
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.permissions import BasePermission
+
+STAFF_ONLY = {"ok": False, "message": "Access denied. Staff only."}
+
+
+class StaffOnly(PermissionDenied):
+    """403 with the management API's ``{"ok": false, "message": ...}`` body."""
+
+    def __init__(self):
+        super().__init__()
+        # Set after __init__, which would turn the values into strings
+        self.detail = dict(STAFF_ONLY)
+
+
+class IsStaffUser(BasePermission):
+    """
+    Management endpoints: staff or superuser accounts only.
+
+    Anonymous requests get DRF's usual 401; authenticated non-staff users
+    get a 403 with the same body the views used to return themselves.
+    """
+
+    def has_permission(self, request, view):
+        user = request.user
+        if not (user and user.is_authenticated):
+            return False
+        if user.is_staff or user.is_superuser:
+            return True
+        raise StaffOnly()
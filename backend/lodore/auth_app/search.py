@@ -0,0 +1,73 @@
+"""
+Search for the staff list and export endpoints.
+
+Text queries keep the existing ``icontains`` semantics. Every searched
+column has a GIN index on ``UPPER(col) gin_trgm_ops`` (see the model Meta
+indexes), which is exactly the expression Django emits for ``icontains`` on
+PostgreSQL, so ``UPPER(col) LIKE UPPER('%x%')`` becomes a bitmap index scan
+instead of a sequential scan for queries of three characters or more.
+
+Digit-only queries that can only be the start of a Saudi mobile number
+(05 or 9665 / +9665 followed by at least one more digit) are normalized to
+the stored 05 form and matched as a prefix, which the
+``varchar_pattern_ops`` indexes Django creates for indexed CharFields serve
+directly. Other digit-only queries (the last digits, "5…", a bare "966")
+fall back to an ``icontains`` match on the phone columns only, which reuses
+the same trigram indexes.
+"""
+import re
+
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db.models import Q
+from django.db.models.functions import Greatest
+
+_PHONE_SEPARATORS = re.compile(r"[\s\-\(\)]")
+# Shortest normalized prefix worth a prefix match: "05" matches every phone
+MIN_PHONE_PREFIX = 3
+
+
+def phone_search_term(query: str) -> tuple[str, bool] | None:
+    """
+    Classify a digit-only query.
+
+    Returns ``(term, is_prefix)`` where ``term`` is normalized to the stored
+    05xxxxxxxx form when ``is_prefix`` is True, or None if the query is not
+    digit-only.
+    """
+    digits = _PHONE_SEPARATORS.sub("", query)
+    if digits.startswith("+"):
+        digits = digits[1:]
+    if not digits.isdigit():
+        return None
+
+    prefix = "0" + digits[3:] if digits.startswith("9665") else digits
+    if prefix.startswith("05") and len(prefix) >= MIN_PHONE_PREFIX:
+        return prefix, True
+    return digits, False
+
+
+def search_filter(query: str, text_fields, phone_fields) -> Q:
+    """Build the search predicate for ``query`` over the given columns."""
+    phone_term = phone_search_term(query)
+    if phone_term is not None:
+        term, is_prefix = phone_term
+        lookup = "startswith" if is_prefix else "icontains"
+        predicate = Q()
+        for field in phone_fields:
+            predicate |= Q(**{f"{field}__{lookup}": term})
+        return predicate
+
+    predicate = Q()
+    for field in (*text_fields, *phone_fields):
+        predicate |= Q(**{f"{field}__icontains": query})
+    return predicate
+
+
+def annotate_rank(queryset, query: str, text_fields):
+    """
+    Annotate ``rank`` with the best trigram similarity of ``query`` across
+    ``text_fields``, for ``sort=relevance`` ordering.
+    """
+    similarities = [TrigramSimilarity(field, query) for field in text_fields]
+    rank = similarities[0] if len(similarities) == 1 else Greatest(*similarities)
+    return queryset.annotate(rank=rank)
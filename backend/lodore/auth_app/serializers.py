@@ -54,6 +54,30 @@ class InvitedContactSerializer(serializers.Serializer):
     created_at = serializers.DateTimeField(read_only=True)
 
 
+# Ordering-only annotations (search.annotate_rank) that are not response fields
+ORDERING_ONLY_KEYS = ("rank",)
+
+
+def serialize_rows(rows, datetime_fields=("created_at",)) -> list[dict]:
+    """
+    Fast serializer for list endpoints.
+
+    Takes ``.values()`` rows (plain dicts) and converts the given datetime
+    fields to ISO 8601 in place, avoiding model instantiation and DRF field
+    machinery for every row on the page. Ordering-only keys such as the
+    relevance ``rank`` are dropped, so the row shape is the same whatever
+    the sort.
+    """
+    rows = list(rows)
+    for row in rows:
+        for key in ORDERING_ONLY_KEYS:
+            row.pop(key, None)
+        for field in datetime_fields:
+            value = row[field]
+            row[field] = value.isoformat() if value is not None else None
+    return rows
+
+
 class UpdateInvitedContactStatusSerializer(serializers.Serializer):
     """Serializer for updating contact status"""
     status = serializers.ChoiceField(choices=[
@@ -0,0 +1,5 @@
+"""
+Tests for auth_app.
+
+  python manage.py test lodore.auth_app
+"""
@@ -0,0 +1,195 @@
+"""
+Tests for the API authentication classes and permissions.
+"""
+import time
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import connection
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+
+from lodore.auth_app import authentication
+from lodore.auth_app.jwt_backend import get_tokens_for_phone, get_tokens_for_staff
+
+RECHECK_SECONDS = 30
+
+
+class VerifiedTokenCacheTests(SimpleTestCase):
+    """PhoneJWTAuthentication's LRU of verified access tokens."""
+
+    def setUp(self):
+        authentication._verified_tokens.clear()
+        self.addCleanup(authentication._verified_tokens.clear)
+        self.auth = authentication.PhoneJWTAuthentication()
+
+    def authenticate(self, token):
+        request = RequestFactory().get("/api/auth/me", HTTP_AUTHORIZATION=f"Bearer {token}")
+        return self.auth.authenticate(request)
+
+    def clock(self, now):
+        return mock.patch.object(authentication, "time", mock.Mock(time=mock.Mock(return_value=now)))
+
+    def verifications(self):
+        return mock.patch.object(authentication, "AccessToken", wraps=AccessToken)
+
+    def test_verified_token_is_served_from_the_cache(self):
+        token = get_tokens_for_phone("0599000001")["access"]
+        with self.verifications() as verify:
+            for _ in range(3):
+                user, _ = self.authenticate(token)
+                self.assertEqual(user.phone, "0599000001")
+        self.assertEqual(verify.call_count, 1)
+        self.assertEqual(len(authentication._verified_tokens), 1)
+
+    def test_expired_entry_is_evicted(self):
+        token = get_tokens_for_phone("0599000001")["access"]
+        self.authenticate(token)
+        expires = AccessToken(token)["exp"]
+
+        with self.clock(expires + 1):
+            self.assertIsNone(authentication._verified_tokens.get(token))
+        self.assertEqual(len(authentication._verified_tokens), 0)
+
+    def test_expired_token_is_rejected_even_if_it_was_cached(self):
+        token = get_tokens_for_phone("0599000001")["access"]
+        self.authenticate(token)
+        cached = authentication._verified_tokens.get(token)
+
+        # exp passed: the entry is dropped and the token verified (and refused) again
+        with self.clock(cached["exp"] + 1), \
+                mock.patch.object(authentication, "AccessToken", side_effect=authentication.TokenError("expired")):
+            with self.assertRaises(AuthenticationFailed):
+                self.authenticate(token)
+
+    @override_settings(PHONE_TOKEN_CACHE_SIZE=0)
+    def test_size_zero_disables_the_cache(self):
+        token = get_tokens_for_phone("0599000001")["access"]
+        with self.verifications() as verify:
+            for _ in range(3):
+                self.authenticate(token)
+        self.assertEqual(verify.call_count, 3)
+        self.assertEqual(len(authentication._verified_tokens), 0)
+
+    @override_settings(PHONE_TOKEN_CACHE_SIZE=2)
+    def test_least_recently_used_token_is_dropped(self):
+        first, second, third = (get_tokens_for_phone(f"059900000{n}")["access"] for n in range(3))
+        for token in (first, second, first, third):
+            self.authenticate(token)
+        self.assertEqual(len(authentication._verified_tokens), 2)
+        self.assertIsNotNone(authentication._verified_tokens.get(first))
+        self.assertIsNone(authentication._verified_tokens.get(second))
+
+    def test_failed_verification_is_never_cached(self):
+        good = get_tokens_for_phone("0599000001")["access"]
+        header, payload, signature = good.split(".")
+        tampered = f"{header}.{payload}.{signature[:-4]}AAAA"
+        without_phone = str(AccessToken())
+
+        for token in (tampered, "not-a-jwt", without_phone):
+            with self.subTest(token=token):
+                for _ in range(2):
+                    with self.assertRaises(AuthenticationFailed):
+                        self.authenticate(token)
+                self.assertIsNone(authentication._verified_tokens.get(token))
+        self.assertEqual(len(authentication._verified_tokens), 0)
+
+
+@override_settings(STAFF_AUTH_RECHECK_SECONDS=RECHECK_SECONDS)
+class StaffJWTAuthenticationTests(TestCase):
+    # Cheap staff-only endpoint: 404 for an unknown job means "let in"
+    url = "/api/jobs/0"
+
+    def setUp(self):
+        caches["local"].clear()
+        self.addCleanup(caches["local"].clear)
+        self.user = get_user_model().objects.create_user(
+            "auth-test-staff", password="auth-test-password", is_staff=True
+        )
+
+    def get(self, token, url=None):
+        return self.client.get(url or self.url, HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def later(self, seconds):
+        """Move the per-process cache's clock ``seconds`` ahead."""
+        clock = mock.Mock(time=mock.Mock(return_value=time.time() + seconds))
+        return mock.patch("django.core.cache.backends.locmem.time", clock)
+
+    def test_staff_token_is_let_in(self):
+        self.assertEqual(self.get(get_tokens_for_staff(self.user)["access"]).status_code, 404)
+
+    def test_deactivated_user_is_rejected_after_the_recheck_window(self):
+        token = get_tokens_for_staff(self.user)["access"]
+        self.assertEqual(self.get(token).status_code, 404)
+
+        self.user.is_active = False
+        self.user.save(update_fields=["is_active"])
+        # Trusted from the cache until the window passes
+        self.assertEqual(self.get(token).status_code, 404)
+        with self.later(RECHECK_SECONDS + 1):
+            self.assertEqual(self.get(token).status_code, 401)
+
+    def test_deleted_user_is_rejected(self):
+        token = get_tokens_for_staff(self.user)["access"]
+        self.user.delete()
+        self.assertEqual(self.get(token).status_code, 401)
+
+    def test_demoted_user_gets_403(self):
+        token = get_tokens_for_staff(self.user)["access"]
+        self.assertEqual(self.get(token).status_code, 404)
+
+        self.user.is_staff = False
+        self.user.save(update_fields=["is_staff"])
+        with self.later(RECHECK_SECONDS + 1):
+            response = self.get(token)
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.json(), {"ok": False, "message": "Access denied. Staff only."})
+
+    def test_recheck_reads_the_user_once_per_window(self):
+        token = get_tokens_for_staff(self.user)["access"]
+
+        def user_reads():
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(self.get(token).status_code, 404)
+            return sum('FROM "auth_user"' in query["sql"] for query in queries.captured_queries)
+
+        self.assertEqual(user_reads(), 1)
+        self.assertEqual(user_reads(), 0)
+        with self.later(RECHECK_SECONDS + 1):
+            self.assertEqual(user_reads(), 1)
+
+    @override_settings(STAFF_AUTH_RECHECK_SECONDS=0)
+    def test_zero_recheck_trusts_the_claim(self):
+        token = get_tokens_for_staff(self.user)["access"]
+        self.user.is_active = False
+        self.user.save(update_fields=["is_active"])
+        with mock.patch.object(authentication, "_staff_state") as staff_state:
+            self.assertEqual(self.get(token).status_code, 404)
+        staff_state.assert_not_called()
+
+    def test_token_without_staff_claim_falls_back_to_the_database(self):
+        token = str(AccessToken.for_user(self.user))
+        with mock.patch.object(authentication, "_staff_state") as staff_state:
+            self.assertEqual(self.get(token).status_code, 404)
+        staff_state.assert_not_called()
+
+        # The User row decides, with no recheck window
+        self.user.is_staff = False
+        self.user.save(update_fields=["is_staff"])
+        self.assertEqual(self.get(token).status_code, 403)
+        self.user.is_active = False
+        self.user.save(update_fields=["is_active"])
+        self.assertEqual(self.get(token).status_code, 401)
+
+    def test_dashboard_stats_is_staff_only(self):
+        url = reverse("dashboard-stats")
+        non_staff = get_user_model().objects.create_user("auth-test-user", password="auth-test-password")
+
+        self.assertEqual(self.client.get(url).status_code, 401)
+        self.assertEqual(self.get(get_tokens_for_phone("0599000001")["access"], url).status_code, 401)
+        self.assertEqual(self.get(str(AccessToken.for_user(non_staff)), url).status_code, 403)
+        self.assertEqual(self.get(get_tokens_for_staff(self.user)["access"], url).status_code, 200)
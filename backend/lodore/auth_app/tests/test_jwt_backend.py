@@ -0,0 +1,125 @@
+"""
+Tests for TokenIssuer: its tokens must be interchangeable with simplejwt's.
+"""
+import time
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from lodore.auth_app import jwt_backend
+from lodore.auth_app.jwt_backend import (
+    PHONE_CLAIM,
+    STAFF_CLAIM,
+    get_tokens_for_phone,
+    get_tokens_for_staff,
+    refresh_tokens,
+)
+
+PHONE = "0599000001"
+
+
+class TokenIssuerTests(SimpleTestCase):
+    def clock(self, now):
+        return mock.patch.object(jwt_backend, "time", mock.Mock(time=mock.Mock(return_value=now)))
+
+    def staff_user(self, **fields):
+        return get_user_model()(id=42, username="issuer-test-staff", **fields)
+
+    def assertLifetime(self, token, lifetime):
+        self.assertEqual(token["exp"] - token["iat"], int(lifetime.total_seconds()))
+
+    def test_pair_validates_with_simplejwt(self):
+        tokens = get_tokens_for_phone(PHONE)
+
+        access = AccessToken(tokens["access"])
+        refresh = RefreshToken(tokens["refresh"])
+
+        for token, token_type in ((access, "access"), (refresh, "refresh")):
+            with self.subTest(token_type=token_type):
+                self.assertEqual(token[api_settings.TOKEN_TYPE_CLAIM], token_type)
+                self.assertEqual(token[api_settings.USER_ID_CLAIM], PHONE)
+                self.assertEqual(token[PHONE_CLAIM], PHONE)
+                self.assertEqual(len(token[api_settings.JTI_CLAIM]), 32)
+        self.assertLifetime(access, api_settings.ACCESS_TOKEN_LIFETIME)
+        self.assertLifetime(refresh, api_settings.REFRESH_TOKEN_LIFETIME)
+        self.assertEqual(access["iat"], refresh["iat"])
+        self.assertNotEqual(access[api_settings.JTI_CLAIM], refresh[api_settings.JTI_CLAIM])
+
+    def test_token_types_are_not_interchangeable(self):
+        tokens = get_tokens_for_phone(PHONE)
+        with self.assertRaises(TokenError):
+            AccessToken(tokens["refresh"])
+        with self.assertRaises(TokenError):
+            RefreshToken(tokens["access"])
+
+    def test_same_claims_as_simplejwt(self):
+        expected = RefreshToken()
+        expected[api_settings.USER_ID_CLAIM] = PHONE
+        expected[PHONE_CLAIM] = PHONE
+
+        tokens = get_tokens_for_phone(PHONE)
+
+        self.assertEqual(set(RefreshToken(tokens["refresh"]).payload), set(expected.payload))
+        self.assertEqual(set(AccessToken(tokens["access"]).payload), set(expected.access_token.payload))
+
+    def test_staff_claims(self):
+        for superuser in (False, True):
+            with self.subTest(superuser=superuser):
+                tokens = get_tokens_for_staff(self.staff_user(is_staff=True, is_superuser=superuser))
+                for raw, token_class in ((tokens["access"], AccessToken), (tokens["refresh"], RefreshToken)):
+                    token = token_class(raw)
+                    self.assertEqual(token[api_settings.USER_ID_CLAIM], 42)
+                    self.assertEqual(token[STAFF_CLAIM], {"username": "issuer-test-staff", "superuser": superuser})
+                    self.assertNotIn(PHONE_CLAIM, token.payload)
+
+    def test_refresh_rotates(self):
+        with self.clock(time.time() - 60):
+            tokens = get_tokens_for_staff(self.staff_user(is_staff=True))
+        old = RefreshToken(tokens["refresh"])
+
+        refreshed = refresh_tokens(tokens["refresh"])
+
+        access = AccessToken(refreshed["access"])
+        refresh = RefreshToken(refreshed["refresh"])
+        self.assertNotEqual(refreshed["refresh"], tokens["refresh"])
+        self.assertNotEqual(refresh[api_settings.JTI_CLAIM], old[api_settings.JTI_CLAIM])
+        self.assertNotEqual(access[api_settings.JTI_CLAIM], refresh[api_settings.JTI_CLAIM])
+        # New lifetimes from the refresh time, the claims carried over
+        self.assertGreaterEqual(refresh["iat"], old["iat"] + 60)
+        self.assertLifetime(access, api_settings.ACCESS_TOKEN_LIFETIME)
+        self.assertLifetime(refresh, api_settings.REFRESH_TOKEN_LIFETIME)
+        for token in (access, refresh):
+            self.assertEqual(token[api_settings.USER_ID_CLAIM], 42)
+            self.assertEqual(token[STAFF_CLAIM], old[STAFF_CLAIM])
+
+    def test_refreshed_tokens_refresh_again(self):
+        raw = get_tokens_for_phone(PHONE)["refresh"]
+        for _ in range(3):
+            tokens = refresh_tokens(raw)
+            self.assertEqual(AccessToken(tokens["access"])[PHONE_CLAIM], PHONE)
+            raw = tokens["refresh"]
+        self.assertEqual(RefreshToken(raw)[PHONE_CLAIM], PHONE)
+
+    def test_refresh_without_rotation_returns_the_same_refresh_token(self):
+        raw = get_tokens_for_phone(PHONE)["refresh"]
+
+        with mock.patch.object(jwt_backend.api_settings, "ROTATE_REFRESH_TOKENS", False):
+            tokens = refresh_tokens(raw)
+
+        self.assertEqual(tokens["refresh"], raw)
+        self.assertEqual(AccessToken(tokens["access"])[PHONE_CLAIM], PHONE)
+
+    def test_refresh_rejects_invalid_tokens(self):
+        tokens = get_tokens_for_phone(PHONE)
+        header, payload, signature = tokens["refresh"].split(".")
+        with self.clock(time.time() - api_settings.REFRESH_TOKEN_LIFETIME.total_seconds() - 60):
+            expired = get_tokens_for_phone(PHONE)["refresh"]
+
+        for raw in (tokens["access"], f"{header}.{payload}.{signature[:-4]}AAAA", "not-a-jwt", expired):
+            with self.subTest(raw=raw):
+                with self.assertRaises(TokenError):
+                    refresh_tokens(raw)
@@ -0,0 +1,75 @@
+"""
+Tests for the staff bulk operations.
+"""
+from datetime import timedelta
+from unittest import mock
+
+from django.db import DatabaseError
+from django.test import TestCase
+from django.utils import timezone
+
+from lodore.auth_app import operations
+from lodore.auth_app.models import InvitedContact, VIPPhone
+from lodore.calendly_app.models import BookingLog
+
+
+class ConvertToVIPTests(TestCase):
+    """The bulk conversions give the result of the old update_or_create loop."""
+
+    PHONE = "0599000001"
+
+    def _reservation(self, name, age_minutes):
+        row = BookingLog.objects.create(payload={}, phone=self.PHONE, guest_name=name)
+        BookingLog.objects.filter(pk=row.pk).update(
+            received_at=timezone.now() - timedelta(minutes=age_minutes)
+        )
+        return row.pk
+
+    def _nomination(self, inviter, name, age_minutes):
+        row = InvitedContact.objects.create(
+            inviter_phone=inviter, invited_phone=self.PHONE, invited_name=name
+        )
+        InvitedContact.objects.filter(pk=row.pk).update(
+            created_at=timezone.now() - timedelta(minutes=age_minutes)
+        )
+        return row.pk
+
+    def test_duplicate_phone_reservations_keep_the_oldest_guest(self):
+        # The loop walked -received_at order, so the oldest row was written last
+        ids = [
+            self._reservation("Newest", 1),
+            self._reservation("Oldest", 30),
+            self._reservation("Middle", 10),
+        ]
+        result = operations.convert_reservations_to_vip(ids)
+
+        self.assertEqual(VIPPhone.objects.get(phone=self.PHONE).full_name, "Oldest")
+        self.assertEqual((result["created"], result["updated"], result["skipped"]), (1, 2, 0))
+
+    def test_duplicate_phone_nominations_keep_the_oldest_nomination(self):
+        ids = [
+            self._nomination("0511111111", "Oldest", 30),
+            self._nomination("0522222222", "Newest", 1),
+        ]
+        operations.convert_nominations_to_vip(ids)
+
+        self.assertEqual(VIPPhone.objects.get(phone=self.PHONE).full_name, "Oldest")
+
+    def test_failed_bulk_write_falls_back_to_one_row_at_a_time(self):
+        good = BookingLog.objects.create(payload={}, phone="0599000002", guest_name="Good")
+        bad = BookingLog.objects.create(payload={}, phone="0599000003", guest_name="Bad")
+        upsert = operations.upsert_vip_contacts
+
+        def flaky_upsert(contacts):
+            contacts = list(contacts)
+            if len(contacts) > 1 or contacts[0][0] == bad.phone:
+                raise DatabaseError("boom")
+            return upsert(contacts)
+
+        with mock.patch.object(operations, "upsert_vip_contacts", side_effect=flaky_upsert):
+            result = operations.convert_reservations_to_vip([good.pk, bad.pk])
+
+        self.assertTrue(VIPPhone.objects.filter(phone=good.phone).exists())
+        self.assertFalse(VIPPhone.objects.filter(phone=bad.phone).exists())
+        self.assertEqual((result["created"], result["skipped"]), (1, 1))
+        self.assertEqual(result["errors"], [f"Reservation #{bad.pk} ({bad.phone}): boom"])
@@ -0,0 +1,207 @@
+"""
+Tests for the management list pagination.
+"""
+from datetime import timedelta
+from unittest import mock
+
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
+
+from lodore.auth_app import pagination
+from lodore.auth_app.pagination import (
+    COUNT_ESTIMATE,
+    COUNT_EXACT,
+    count_rows,
+    encode_cursor,
+    paginate,
+)
+from lodore.auth_app.views import _RESERVATION_ORDERING, _ordered_values
+from lodore.calendly_app.models import BookingLog
+
+# Kept clear of development data when the test database is a copy of it
+PHONE_PREFIX = "0599"
+
+
+def _rows(rows):
+    return list(rows)
+
+
+class ListTestCase(TestCase):
+    factory = RequestFactory()
+
+    def paginate(self, queryset, ordering, **params):
+        return paginate(self.factory.get("/", params), queryset, ordering, _rows)
+
+
+class KeysetPaginationTests(ListTestCase):
+    """Cursor pages over (-scheduled_at, -received_at, id) with NULL scheduled_at rows."""
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        # NULL scheduled_at, shared scheduled_at and shared received_at values,
+        # so every ordering key (and its NULL placement) decides some pages
+        shapes = [
+            (None, 0), (None, 0), (None, 5),
+            (now, 0), (now, 0), (now, 5), (now, 5),
+            (now - timedelta(days=1), 0), (None, 10),
+            (now + timedelta(days=1), 0), (now - timedelta(days=2), 3),
+        ]
+        for n, (scheduled_at, age_minutes) in enumerate(shapes):
+            row = BookingLog.objects.create(
+                payload={}, phone=f"{PHONE_PREFIX}{n:06d}", scheduled_at=scheduled_at
+            )
+            BookingLog.objects.filter(pk=row.pk).update(
+                received_at=now - timedelta(minutes=age_minutes)
+            )
+
+    def setUp(self):
+        self.queryset = _ordered_values(
+            BookingLog.objects.filter(phone__startswith=PHONE_PREFIX),
+            _RESERVATION_ORDERING,
+            ("id", "scheduled_at", "received_at"),
+        )
+
+    def walk(self, page_size):
+        seen, cursor = [], ""
+        for _ in range(self.queryset.count() + 1):
+            response = self.paginate(
+                self.queryset, _RESERVATION_ORDERING, cursor=cursor, page_size=page_size
+            )
+            self.assertEqual(response.status_code, 200)
+            seen += [row["id"] for row in response.data["results"]]
+            if not response.data["has_next"]:
+                self.assertIsNone(response.data["next_cursor"])
+                return seen
+            cursor = response.data["next_cursor"]
+        self.fail("cursor pagination did not terminate")
+
+    def test_cursor_pages_visit_every_row_once_in_order(self):
+        expected = list(self.queryset.values_list("id", flat=True))
+        # PostgreSQL puts NULLs first in descending order
+        self.assertIsNone(self.queryset[0]["scheduled_at"])
+        for page_size in (1, 2, 3, 4, len(expected)):
+            with self.subTest(page_size=page_size):
+                self.assertEqual(self.walk(page_size), expected)
+
+    def test_malformed_cursor_is_rejected(self):
+        for cursor in (
+            "not a cursor!",
+            encode_cursor(["2026-01-01T00:00:00+00:00", 1]),  # wrong length
+            encode_cursor(["yesterday", "2026-01-01T00:00:00+00:00", 1]),  # not a datetime
+            encode_cursor([None, None, "x"]),  # not an id
+        ):
+            with self.subTest(cursor=cursor):
+                response = self.paginate(self.queryset, _RESERVATION_ORDERING, cursor=cursor)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.data, {"ok": False, "message": "Invalid cursor."})
+
+
+@override_settings(LIST_COUNT_CAP=5)
+class PageModeTests(ListTestCase):
+    """OFFSET pages, the one-extra-row has_next and the capped counts."""
+
+    ROWS = 8
+
+    @classmethod
+    def setUpTestData(cls):
+        BookingLog.objects.bulk_create(
+            BookingLog(payload={}, phone=f"{PHONE_PREFIX}{n:06d}") for n in range(cls.ROWS)
+        )
+
+    def setUp(self):
+        self.queryset = BookingLog.objects.filter(phone__startswith=PHONE_PREFIX).order_by("id").values("id")
+        self.ids = list(self.queryset.values_list("id", flat=True))
+
+    def page(self, **params):
+        response = self.paginate(self.queryset, ("id",), **params)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_has_next_comes_from_one_extra_row(self):
+        first = self.page(page=1, page_size=3, count=COUNT_EXACT)
+        self.assertEqual([row["id"] for row in first["results"]], self.ids[:3])
+        self.assertEqual((first["has_next"], first["has_previous"]), (True, False))
+
+        last = self.page(page=3, page_size=3, count=COUNT_EXACT)
+        self.assertEqual([row["id"] for row in last["results"]], self.ids[6:])
+        self.assertEqual((last["has_next"], last["has_previous"]), (False, True))
+        self.assertEqual((last["count"], last["count_exact"], last["total_pages"]), (8, True, 3))
+
+        # A full last page: the extra row is what is missing
+        exact_fit = self.page(page=2, page_size=4, count=COUNT_EXACT)
+        self.assertFalse(exact_fit["has_next"])
+
+    def test_out_of_range_page_shows_the_last_page_when_the_count_is_exact(self):
+        data = self.page(page=10, page_size=3, count=COUNT_EXACT)
+        self.assertEqual([row["id"] for row in data["results"]], self.ids[6:])
+
+    def test_estimated_count_over_the_cap(self):
+        data = self.page(page=1, page_size=3, count=COUNT_ESTIMATE)
+        self.assertFalse(data["count_exact"])
+        self.assertGreaterEqual(data["count"], 6)
+        # has_next never depends on the estimate
+        self.assertTrue(data["has_next"])
+
+    def test_count_exact_param(self):
+        data = self.page(page=1, page_size=3, count=COUNT_EXACT)
+        self.assertEqual((data["count"], data["count_exact"]), (self.ROWS, True))
+
+    def test_cursor_mode_counts_only_on_request(self):
+        self.assertNotIn("count", self.page(cursor="", page_size=3))
+        data = self.page(cursor="", page_size=3, with_count="true", count=COUNT_EXACT)
+        self.assertEqual((data["count"], data["count_exact"]), (self.ROWS, True))
+
+    def test_page_size_is_clamped(self):
+        self.assertEqual(len(self.page(page_size=0)["results"]), 1)
+        self.assertEqual(len(self.page(page_size=-5, cursor="")["results"]), 1)
+        with mock.patch.object(pagination, "MAX_PAGE_SIZE", 2):
+            self.assertEqual(len(self.page(page_size=50)["results"]), 2)
+
+    def test_non_integer_page_params_are_rejected(self):
+        for params, message in (
+            ({"page_size": "abc"}, "Invalid page_size."),
+            ({"page": "x"}, "Invalid page."),
+            ({"page_size": "1.5", "cursor": ""}, "Invalid page_size."),
+        ):
+            with self.subTest(params=params):
+                response = self.paginate(self.queryset, ("id",), **params)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.data, {"ok": False, "message": message})
+
+
+@override_settings(LIST_COUNT_CAP=5)
+class CountRowsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        BookingLog.objects.bulk_create(
+            BookingLog(payload={}, phone=f"{PHONE_PREFIX}{n:06d}") for n in range(8)
+        )
+
+    def filtered(self, rows):
+        ids = BookingLog.objects.filter(phone__startswith=PHONE_PREFIX).order_by("id").values_list("id", flat=True)
+        return BookingLog.objects.filter(id__in=list(ids[:rows]))
+
+    def test_filtered_count_under_the_cap_is_exact(self):
+        self.assertEqual(count_rows(self.filtered(5)), (5, True))
+
+    def test_filtered_count_over_the_cap_is_estimated(self):
+        with mock.patch.object(pagination, "_explain_estimate", return_value=2) as explain:
+            # Never below the rows already counted
+            self.assertEqual(count_rows(self.filtered(8)), (6, False))
+        explain.assert_called_once()
+
+    def test_exact_mode_counts_everything(self):
+        self.assertEqual(count_rows(self.filtered(8), COUNT_EXACT), (8, True))
+
+    def test_unfiltered_list_reads_the_table_estimate(self):
+        with mock.patch.object(pagination, "_table_estimate", return_value=123_456):
+            self.assertEqual(count_rows(BookingLog.objects.all()), (123_456, False))
+
+    def test_unanalyzed_table_falls_back_to_the_capped_count(self):
+        with mock.patch.object(pagination, "_table_estimate", return_value=None), \
+                mock.patch.object(pagination, "_explain_estimate", return_value=40) as explain:
+            count, exact = count_rows(BookingLog.objects.all())
+        self.assertFalse(exact)
+        self.assertEqual(count, 40)
+        explain.assert_called_once()
@@ -0,0 +1,27 @@
+"""
+Tests for the per-endpoint SQL query budgets.
+"""
+from django.test import TestCase
+
+from lodore.auth_app.management.commands.check_query_budgets import (
+    DEFAULT_SIZES,
+    api_url_names,
+    budget_coverage_failures,
+    budget_problems,
+    measure,
+)
+from lodore.query_budgets import BUDGETS
+
+
+class QueryBudgetTests(TestCase):
+    """``manage.py check_query_budgets``, so ``manage.py test`` enforces the budgets."""
+
+    def test_every_endpoint_has_a_budget(self):
+        self.assertEqual(budget_coverage_failures(api_url_names()), [])
+
+    def test_endpoints_within_budget(self):
+        names = [name for name in api_url_names() if name in BUDGETS]
+        results = measure(names, *DEFAULT_SIZES)
+        for name in names:
+            with self.subTest(endpoint=name):
+                self.assertEqual(budget_problems(name, results[name]), [])
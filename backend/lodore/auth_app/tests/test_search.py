@@ -0,0 +1,59 @@
+"""
+Tests for the staff list search.
+"""
+from django.db.models import Q
+from django.test import SimpleTestCase
+
+from lodore.auth_app.search import phone_search_term, search_filter
+
+
+class PhoneSearchTermTests(SimpleTestCase):
+    def test_leading_segments_become_05_prefixes(self):
+        cases = {
+            "056": "056",
+            "0512345678": "0512345678",
+            "050 123-45": "05012345",
+            "96656": "056",
+            "966512345678": "0512345678",
+            "+9665123": "05123",
+            "+966 (5) 12": "0512",
+        }
+        for query, prefix in cases.items():
+            with self.subTest(query=query):
+                self.assertEqual(phone_search_term(query), (prefix, True))
+
+    def test_other_digit_runs_are_substring_matches(self):
+        cases = {
+            "5678": "5678",  # last digits
+            "5": "5",
+            "512345678": "512345678",
+            "966": "966",
+            "9661": "9661",
+            "9665": "9665",
+            "+966": "966",
+            "05": "05",
+            "0": "0",
+            "0001": "0001",
+        }
+        for query, term in cases.items():
+            with self.subTest(query=query):
+                self.assertEqual(phone_search_term(query), (term, False))
+
+    def test_text_is_not_a_phone_term(self):
+        for query in ("Sara", "05abc", "محمد", "+"):
+            with self.subTest(query=query):
+                self.assertIsNone(phone_search_term(query))
+
+    def test_search_filter_lookups(self):
+        self.assertEqual(
+            search_filter("9665123", ("name",), ("phone", "other_phone")),
+            Q(phone__startswith="05123") | Q(other_phone__startswith="05123"),
+        )
+        self.assertEqual(
+            search_filter("5678", ("name",), ("phone",)),
+            Q(phone__icontains="5678"),
+        )
+        self.assertEqual(
+            search_filter("Sara", ("name",), ("phone",)),
+            Q(name__icontains="Sara") | Q(phone__icontains="Sara"),
+        )
@@ -27,6 +27,9 @@ import requests
 from django.conf import settings
 from django.core.cache import cache
 
+from lodore.instrumentation import track_external
+from lodore.metrics import UNIFONIC_SEND_SECONDS
+
 logger = logging.getLogger("lodore.unifonic")
 
 # Configurable timeouts (seconds)
@@ -42,7 +45,9 @@ OTP_CODE_LENGTH = 6
 OTP_CACHE_TTL = 600  # 10 minutes
 
 # Unifonic SMS API endpoint
-UNIFONIC_SMS_URL = "https://el.cloud.unifonic.com/rest/SMS/messages"
+UNIFONIC_SMS_URL = getattr(
+    settings, "UNIFONIC_SMS_URL", "https://el.cloud.unifonic.com/rest/SMS/messages"
+)
 
 
 def _is_mock_mode() -> bool:
@@ -221,7 +226,8 @@ def send_otp(phone: str) -> str:
     resp = None
 
     try:
-        resp = requests.post(UNIFONIC_SMS_URL, data=payload, timeout=REQUEST_TIMEOUT)
+        with track_external("unifonic"), UNIFONIC_SEND_SECONDS.time():
+            resp = requests.post(UNIFONIC_SMS_URL, data=payload, timeout=REQUEST_TIMEOUT)
         elapsed_ms = int((time.time() - start_time) * 1000)
 
         status_code = resp.status_code
@@ -5,6 +5,7 @@ Auth endpoints:
   POST /api/auth/token/refresh
   GET  /api/auth/me
 """
+import importlib.util
 import logging
 from django.utils import timezone
 from django.conf import settings
@@ -12,7 +13,6 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError, InvalidToken
 
 from .models import VIPPhone, OTPRequest, InvitedContact
@@ -21,28 +21,92 @@ from .serializers import (
     VerifyOTPSerializer,
     InvitedContactSerializer,
     UpdateInvitedContactStatusSerializer,
+    serialize_rows,
 )
 from .utils import normalize_phone
+from . import vip_profiles
+from .operations import (
+    NOMINATION_LIST_FIELDS,
+    NOMINATION_SEARCH,
+    XLSX_CONTENT_TYPE,
+    OperationError,
+    convert_nominations_to_vip,
+    convert_reservations_to_vip,
+    export_nominations,
+    import_vip_workbook,
+    nominations_export_queryset,
+    submit_invitations,
+    with_inviter_name,
+)
 from .unifonic import send_otp, verify_otp, UnifonicError
-from .jwt_backend import get_tokens_for_phone
-from .authentication import PhoneJWTAuthentication
+from .jwt_backend import get_tokens_for_phone, get_tokens_for_staff, refresh_tokens
+from .authentication import PhoneJWTAuthentication, StaffJWTAuthentication
+from .permissions import IsStaffUser
 from .throttles import RequestOTPThrottle, VerifyOTPThrottle
+from .pagination import paginate
+from .search import annotate_rank, phone_search_term, search_filter
 from django.contrib.auth.models import User
 from django.contrib.auth import authenticate
-from django.core.paginator import Paginator
-from django.db.models import Q
+from django.http import HttpResponse
+from lodore.metrics import observe_unifonic_error
+from lodore.renderers import FastJSONRenderer, JSONOnlyNegotiation, PreSerialized
+from lodore.jobs.api import (
+    accepted_response,
+    enqueue,
+    exceeds_row_threshold,
+    exceeds_upload_threshold,
+)
 
 logger = logging.getLogger("lodore")
 
-# Generic error messages — do NOT reveal VIP membership
-_GENERIC_DENIED = {
+# Generic error messages — do NOT reveal VIP membership (encoded once)
+_GENERIC_DENIED = PreSerialized({
     "ok": False,
     "message": "عذراً، لا يمكننا معالجة طلبك حالياً. تأكد من رقم الجوال وحاول مجدداً.",
-}
-_OTP_INVALID = {
+})
+_OTP_INVALID = PreSerialized({
     "ok": False,
     "message": "رمز التحقق غير صحيح أو انتهت صلاحيته.",
-}
+})
+_OTP_SEND_FAILED = PreSerialized({"ok": False, "message": "تعذر إرسال رمز التحقق. حاول مجدداً."})
+
+# Keyset orderings for the management lists (must end with a unique column)
+_NOMINATION_ORDERING = ("-created_at", "id")
+_RESERVATION_ORDERING = ("-scheduled_at", "-received_at", "id")
+_VIP_ORDERING = ("-created_at", "id")
+
+# Columns selected by the management list endpoints — exactly the response fields
+_RESERVATION_LIST_FIELDS = (
+    "id", "guest_name", "phone", "guest_email",
+    "scheduled_at", "status", "event_type", "received_at",
+)
+_VIP_LIST_FIELDS = (
+    "id", "full_name", "phone", "email", "booked", "bookings_count", "created_at",
+)
+
+# Search box columns: (free-text columns, phone columns)
+_RESERVATION_SEARCH = (("guest_name", "guest_email"), ("phone",))
+_VIP_SEARCH = (("full_name", "email"), ("phone",))
+
+
+def _apply_search(request, queryset, search, ordering, search_fields):
+    """
+    Filter a list queryset by the staff search box.
+
+    Returns the filtered queryset and the ordering to use: ``sort=relevance``
+    ranks free-text matches by trigram similarity ahead of the default order.
+    """
+    text_fields, phone_fields = search_fields
+    queryset = queryset.filter(search_filter(search, text_fields, phone_fields))
+    if request.GET.get("sort") == "relevance" and phone_search_term(search) is None:
+        return annotate_rank(queryset, search, text_fields), ("-rank", *ordering)
+    return queryset, ordering
+
+
+def _ordered_values(queryset, ordering, fields):
+    """Order and project a list queryset, keeping extra ordering keys (e.g. rank)."""
+    extra = [name.lstrip("-") for name in ordering if name.lstrip("-") not in fields]
+    return queryset.order_by(*ordering).values(*fields, *extra)
 
 
 class RequestOTPView(APIView):
@@ -61,6 +125,8 @@ class RequestOTPView(APIView):
     authentication_classes = []   # no auth needed — public endpoint
     permission_classes = [AllowAny]
     throttle_classes = [RequestOTPThrottle]
+    renderer_classes = [FastJSONRenderer]
+    content_negotiation_class = JSONOnlyNegotiation
 
     def post(self, request):
         serializer = RequestOTPSerializer(data=request.data)
@@ -103,10 +169,8 @@ class RequestOTPView(APIView):
             reference_id = send_otp(phone)
         except UnifonicError as exc:
             logger.error("Failed to send OTP for %s: %s", phone, exc)
-            return Response(
-                {"ok": False, "message": "تعذر إرسال رمز التحقق. حاول مجدداً."},
-                status=status.HTTP_502_BAD_GATEWAY,
-            )
+            observe_unifonic_error(exc)
+            return Response(_OTP_SEND_FAILED, status=status.HTTP_502_BAD_GATEWAY)
 
         # --- Expire any previous pending OTPs for this phone ---
         OTPRequest.objects.filter(
@@ -144,6 +208,8 @@ class VerifyOTPView(APIView):
     authentication_classes = []   # no auth needed — public endpoint
     permission_classes = [AllowAny]
     throttle_classes = [VerifyOTPThrottle]
+    renderer_classes = [FastJSONRenderer]
+    content_negotiation_class = JSONOnlyNegotiation
 
     def post(self, request):
         serializer = VerifyOTPSerializer(data=request.data)
@@ -235,10 +301,8 @@ class TokenRefreshView(APIView):
             )
 
         try:
-            token = RefreshToken(refresh_token)
-            access = str(token.access_token)
-            # If ROTATE_REFRESH_TOKENS is True, issue a new refresh token too
-            new_refresh = str(token)
+            # A new refresh token too when ROTATE_REFRESH_TOKENS is on
+            tokens = refresh_tokens(refresh_token)
         except (TokenError, InvalidToken) as exc:
             logger.warning("Token refresh failed: %s", exc)
             return Response(
@@ -246,26 +310,24 @@ class TokenRefreshView(APIView):
                 status=status.HTTP_401_UNAUTHORIZED,
             )
 
-        return Response({"ok": True, "access": access, "refresh": new_refresh})
+        return Response({"ok": True, **tokens})
 
 
 class MeView(APIView):
     """
     GET /api/auth/me
     Protected: requires valid JWT.
-    Returns the authenticated phone number and booking status.
+    Returns the authenticated phone number and booking status, from the
+    cached VIP profile (see vip_profiles).
     """
     authentication_classes = [PhoneJWTAuthentication]
     permission_classes = [IsAuthenticated]
+    renderer_classes = [FastJSONRenderer]
+    content_negotiation_class = JSONOnlyNegotiation
 
     def get(self, request):
         phone = request.user.phone
-        # Check if user has booked
-        try:
-            vip = VIPPhone.objects.get(phone=phone)
-            booked = vip.booked
-        except VIPPhone.DoesNotExist:
-            booked = False
+        booked = vip_profiles.get_profile(phone).get("booked", False)
 
         return Response({"ok": True, "phone": phone, "booked": booked})
 
@@ -305,44 +367,13 @@ class SubmitInvitationsView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Process each contact
-        created_count = 0
-        errors = []
-
-        for contact in contacts:
-            name = contact.get("name", "").strip()
-            phone = contact.get("phone", "").strip()
-
-            if not name or not phone:
-                errors.append(f"الاسم ورقم الهاتف مطلوبان لكل جهة اتصال.")
-                continue
-
-            # Normalize phone
-            try:
-                normalized_phone = normalize_phone(phone)
-            except ValueError:
-                errors.append(f"رقم الهاتف {phone} غير صالح.")
-                continue
-
-            # Check if already invited by this user
-            if InvitedContact.objects.filter(
-                inviter_phone=inviter_phone, invited_phone=normalized_phone
-            ).exists():
-                errors.append(f"تم دعوة {name} ({normalized_phone}) مسبقاً.")
-                continue
-
-            # Check if already a VIP
-            if VIPPhone.objects.filter(phone=normalized_phone).exists():
-                errors.append(f"{name} ({normalized_phone}) هو بالفعل في قائمة VIP.")
-                continue
-
-            # Create invitation
-            InvitedContact.objects.create(
-                inviter_phone=inviter_phone,
-                invited_phone=normalized_phone,
-                invited_name=name,
-            )
-            created_count += 1
+        # Check and insert all contacts together
+        created_count, errors = submit_invitations(
+            inviter_phone,
+            contacts,
+            already_invited="تم دعوة {name} ({phone}) مسبقاً.",
+            already_vip="{name} ({phone}) هو بالفعل في قائمة VIP.",
+        )
 
         if created_count == 0 and errors:
             return Response(
@@ -407,17 +438,16 @@ class StaffLoginView(APIView):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        # Generate JWT tokens
-        refresh = RefreshToken.for_user(user)
-        access = str(refresh.access_token)
+        # Generate JWT tokens (with the staff claim StaffJWTAuthentication reads)
+        tokens = get_tokens_for_staff(user)
 
         logger.info("Staff login successful: %s", username)
 
         return Response(
             {
                 "ok": True,
-                "access": access,
-                "refresh": str(refresh),
+                "access": tokens["access"],
+                "refresh": tokens["refresh"],
                 "username": user.username,
                 "is_superuser": user.is_superuser,
             },
@@ -428,84 +458,42 @@ class StaffLoginView(APIView):
 class NominationsListView(APIView):
     """
     GET /api/management/nominations
-    Query params: search, status, page, page_size
+    Query params: search, sort, status, page, page_size, cursor, with_count, count
 
     Returns paginated list of invited contacts with search/filter.
     Staff only.
     """
-    permission_classes = [IsAuthenticated]
+    authentication_classes = [StaffJWTAuthentication]
+    permission_classes = [IsStaffUser]
+    renderer_classes = [FastJSONRenderer]
+    content_negotiation_class = JSONOnlyNegotiation
 
     def get(self, request):
-        # Check if user is staff
-        if not (request.user.is_staff or request.user.is_superuser):
-            return Response(
-                {"ok": False, "message": "Access denied. Staff only."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
         # Get query parameters
         search = request.GET.get("search", "").strip()
         status_filter = request.GET.get("status", "").strip()
-        page = int(request.GET.get("page", 1))
-        page_size = int(request.GET.get("page_size", 20))
 
         # Build query
         queryset = InvitedContact.objects.all()
+        ordering = _NOMINATION_ORDERING
 
         # Search by name or phone
         if search:
-            queryset = queryset.filter(
-                Q(invited_name__icontains=search) |
-                Q(invited_phone__icontains=search) |
-                Q(inviter_phone__icontains=search)
+            queryset, ordering = _apply_search(
+                request, queryset, search, ordering, NOMINATION_SEARCH
             )
 
         # Filter by status
         if status_filter:
             queryset = queryset.filter(status=status_filter)
 
-        # Order by created_at desc
-        queryset = queryset.order_by("-created_at")
-
-        # Paginate
-        paginator = Paginator(queryset, page_size)
-        page_obj = paginator.get_page(page)
-
-        # Serialize manually
-        results = []
-        for obj in page_obj.object_list:
-            # Get inviter name from VIPPhone
-            inviter_name = ""
-            try:
-                inviter_vip = VIPPhone.objects.get(phone=obj.inviter_phone)
-                inviter_name = inviter_vip.full_name
-            except VIPPhone.DoesNotExist:
-                inviter_name = ""
-
-            results.append({
-                "id": obj.id,
-                "invited_name": obj.invited_name,
-                "invited_phone": obj.invited_phone,
-                "inviter_phone": obj.inviter_phone,
-                "inviter_name": inviter_name,
-                "status": obj.status,
-                "approved": obj.approved,
-                "created_at": obj.created_at.isoformat(),
-            })
-
-        return Response(
-            {
-                "ok": True,
-                "results": results,
-                "count": paginator.count,
-                "page": page,
-                "total_pages": paginator.num_pages,
-                "has_next": page_obj.has_next(),
-                "has_previous": page_obj.has_previous(),
-            },
-            status=status.HTTP_200_OK,
+        # Order by created_at desc, selecting only the response columns
+        queryset = _ordered_values(
+            with_inviter_name(queryset), ordering, NOMINATION_LIST_FIELDS
         )
 
+        return paginate(request, queryset, ordering, serialize_rows)
+
 
 class UpdateNominationStatusView(APIView):
     """
@@ -515,16 +503,10 @@ class UpdateNominationStatusView(APIView):
     Updates the status of a nomination.
     Staff only.
     """
-    permission_classes = [IsAuthenticated]
+    authentication_classes = [StaffJWTAuthentication]
+    permission_classes = [IsStaffUser]
 
     def patch(self, request, nomination_id):
-        # Check if user is staff
-        if not (request.user.is_staff or request.user.is_superuser):
-            return Response(
-                {"ok": False, "message": "Access denied. Staff only."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
         # Validate input
         serializer = UpdateInvitedContactStatusSerializer(data=request.data)
         if not serializer.is_valid():
@@ -563,137 +545,42 @@ class UpdateNominationStatusView(APIView):
 class ExportNominationsView(APIView):
     """
     GET /api/management/nominations/export
-    Query params: search, status
+    Query params: search, status, ids, export_all
 
-    Export nominations to Excel file.
+    Export nominations to Excel file. Exports larger than JOBS_ROW_THRESHOLD
+    are built by a background job (202 with a job id; download it from
+    /api/jobs/<id>/download).
     Staff only.
     """
-    permission_classes = [IsAuthenticated]
+    authentication_classes = [StaffJWTAuthentication]
+    permission_classes = [IsStaffUser]
 
     def get(self, request):
-        # Check if user is staff
-        if not (request.user.is_staff or request.user.is_superuser):
-            return Response(
-                {"ok": False, "message": "Access denied. Staff only."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
-        try:
-            from openpyxl import Workbook
-            from openpyxl.styles import Font, Alignment, PatternFill
-            from django.http import HttpResponse
-            import io
-        except ImportError:
+        if importlib.util.find_spec("openpyxl") is None:
             return Response(
                 {"ok": False, "message": "Excel export not available."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-        # Get query parameters
-        search = request.GET.get("search", "").strip()
-        status_filter = request.GET.get("status", "").strip()
-        ids_param = request.GET.get("ids", "").strip()
-        export_all = request.GET.get("export_all", "").strip().lower() == "true"
-
-        # Build query
-        queryset = InvitedContact.objects.all()
+        params = {
+            key: request.GET.get(key, "")
+            for key in ("search", "status", "ids", "export_all")
+        }
+        try:
+            queryset = nominations_export_queryset(params)
+        except OperationError as exc:
+            return Response({"ok": False, "message": exc.message}, status=exc.status_code)
 
-        # Filter by specific IDs if provided
-        if ids_param and not export_all:
-            try:
-                ids = [int(id.strip()) for id in ids_param.split(',') if id.strip()]
-                queryset = queryset.filter(id__in=ids)
-            except ValueError:
-                return Response(
-                    {"ok": False, "message": "Invalid IDs parameter."},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-        else:
-            # Apply search and status filters (for export_all or when no specific IDs)
-            # Search by name or phone
-            if search:
-                queryset = queryset.filter(
-                    Q(invited_name__icontains=search) |
-                    Q(invited_phone__icontains=search) |
-                    Q(inviter_phone__icontains=search)
-                )
+        # Bounded count: only whether the export is over the threshold matters
+        threshold = settings.JOBS_ROW_THRESHOLD
+        if threshold and exceeds_row_threshold(queryset.order_by()[:threshold + 1].count()):
+            job = enqueue("nominations_export", params=params, user=request.user)
+            logger.info("Nominations export queued as job %s by %s", job.pk, request.user.username)
+            return accepted_response(job)
 
-            # Filter by status
-            if status_filter:
-                queryset = queryset.filter(status=status_filter)
-
-        # Order by created_at desc
-        queryset = queryset.order_by("-created_at")
-
-        # Create workbook
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "ترشيحات الضيوف"
-
-        # Define headers (Arabic RTL)
-        headers = ["اسم الضيف", "رقم الضيف", "اسم المرشِّح", "رقم المرشِّح", "الحالة", "موافقة", "تاريخ الإنشاء"]
-
-        # Style for header
-        header_fill = PatternFill(start_color="C4955A", end_color="C4955A", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF", size=12)
-        header_alignment = Alignment(horizontal="center", vertical="center")
-
-        # Add headers
-        for col_num, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_num, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = header_alignment
-
-        # Add data
-        row_num = 2
-        for nomination in queryset:
-            # Get inviter name
-            inviter_name = ""
-            try:
-                inviter_vip = VIPPhone.objects.get(phone=nomination.inviter_phone)
-                inviter_name = inviter_vip.full_name
-            except VIPPhone.DoesNotExist:
-                inviter_name = ""
-
-            # Status labels in Arabic
-            status_labels = {
-                "pending": "قيد الانتظار",
-                "contacted": "تم التواصل",
-                "invited": "تم الدعوة",
-                "confirmed": "مؤكد",
-            }
-
-            ws.cell(row=row_num, column=1, value=nomination.invited_name)
-            ws.cell(row=row_num, column=2, value=nomination.invited_phone)
-            ws.cell(row=row_num, column=3, value=inviter_name)
-            ws.cell(row=row_num, column=4, value=nomination.inviter_phone)
-            ws.cell(row=row_num, column=5, value=status_labels.get(nomination.status, nomination.status))
-            ws.cell(row=row_num, column=6, value="نعم" if nomination.approved else "لا")
-            ws.cell(row=row_num, column=7, value=nomination.created_at.strftime("%Y-%m-%d %H:%M"))
-
-            row_num += 1
-
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 20
-        ws.column_dimensions['B'].width = 15
-        ws.column_dimensions['C'].width = 20
-        ws.column_dimensions['D'].width = 15
-        ws.column_dimensions['E'].width = 15
-        ws.column_dimensions['F'].width = 10
-        ws.column_dimensions['G'].width = 18
-
-        # Save to BytesIO
-        excel_file = io.BytesIO()
-        wb.save(excel_file)
-        excel_file.seek(0)
-
-        # Create response
-        response = HttpResponse(
-            excel_file.read(),
-            content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-        )
-        response["Content-Disposition"] = f'attachment; filename="nominations_{timezone.now().strftime("%Y-%m-%d")}.xlsx"'
+        filename, data = export_nominations(params)
+        response = HttpResponse(data, content_type=XLSX_CONTENT_TYPE)
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
 
         logger.info("Nominations exported to Excel by %s", request.user.username)
 
@@ -703,21 +590,17 @@ class ExportNominationsView(APIView):
 class ReservationsListView(APIView):
     """
     GET /api/management/reservations
-    Query params: search, status, date_from, date_to, page, page_size
+    Query params: search, sort, status, date_from, date_to, page, page_size, cursor, with_count, count
 
     Returns paginated list of reservations/bookings.
     Staff only.
     """
-    permission_classes = [IsAuthenticated]
+    authentication_classes = [StaffJWTAuthentication]
+    permission_classes = [IsStaffUser]
+    renderer_classes = [FastJSONRenderer]
+    content_negotiation_class = JSONOnlyNegotiation
 
     def get(self, request):
-        # Check if user is staff
-        if not (request.user.is_staff or request.user.is_superuser):
-            return Response(
-                {"ok": False, "message": "Access denied. Staff only."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
         from lodore.calendly_app.models import BookingLog
         from datetime import datetime, timedelta
         from django.utils import timezone
@@ -727,18 +610,15 @@ class ReservationsListView(APIView):
         status_filter = request.GET.get("status", "").strip()
         date_from = request.GET.get("date_from", "").strip()
         date_to = request.GET.get("date_to", "").strip()
-        page = int(request.GET.get("page", 1))
-        page_size = int(request.GET.get("page_size", 20))
 
         # Build query
         queryset = BookingLog.objects.all()
+        ordering = _RESERVATION_ORDERING
 
         # Search by name, phone, or email
         if search:
-            queryset = queryset.filter(
-                Q(guest_name__icontains=search) |
-                Q(phone__icontains=search) |
-                Q(guest_email__icontains=search)
+            queryset, ordering = _apply_search(
+                request, queryset, search, ordering, _RESERVATION_SEARCH
             )
 
         # Filter by status
@@ -766,38 +646,14 @@ class ReservationsListView(APIView):
             except (ValueError, TypeError):
                 pass
 
-        # Order by scheduled_at desc
-        queryset = queryset.order_by("-scheduled_at", "-received_at")
-
-        # Paginate
-        paginator = Paginator(queryset, page_size)
-        page_obj = paginator.get_page(page)
-
-        # Serialize
-        results = []
-        for obj in page_obj.object_list:
-            results.append({
-                "id": obj.id,
-                "guest_name": obj.guest_name,
-                "phone": obj.phone,
-                "guest_email": obj.guest_email,
-                "scheduled_at": obj.scheduled_at.isoformat() if obj.scheduled_at else None,
-                "status": obj.status,
-                "event_type": obj.event_type,
-                "received_at": obj.received_at.isoformat(),
-            })
+        # Order by scheduled_at desc; never pull the raw payload column
+        queryset = _ordered_values(queryset, ordering, _RESERVATION_LIST_FIELDS)
 
-        return Response(
-            {
-                "ok": True,
-                "results": results,
-                "count": paginator.count,
-                "page": page,
-                "total_pages": paginator.num_pages,
-                "has_next": page_obj.has_next(),
-                "has_previous": page_obj.has_previous(),
-            },
-            status=status.HTTP_200_OK,
+        return paginate(
+            request,
+            queryset,
+            ordering,
+            lambda rows: serialize_rows(rows, datetime_fields=("scheduled_at", "received_at")),
         )
 
 class ConvertToVIPView(APIView):
@@ -805,24 +661,15 @@ class ConvertToVIPView(APIView):
     POST /api/management/reservations/convert-to-vip
     Body: { "ids": [1, 2, 3] }
 
-    Convert selected reservation guests to VIP customers.
+    Convert selected reservation guests to VIP customers. More than JOBS_ROW_THRESHOLD
+    ids are converted by a background job (202 with a job id).
     Staff only.
     """
-    permission_classes = [IsAuthenticated]
+    authentication_classes = [StaffJWTAuthentication]
+    permission_classes = [IsStaffUser]
 
     def post(self, request):
-        # Check if user is staff
-        if not (request.user.is_staff or request.user.is_superuser):
-            return Response(
-                {"ok": False, "message": "Access denied. Staff only."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
-        from lodore.calendly_app.models import BookingLog
-        import logging
-        logger = logging.getLogger("lodore")
-
-        # Get reservation IDs from request
+        # Get IDs from request
         ids = request.data.get("ids", [])
         if not ids or not isinstance(ids, list):
             return Response(
@@ -830,74 +677,16 @@ class ConvertToVIPView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Get reservations
-        reservations = BookingLog.objects.filter(id__in=ids)
-        if not reservations.exists():
-            return Response(
-                {"ok": False, "message": "No reservations found with provided IDs."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
-
-        # Convert to VIP
-        created_count = 0
-        updated_count = 0
-        skipped_count = 0
-        errors = []
-
-        for reservation in reservations:
-            phone = reservation.phone
-            name = reservation.guest_name
-            email = reservation.guest_email
-
-            if not phone:
-                skipped_count += 1
-                errors.append(f"Reservation #{reservation.id}: No phone number")
-                continue
+        if exceeds_row_threshold(len(ids)):
+            job = enqueue("reservations_to_vip", params={"ids": ids}, user=request.user)
+            return accepted_response(job)
 
-            try:
-                # Create or update VIPPhone
-                vip, created = VIPPhone.objects.update_or_create(
-                    phone=phone,
-                    defaults={
-                        "full_name": name or "",
-                        "email": email or "",
-                    }
-                )
-
-                if created:
-                    created_count += 1
-                    logger.info(f"Created VIP customer: {phone} - {name}")
-                else:
-                    updated_count += 1
-                    logger.info(f"Updated VIP customer: {phone} - {name}")
-
-            except Exception as e:
-                skipped_count += 1
-                errors.append(f"Reservation #{reservation.id} ({phone}): {str(e)}")
-                logger.error(f"Failed to convert {phone} to VIP: {e}")
-
-        # Build response message
-        message_parts = []
-        if created_count > 0:
-            message_parts.append(f"{created_count} عميل جديد")
-        if updated_count > 0:
-            message_parts.append(f"{updated_count} عميل محدث")
-        if skipped_count > 0:
-            message_parts.append(f"{skipped_count} تم تخطيه")
-
-        message = "تم تحويل الضيوف إلى VIP: " + "، ".join(message_parts)
+        try:
+            result = convert_reservations_to_vip(ids)
+        except OperationError as exc:
+            return Response({"ok": False, "message": exc.message}, status=exc.status_code)
 
-        return Response(
-            {
-                "ok": True,
-                "message": message,
-                "created": created_count,
-                "updated": updated_count,
-                "skipped": skipped_count,
-                "errors": errors,
-            },
-            status=status.HTTP_200_OK,
-        )
+        return Response(result, status=status.HTTP_200_OK)
 
 
 class ConvertNominationsToVIPView(APIView):
@@ -905,23 +694,15 @@ class ConvertNominationsToVIPView(APIView):
     POST /api/management/nominations/convert-to-vip
     Body: { "ids": [1, 2, 3] }
 
-    Convert selected guest nominations to VIP customers.
+    Convert selected guest nominations to VIP customers. More than JOBS_ROW_THRESHOLD
+    ids are converted by a background job (202 with a job id).
     Staff only.
     """
-    permission_classes = [IsAuthenticated]
+    authentication_classes = [StaffJWTAuthentication]
+    permission_classes = [IsStaffUser]
 
     def post(self, request):
-        # Check if user is staff
-        if not (request.user.is_staff or request.user.is_superuser):
-            return Response(
-                {"ok": False, "message": "Access denied. Staff only."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
-        import logging
-        logger = logging.getLogger("lodore")
-
-        # Get nomination IDs from request
+        # Get IDs from request
         ids = request.data.get("ids", [])
         if not ids or not isinstance(ids, list):
             return Response(
@@ -929,73 +710,16 @@ class ConvertNominationsToVIPView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Get nominations
-        nominations = InvitedContact.objects.filter(id__in=ids)
-        if not nominations.exists():
-            return Response(
-                {"ok": False, "message": "No nominations found with provided IDs."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
-
-        # Convert to VIP
-        created_count = 0
-        updated_count = 0
-        skipped_count = 0
-        errors = []
-
-        for nomination in nominations:
-            phone = nomination.invited_phone
-            name = nomination.invited_name
+        if exceeds_row_threshold(len(ids)):
+            job = enqueue("nominations_to_vip", params={"ids": ids}, user=request.user)
+            return accepted_response(job)
 
-            if not phone:
-                skipped_count += 1
-                errors.append(f"Nomination #{nomination.id}: No phone number")
-                continue
-
-            try:
-                # Create or update VIPPhone
-                vip, created = VIPPhone.objects.update_or_create(
-                    phone=phone,
-                    defaults={
-                        "full_name": name or "",
-                        "email": "",
-                    }
-                )
+        try:
+            result = convert_nominations_to_vip(ids)
+        except OperationError as exc:
+            return Response({"ok": False, "message": exc.message}, status=exc.status_code)
 
-                if created:
-                    created_count += 1
-                    logger.info(f"Created VIP from nomination: {phone} - {name}")
-                else:
-                    updated_count += 1
-                    logger.info(f"Updated VIP from nomination: {phone} - {name}")
-
-            except Exception as e:
-                skipped_count += 1
-                errors.append(f"Nomination #{nomination.id} ({phone}): {str(e)}")
-                logger.error(f"Failed to convert nomination {phone} to VIP: {e}")
-
-        # Build response message
-        message_parts = []
-        if created_count > 0:
-            message_parts.append(f"{created_count} عميل جديد")
-        if updated_count > 0:
-            message_parts.append(f"{updated_count} عميل محدث")
-        if skipped_count > 0:
-            message_parts.append(f"{skipped_count} تم تخطيه")
-
-        message = "تم تحويل الضيوف إلى VIP: " + "، ".join(message_parts)
-
-        return Response(
-            {
-                "ok": True,
-                "message": message,
-                "created": created_count,
-                "updated": updated_count,
-                "skipped": skipped_count,
-                "errors": errors,
-            },
-            status=status.HTTP_200_OK,
-        )
+        return Response(result, status=status.HTTP_200_OK)
 
 
 class UploadVIPDataView(APIView):
@@ -1007,19 +731,16 @@ class UploadVIPDataView(APIView):
     - الاسم or Name (required)
     - الجوال or Phone (required)
     - البريد الإلكتروني or Email (optional)
+
+    Files larger than JOBS_UPLOAD_BYTES_THRESHOLD are imported by a
+    background job (202 with a job id).
     
     Staff only.
     """
-    permission_classes = [IsAuthenticated]
+    authentication_classes = [StaffJWTAuthentication]
+    permission_classes = [IsStaffUser]
 
     def post(self, request):
-        # Check if user is staff
-        if not (request.user.is_staff or request.user.is_superuser):
-            return Response(
-                {"ok": False, "message": "Access denied. Staff only."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
         # Check if file was uploaded
         if 'file' not in request.FILES:
             return Response(
@@ -1036,111 +757,21 @@ class UploadVIPDataView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        try:
-            from openpyxl import load_workbook
-            import io
-        except ImportError:
+        if importlib.util.find_spec("openpyxl") is None:
             return Response(
                 {"ok": False, "message": "Excel processing not available."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-        try:
-            # Load workbook
-            wb = load_workbook(io.BytesIO(file.read()))
-            ws = wb.active
-
-            # Find header row and column mapping
-            headers = {}
-            for col_idx, cell in enumerate(ws[1], start=1):
-                header = str(cell.value or "").strip().lower()
-                if header in ['الاسم', 'name', 'الاسم الكامل', 'full name']:
-                    headers['name'] = col_idx
-                elif header in ['الجوال', 'phone', 'رقم الجوال', 'mobile', 'الهاتف']:
-                    headers['phone'] = col_idx
-                elif header in ['البريد الإلكتروني', 'email', 'البريد', 'الإيميل']:
-                    headers['email'] = col_idx
-
-            # Validate required columns
-            if 'phone' not in headers:
-                return Response(
-                    {"ok": False, "message": "Missing required column: Phone number (الجوال or Phone)"},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-
-            # Process rows
-            created_count = 0
-            updated_count = 0
-            skipped_count = 0
-            errors = []
-
-            for row_idx, row in enumerate(ws.iter_rows(min_row=2, values_only=True), start=2):
-                if not row or all(cell is None or str(cell).strip() == '' for cell in row):
-                    continue
-
-                try:
-                    # Extract data
-                    phone_raw = str(row[headers['phone'] - 1] or "").strip()
-                    name = str(row[headers.get('name', 1) - 1] or "").strip() if 'name' in headers else ""
-                    email = str(row[headers.get('email', 1) - 1] or "").strip() if 'email' in headers else ""
-
-                    if not phone_raw:
-                        skipped_count += 1
-                        errors.append(f"Row {row_idx}: No phone number")
-                        continue
-
-                    # Normalize phone
-                    phone = normalize_phone(phone_raw)
-
-                    # Create or update VIPPhone
-                    vip, created = VIPPhone.objects.update_or_create(
-                        phone=phone,
-                        defaults={
-                            "full_name": name,
-                            "email": email,
-                        }
-                    )
-
-                    if created:
-                        created_count += 1
-                        logger.info(f"Created VIP from Excel: {phone} - {name}")
-                    else:
-                        updated_count += 1
-                        logger.info(f"Updated VIP from Excel: {phone} - {name}")
-
-                except ValueError as e:
-                    skipped_count += 1
-                    errors.append(f"Row {row_idx}: Invalid phone number - {phone_raw}")
-                except Exception as e:
-                    skipped_count += 1
-                    errors.append(f"Row {row_idx}: {str(e)}")
-
-            # Build response message
-            message_parts = []
-            if created_count > 0:
-                message_parts.append(f"{created_count} عميل جديد")
-            if updated_count > 0:
-                message_parts.append(f"{updated_count} عميل محدث")
-            if skipped_count > 0:
-                message_parts.append(f"{skipped_count} تم تخطيه")
-
-            message = "تم رفع البيانات: " + "، ".join(message_parts) if message_parts else "لم يتم معالجة أي بيانات"
-
-            logger.info(f"VIP Excel upload by {request.user.username}: {created_count} created, {updated_count} updated, {skipped_count} skipped")
-
-            return Response(
-                {
-                    "ok": True,
-                    "message": message,
-                    "created": created_count,
-                    "updated": updated_count,
-                    "skipped": skipped_count,
-                    "errors": errors[:20],  # Limit errors to first 20
-                    "total_errors": len(errors),
-                },
-                status=status.HTTP_200_OK,
-            )
+        if exceeds_upload_threshold(file.size):
+            job = enqueue("vip_upload", input_data=file.read(), input_name=file.name, user=request.user)
+            logger.info("VIP Excel upload queued as job %s by %s", job.pk, request.user.username)
+            return accepted_response(job)
 
+        try:
+            result = import_vip_workbook(file.read())
+        except OperationError as exc:
+            return Response({"ok": False, "message": exc.message}, status=exc.status_code)
         except Exception as e:
             logger.error(f"Excel upload error: {e}")
             return Response(
@@ -1148,73 +779,42 @@ class UploadVIPDataView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+        logger.info(f"VIP Excel upload by {request.user.username}: {result['created']} created, {result['updated']} updated, {result['skipped']} skipped")
+
+        return Response(result, status=status.HTTP_200_OK)
+
 
 class VIPListView(APIView):
     """
     GET /api/management/vip/list
-    Query params: search, page, page_size
+    Query params: search, sort, page, page_size, cursor, with_count, count
 
     Returns paginated list of VIP customers.
     Staff only.
     """
-    permission_classes = [IsAuthenticated]
+    authentication_classes = [StaffJWTAuthentication]
+    permission_classes = [IsStaffUser]
+    renderer_classes = [FastJSONRenderer]
+    content_negotiation_class = JSONOnlyNegotiation
 
     def get(self, request):
-        # Check if user is staff
-        if not (request.user.is_staff or request.user.is_superuser):
-            return Response(
-                {"ok": False, "message": "Access denied. Staff only."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
         # Get query parameters
         search = request.GET.get("search", "").strip()
-        page = int(request.GET.get("page", 1))
-        page_size = int(request.GET.get("page_size", 20))
 
         # Build query
         queryset = VIPPhone.objects.all()
+        ordering = _VIP_ORDERING
 
         # Search by name, phone, or email
         if search:
-            queryset = queryset.filter(
-                Q(full_name__icontains=search) |
-                Q(phone__icontains=search) |
-                Q(email__icontains=search)
+            queryset, ordering = _apply_search(
+                request, queryset, search, ordering, _VIP_SEARCH
             )
 
-        # Order by created_at desc
-        queryset = queryset.order_by("-created_at")
-
-        # Paginate
-        paginator = Paginator(queryset, page_size)
-        page_obj = paginator.get_page(page)
-
-        # Serialize
-        results = []
-        for obj in page_obj.object_list:
-            results.append({
-                "id": obj.id,
-                "full_name": obj.full_name,
-                "phone": obj.phone,
-                "email": obj.email,
-                "booked": obj.booked,
-                "bookings_count": obj.bookings_count,
-                "created_at": obj.created_at.isoformat(),
-            })
+        # Order by created_at desc, selecting only the response columns
+        queryset = _ordered_values(queryset, ordering, _VIP_LIST_FIELDS)
 
-        return Response(
-            {
-                "ok": True,
-                "results": results,
-                "count": paginator.count,
-                "page": page,
-                "total_pages": paginator.num_pages,
-                "has_next": page_obj.has_next(),
-                "has_previous": page_obj.has_previous(),
-            },
-            status=status.HTTP_200_OK,
-        )
+        return paginate(request, queryset, ordering, serialize_rows)
 
 
 class ManageVIPView(APIView):
@@ -1225,16 +825,10 @@ class ManageVIPView(APIView):
     Add or update VIP customer.
     Staff only.
     """
-    permission_classes = [IsAuthenticated]
+    authentication_classes = [StaffJWTAuthentication]
+    permission_classes = [IsStaffUser]
 
     def post(self, request):
-        # Check if user is staff
-        if not (request.user.is_staff or request.user.is_superuser):
-            return Response(
-                {"ok": False, "message": "Access denied. Staff only."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
         phone = request.data.get("phone", "").strip()
         full_name = request.data.get("full_name", "").strip()
         email = request.data.get("email", "").strip()
@@ -1257,6 +851,7 @@ class ManageVIPView(APIView):
                     "email": email,
                 }
             )
+            vip_profiles.refresh([vip.phone])
 
             logger.info(
                 f"VIP {'created' if created else 'updated'} by {request.user.username}: {phone} - {full_name}"
@@ -1298,21 +893,16 @@ class DeleteVIPView(APIView):
     Delete VIP customer.
     Staff only.
     """
-    permission_classes = [IsAuthenticated]
+    authentication_classes = [StaffJWTAuthentication]
+    permission_classes = [IsStaffUser]
 
     def delete(self, request, vip_id):
-        # Check if user is staff
-        if not (request.user.is_staff or request.user.is_superuser):
-            return Response(
-                {"ok": False, "message": "Access denied. Staff only."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
         try:
             vip = VIPPhone.objects.get(id=vip_id)
             phone = vip.phone
             name = vip.full_name
             vip.delete()
+            vip_profiles.refresh([phone])
 
             logger.info(f"VIP deleted by {request.user.username}: {phone} - {name}")
 
@@ -1355,9 +945,8 @@ class VisitorNominationsView(APIView):
         # Normalize submitter phone if provided
         normalized_submitter = None
         if submitter_phone:
-            try:
-                normalized_submitter = normalize_phone(submitter_phone)
-            except ValueError:
+            normalized_submitter = normalize_phone(submitter_phone)
+            if not normalized_submitter:
                 return Response(
                     {"ok": False, "message": "رقم جوالك غير صالح."},
                     status=status.HTTP_400_BAD_REQUEST,
@@ -1385,45 +974,13 @@ class VisitorNominationsView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Process each contact
-        created_count = 0
-        errors = []
-
-        for contact in contacts:
-            name = contact.get("name", "").strip()
-            phone = contact.get("phone", "").strip()
-
-            if not name or not phone:
-                errors.append(f"الاسم ورقم الهاتف مطلوبان لكل جهة اتصال.")
-                continue
-
-            # Normalize phone
-            try:
-                normalized_phone = normalize_phone(phone)
-            except ValueError:
-                errors.append(f"رقم الهاتف {phone} غير صالح.")
-                continue
-
-            # Check if already invited by this inviter
-            if InvitedContact.objects.filter(
-                inviter_phone=inviter_phone, invited_phone=normalized_phone
-            ).exists():
-                errors.append(f"تم ترشيح {name} ({normalized_phone}) مسبقاً.")
-                continue
-
-            # Check if already a VIP
-            if VIPPhone.objects.filter(phone=normalized_phone).exists():
-                errors.append(f"{name} ({normalized_phone}) موجود بالفعل في قائمة VIP.")
-                continue
-
-            # Create invitation
-            InvitedContact.objects.create(
-                inviter_phone=inviter_phone,
-                invited_phone=normalized_phone,
-                invited_name=name,
-                approved=False,  # Requires admin approval
-            )
-            created_count += 1
+        # Check and insert all contacts together
+        created_count, errors = submit_invitations(
+            inviter_phone,
+            contacts,
+            already_invited="تم ترشيح {name} ({phone}) مسبقاً.",
+            already_vip="{name} ({phone}) موجود بالفعل في قائمة VIP.",
+        )
 
         if created_count == 0 and errors:
             return Response(
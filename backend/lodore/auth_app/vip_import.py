@@ -0,0 +1,221 @@
+"""
+Batched VIPPhone upserts shared by the VIP import commands.
+
+``apply_vip_batch`` takes already-normalized ``(phone, full_name)`` pairs
+and costs one SELECT for the existing phones of the batch, one bulk INSERT
+for new phones and one chunked bulk UPDATE for rows that actually change.
+
+``copy_vips`` is the fast path for very large lists: COPY into a staging
+table and a single set-based merge.
+
+All three refresh the cached profiles (vip_profiles) of the VIPs they write.
+"""
+import uuid
+
+from django.db import connection, transaction
+
+from . import vip_profiles
+from .models import VIPPhone
+
+# Existing VIPs: only set the name when it is blank (import_vips) or
+# whenever the import has a different non-empty one (import_vip_customers)
+NAMES_FILL_BLANK = "fill_blank"
+NAMES_REPLACE = "replace"
+
+UPDATE_BATCH_SIZE = 500
+
+
+def apply_vip_batch(rows, names=NAMES_FILL_BLANK, reset_booked=False, dry_run=False) -> dict:
+    """
+    Upsert one batch of ``(phone, full_name)`` pairs.
+
+    With ``reset_booked`` existing VIPs also get booked=False and
+    bookings_count=0. Returns ``{"created", "updated", "skipped"}`` counts;
+    with ``dry_run`` the counts are computed but nothing is written.
+    """
+    total = 0
+    latest = {}
+    for phone, full_name in rows:
+        total += 1
+        # Repeated phones in one batch: keep the last non-empty name
+        if full_name or phone not in latest:
+            latest[phone] = full_name
+
+    existing = {
+        phone: (pk, current_name, booked, bookings_count)
+        for pk, phone, current_name, booked, bookings_count in VIPPhone.objects.filter(
+            phone__in=list(latest)
+        ).values_list("id", "phone", "full_name", "booked", "bookings_count")
+    }
+
+    new_rows, changed_rows = [], []
+    for phone, full_name in latest.items():
+        if phone not in existing:
+            new_rows.append(VIPPhone(phone=phone, full_name=full_name))
+            continue
+
+        pk, current_name, booked, bookings_count = existing[phone]
+        name = current_name
+        if full_name and (
+            (names == NAMES_FILL_BLANK and not current_name)
+            or (names == NAMES_REPLACE and current_name != full_name)
+        ):
+            name = full_name
+        if name != current_name or (reset_booked and (booked or bookings_count)):
+            # booked / bookings_count are only written with reset_booked
+            changed_rows.append(VIPPhone(id=pk, phone=phone, full_name=name, booked=False, bookings_count=0))
+
+    if not dry_run:
+        fields = ["full_name", "booked", "bookings_count"] if reset_booked else ["full_name"]
+        with transaction.atomic():
+            VIPPhone.objects.bulk_create(new_rows, ignore_conflicts=True)
+            VIPPhone.objects.bulk_update(changed_rows, fields, batch_size=UPDATE_BATCH_SIZE)
+            vip_profiles.refresh(row.phone for row in new_rows + changed_rows)
+
+    return {
+        "created": len(new_rows),
+        "updated": len(changed_rows),
+        "skipped": total - len(new_rows) - len(changed_rows),
+    }
+
+
+def upsert_vip_contacts(rows) -> dict:
+    """
+    Upsert ``(phone, full_name, email)`` rows, overwriting name and email
+    (the Excel upload and convert-to-VIP). Rows for phones that already exist, including
+    repeats within ``rows``, count as updated; the last row per phone wins.
+    """
+    rows = list(rows)
+    latest = {phone: (full_name, email) for phone, full_name, email in rows}
+    existing = dict(
+        VIPPhone.objects.filter(phone__in=list(latest)).values_list("phone", "id")
+    )
+
+    new_rows, changed_rows = [], []
+    for phone, (full_name, email) in latest.items():
+        if phone in existing:
+            changed_rows.append(VIPPhone(id=existing[phone], full_name=full_name, email=email))
+        else:
+            new_rows.append(VIPPhone(phone=phone, full_name=full_name, email=email))
+
+    with transaction.atomic():
+        VIPPhone.objects.bulk_create(new_rows, ignore_conflicts=True)
+        VIPPhone.objects.bulk_update(
+            changed_rows, ["full_name", "email"], batch_size=UPDATE_BATCH_SIZE
+        )
+        vip_profiles.refresh(latest)
+
+    return {"created": len(new_rows), "updated": len(rows) - len(new_rows)}
+
+
+class _CopyStream:
+    """
+    File-like object feeding ``(phone, full_name)`` pairs to COPY ... FROM
+    STDIN in text format, numbering rows so the merge can tell which came
+    last.
+    """
+
+    def __init__(self, rows):
+        self._rows = iter(rows)
+        self._buffer = ""
+        self.count = 0
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        return (
+            value.replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+
+    def read(self, size=-1):
+        target = size if size and size > 0 else 1 << 16
+        parts = [self._buffer]
+        length = len(self._buffer)
+        for phone, full_name in self._rows:
+            self.count += 1
+            line = f"{self.count}\t{self._escape(phone)}\t{self._escape(full_name)}\n"
+            parts.append(line)
+            length += len(line)
+            if length >= target:
+                break
+        data = "".join(parts)
+        self._buffer = data[target:]
+        return data[:target]
+
+
+def copy_vips(rows, reset_booked=False, dry_run=False) -> dict:
+    """
+    Load ``(phone, full_name)`` pairs with COPY and merge them in one
+    statement, with the same semantics as ``apply_vip_batch`` in
+    fill-blank mode (last non-empty name per phone wins).
+
+    Rows are streamed through ``copy_expert`` into an UNLOGGED staging
+    table, then merged with INSERT ... SELECT ... ON CONFLICT (phone)
+    DO UPDATE; created/updated counts come from RETURNING (xmax = 0 marks
+    an inserted row). PostgreSQL only.
+    """
+    table = VIPPhone._meta.db_table
+    staging = f"{table}_staging_{uuid.uuid4().hex[:12]}"
+
+    needs_update = f"({table}.full_name = '' AND EXCLUDED.full_name <> '')"
+    assignments = [
+        f"full_name = CASE WHEN {needs_update} THEN EXCLUDED.full_name ELSE {table}.full_name END"
+    ]
+    if reset_booked:
+        needs_update += f" OR {table}.booked OR {table}.bookings_count <> 0"
+        assignments += ["booked = FALSE", "bookings_count = 0"]
+
+    source = f"""
+        SELECT DISTINCT ON (phone) phone, full_name
+        FROM {staging}
+        ORDER BY phone, (full_name <> '') DESC, seq DESC
+    """
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE UNLOGGED TABLE {staging} ("
+            "seq bigint NOT NULL, phone varchar(20) NOT NULL, full_name varchar(200) NOT NULL)"
+        )
+        try:
+            stream = _CopyStream(rows)
+            cursor.copy_expert(f"COPY {staging} (seq, phone, full_name) FROM STDIN", stream)
+            cursor.execute(f"ANALYZE {staging}")
+
+            if dry_run:
+                cursor.execute(
+                    f"""
+                    SELECT COUNT(*) FILTER (WHERE {table}.id IS NULL),
+                           COUNT(*) FILTER (WHERE {table}.id IS NOT NULL AND ({needs_update}))
+                    FROM ({source}) AS EXCLUDED
+                    LEFT JOIN {table} ON {table}.phone = EXCLUDED.phone
+                    """
+                )
+            else:
+                cursor.execute(
+                    f"""
+                    WITH merged AS (
+                        INSERT INTO {table}
+                            (phone, full_name, email, booked, bookings_count, created_at)
+                        SELECT phone, full_name, '', FALSE, 0, now() FROM ({source}) AS src
+                        ON CONFLICT (phone) DO UPDATE SET {", ".join(assignments)}
+                        WHERE {needs_update}
+                        RETURNING (xmax = 0) AS inserted
+                    )
+                    SELECT COUNT(*) FILTER (WHERE inserted), COUNT(*) FILTER (WHERE NOT inserted)
+                    FROM merged
+                    """
+                )
+            created, updated = cursor.fetchone()
+            if not dry_run:
+                # The merged phones never reach Python; drop every cached profile
+                vip_profiles.clear()
+        finally:
+            cursor.execute(f"DROP TABLE IF EXISTS {staging}")
+
+    return {
+        "created": created,
+        "updated": updated,
+        "skipped": stream.count - created - updated,
+    }
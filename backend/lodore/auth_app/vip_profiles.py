@@ -0,0 +1,89 @@
+"""
+Cached VIP profiles for GET /api/auth/me.
+
+A phone's profile is ``{"booked", "bookings_count", "full_name"}``, or
+``{}`` when the phone is not a VIP. Profiles live in the "vip_profiles"
+cache alias, which is Redis when REDIS_URL is set and a no-op cache
+otherwise (every call then reads the database, as before).
+
+Readers fill a missing entry with ``add()``. Every code path that writes
+VIPPhone rows calls ``refresh()`` with the phones it touched: once the
+transaction commits, the rows are re-read and the entries overwritten
+with ``set()``, so a reader that loaded a row just before the write
+cannot put the old profile back. Set-based imports that don't know their
+phones call ``clear()`` instead. Entries also expire after
+VIP_PROFILE_CACHE_SECONDS.
+"""
+import logging
+
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.db import transaction
+
+from .models import VIPPhone
+
+logger = logging.getLogger("lodore")
+
+PROFILE_FIELDS = ("booked", "bookings_count", "full_name")
+# Phones re-read per query in refresh()
+REFRESH_BATCH_SIZE = 1000
+
+
+def _cache():
+    return caches["vip_profiles"]
+
+
+def _load(phone: str) -> dict:
+    return VIPPhone.objects.filter(phone=phone).values(*PROFILE_FIELDS).first() or {}
+
+
+def get_profile(phone: str) -> dict:
+    """The cached profile of ``phone``, loading it on a miss."""
+    cache = _cache()
+    try:
+        profile = cache.get(phone)
+    except Exception as exc:
+        logger.warning("VIP profile cache unavailable: %s", exc)
+        return _load(phone)
+    if profile is None:
+        profile = _load(phone)
+        try:
+            cache.add(phone, profile)
+        except Exception as exc:
+            logger.warning("VIP profile cache unavailable: %s", exc)
+    return profile
+
+
+def refresh(phones):
+    """Re-cache the profiles of ``phones`` once the current transaction commits."""
+    if isinstance(_cache(), DummyCache):
+        return
+    phones = sorted({phone for phone in phones if phone})
+    if phones:
+        transaction.on_commit(lambda: _reload(phones))
+
+
+def clear():
+    """Drop every cached profile once the current transaction commits."""
+    if not isinstance(_cache(), DummyCache):
+        transaction.on_commit(_clear)
+
+
+def _reload(phones):
+    cache = _cache()
+    try:
+        for start in range(0, len(phones), REFRESH_BATCH_SIZE):
+            batch = phones[start:start + REFRESH_BATCH_SIZE]
+            profiles = {phone: {} for phone in batch}
+            for row in VIPPhone.objects.filter(phone__in=batch).values("phone", *PROFILE_FIELDS):
+                profiles[row.pop("phone")] = row
+            cache.set_many(profiles)
+    except Exception:
+        logger.exception("Failed to refresh %d VIP profile(s); they may be stale until they expire", len(phones))
+
+
+def _clear():
+    try:
+        _cache().clear()
+    except Exception:
+        logger.exception("Failed to clear the VIP profile cache")
@@ -0,0 +1,69 @@
+"""
+Row cleanup for the VIP imports, one chunk at a time.
+
+These functions run in toolkit.pipeline worker processes, so they only
+use the pure helpers in utils (no models, no database) and take and
+return plain tuples that pickle cheaply.
+"""
+from .utils import normalize_phone
+
+
+def normalize_vip_rows(chunk):
+    """
+    import_vips: ``(row_num, raw_phone, full_name)`` → ``(valid, blank, invalid)``
+
+    ``valid`` holds ``(row_num, phone, full_name)`` with the phone normalized,
+    ``blank`` counts rows without a phone and ``invalid`` lists
+    ``(row_num, raw_phone)`` for phones that cannot be normalized.
+    """
+    valid, invalid = [], []
+    blank = 0
+    for row_num, raw_phone, full_name in chunk:
+        raw_phone = raw_phone.strip()
+        if not raw_phone:
+            blank += 1
+            continue
+        phone = normalize_phone(raw_phone)
+        if not phone:
+            invalid.append((row_num, raw_phone))
+            continue
+        valid.append((row_num, phone, full_name.strip()))
+    return valid, blank, invalid
+
+
+def normalize_customer_rows(chunk):
+    """
+    import_vip_customers: ``(phone, name)`` → ``[(phone, name)]``
+
+    Rows without a phone are dropped; a leading 0 is added when missing.
+    """
+    rows = []
+    for phone, name in chunk:
+        phone = phone.strip()
+        if not phone:
+            continue
+        if not phone.startswith("0"):
+            phone = "0" + phone
+        rows.append((phone, name.strip()))
+    return rows
+
+
+def normalize_contact_rows(chunk):
+    """
+    Excel upload: ``(row_num, raw_phone, name, email)`` → ``(valid, errors)``
+
+    ``valid`` holds ``(phone, name, email)``; ``errors`` holds the
+    user-facing message for every rejected row.
+    """
+    valid, errors = [], []
+    for row_num, raw_phone, name, email in chunk:
+        raw_phone = raw_phone.strip()
+        if not raw_phone:
+            errors.append(f"Row {row_num}: No phone number")
+            continue
+        phone = normalize_phone(raw_phone)
+        if not phone:
+            errors.append(f"Row {row_num}: Invalid phone number - {raw_phone}")
+            continue
+        valid.append((phone, name.strip(), email.strip()))
+    return valid, errors
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import BookingLog
+from .models import BookingLog, CalendlySyncState
 
 
 @admin.register(BookingLog)
@@ -8,3 +8,8 @@ class BookingLogAdmin(admin.ModelAdmin):
     list_filter = ("event_type", "provider")
     search_fields = ("phone", "event_type")
     readonly_fields = ("received_at",)
+
+
+@admin.register(CalendlySyncState)
+class CalendlySyncStateAdmin(admin.ModelAdmin):
+    list_display = ("name", "synced_through", "last_success_at")
@@ -0,0 +1,204 @@
+"""
+Calendly API v2 client for the sync tooling.
+
+The webhook handles bookings as they happen; this client is for pulling
+history (manage.py sync_calendly). Invitee lookups are one request per event, so
+they are fanned out over a bounded thread pool:
+
+  - each worker thread keeps its own keep-alive ``requests.Session``
+  - every list endpoint is followed through ``pagination.next_page``
+  - all workers share one RateLimiter, which reads Calendly's
+    X-RateLimit-Remaining / X-RateLimit-Reset headers and pauses everyone
+    before the budget runs out; a 429 (or 5xx) backs off exponentially,
+    honouring Retry-After when present, and retries
+
+Point ``base_url`` at benchmarks/fake_calendly.py to exercise it locally.
+"""
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.conf import settings
+
+from lodore.instrumentation import track_external
+
+logger = logging.getLogger("lodore.calendly")
+
+REQUEST_TIMEOUT = 30
+DEFAULT_WORKERS = 8
+MAX_RETRIES = 5
+PAGE_SIZE = 100
+MAX_BACKOFF = 60.0
+
+# Start spacing requests out once fewer than this many remain in the window
+LOW_REMAINING = 10
+
+
+class CalendlyError(Exception):
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class RateLimiter:
+    """Pause shared by all worker threads of one client."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+        self.throttled = 0
+
+    def pause(self, seconds: float):
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+            self.throttled += 1
+
+    def wait(self):
+        while True:
+            with self._lock:
+                delay = self._resume_at - time.monotonic()
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+    def observe(self, response):
+        """Slow down ahead of the limit based on the rate-limit headers."""
+        remaining = _int_header(response, "X-RateLimit-Remaining")
+        reset = _int_header(response, "X-RateLimit-Reset")
+        if remaining is None or reset is None or remaining >= LOW_REMAINING:
+            return
+        if remaining <= 0:
+            self.pause(reset)
+        else:
+            # Spread what is left of the budget over the rest of the window
+            self.pause(reset / (remaining + 1))
+
+    def backoff(self, response, attempt: int):
+        """Pause after a 429/5xx, preferring the server's own hint."""
+        delay = None
+        if response is not None:
+            delay = _int_header(response, "Retry-After")
+            if delay is None and response.status_code == 429:
+                delay = _int_header(response, "X-RateLimit-Reset")
+        if delay is None:
+            delay = min(MAX_BACKOFF, 2 ** attempt) * (0.5 + random.random() / 2)
+        self.pause(delay)
+
+
+def _int_header(response, name):
+    value = response.headers.get(name)
+    try:
+        return int(float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+class CalendlyClient:
+    def __init__(self, token=None, base_url=None, workers=DEFAULT_WORKERS, timeout=REQUEST_TIMEOUT):
+        self.token = token or getattr(settings, "CALENDLY_API_TOKEN", "")
+        self.base_url = (
+            base_url or getattr(settings, "CALENDLY_API_BASE_URL", "https://api.calendly.com")
+        ).rstrip("/")
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.rate_limiter = RateLimiter()
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self.requests_made = 0
+        self.retries = 0
+
+    # ------------------------------------------------------------------ HTTP
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({
+                "Authorization": f"Bearer {self.token}",
+                "Content-Type": "application/json",
+            })
+            self._local.session = session
+        return session
+
+    def get(self, url: str, params=None) -> dict:
+        """GET a Calendly resource, retrying 429/5xx with backoff."""
+        session = self._session()
+        for attempt in range(MAX_RETRIES + 1):
+            self.rate_limiter.wait()
+            response = None
+            try:
+                with track_external("calendly"):
+                    response = session.get(url, params=params, timeout=self.timeout)
+            except requests.RequestException as exc:
+                if attempt == MAX_RETRIES:
+                    raise CalendlyError(f"GET {url} failed: {exc}") from exc
+            with self._stats_lock:
+                self.requests_made += 1
+
+            if response is not None:
+                self.rate_limiter.observe(response)
+                if response.status_code < 400:
+                    return response.json()
+                if response.status_code != 429 and response.status_code < 500:
+                    raise CalendlyError(
+                        f"GET {url} returned {response.status_code}: {response.text[:200]}",
+                        status_code=response.status_code,
+                    )
+                if attempt == MAX_RETRIES:
+                    raise CalendlyError(
+                        f"GET {url} still failing after {MAX_RETRIES} retries ({response.status_code})",
+                        status_code=response.status_code,
+                    )
+
+            with self._stats_lock:
+                self.retries += 1
+            logger.info("Calendly GET %s retry %d", url, attempt + 1)
+            self.rate_limiter.backoff(response, attempt)
+
+        raise CalendlyError(f"GET {url} failed")  # pragma: no cover
+
+    def get_collection(self, url: str, params=None) -> list:
+        """Fetch every page of a list endpoint."""
+        items = []
+        params = dict(params or {}, count=PAGE_SIZE)
+        while url:
+            data = self.get(url, params=params)
+            items.extend(data.get("collection", []))
+            # next_page already carries the query string, page_token included
+            url = (data.get("pagination") or {}).get("next_page")
+            params = None
+        return items
+
+    # ------------------------------------------------------------ Resources
+
+    def current_user(self) -> dict:
+        return self.get(f"{self.base_url}/users/me")["resource"]
+
+    def scheduled_events(self, user_uri: str, min_start_time=None, status="active") -> list:
+        params = {"user": user_uri, "status": status}
+        if min_start_time is not None:
+            params["min_start_time"] = min_start_time.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        return self.get_collection(f"{self.base_url}/scheduled_events", params)
+
+    def event_invitees(self, event_uri: str) -> list:
+        return self.get_collection(f"{event_uri}/invitees")
+
+    def invitees_for_events(self, events: list) -> list:
+        """
+        Fetch invitees for ``events`` concurrently.
+
+        Returns ``(event, invitees, error)`` tuples in the order of
+        ``events``; ``error`` is the exception for events whose invitees
+        could not be fetched (``invitees`` is then empty).
+        """
+        def fetch(event):
+            try:
+                return event, self.event_invitees(event.get("uri", "")), None
+            except Exception as exc:
+                return event, [], exc
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="calendly") as pool:
+            return list(pool.map(fetch, events))
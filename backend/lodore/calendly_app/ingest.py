@@ -0,0 +1,244 @@
+"""
+Batched BookingLog ingestion for the Calendly sync and import commands.
+
+``booking_from_invitee`` / ``booking_from_export`` map API data and export
+records onto BookingLog fields. BookingIngestor takes those one at a time
+and writes them in batches:
+
+  1. one SELECT finds which invitee URIs of the batch already have rows
+  2. new URIs go in with one bulk INSERT; known ones whose values changed
+     are rewritten with bulk UPDATEs, unchanged ones are left alone
+  3. at the end, VIPs are created/updated for phones with an active booking
+     (one upsert per chunk), and ``booked`` / ``bookings_count`` are
+     recomputed from BookingLog for every affected phone in one UPDATE per
+     chunk
+
+so a full import is a few dozen statements rather than several per row.
+
+Rows are matched on ``calendly_event_uri`` alone, like the webhook. There is
+no unique constraint on it (historical duplicates may exist); a URI with
+several rows has all of them updated.
+"""
+import logging
+from datetime import datetime
+
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from lodore.auth_app import vip_profiles
+from lodore.auth_app.models import VIPPhone
+from lodore.auth_app.utils import normalize_phone
+from lodore.toolkit.batching import BatchWriter
+
+from .models import BookingLog
+
+logger = logging.getLogger("lodore")
+
+BATCH_SIZE = 1000
+UPDATE_BATCH_SIZE = 100
+
+BOOKING_FIELDS = (
+    "provider",
+    "event_type",
+    "payload",
+    "phone",
+    "guest_name",
+    "guest_email",
+    "scheduled_at",
+    "status",
+)
+
+
+def parse_start_time(value):
+    """Parse a Calendly ISO 8601 timestamp, or None."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (TypeError, ValueError) as exc:
+        logger.warning("Failed to parse Calendly time %r: %s", value, exc)
+        return None
+
+
+def booking_status(invitee_status):
+    """(event_type, status) for a Calendly invitee status."""
+    if invitee_status == "canceled":
+        return "invitee.canceled", BookingLog.STATUS_CANCELED
+    return "invitee.created", BookingLog.STATUS_SCHEDULED
+
+
+def extract_phone_from_invitee(invitee):
+    """Extract a normalized phone from API invitee data, or ''."""
+    for q in invitee.get("questions_and_answers") or []:
+        question = (q.get("question") or "").lower()
+        if "phone" in question or "mobile" in question or "جوال" in question or "هاتف" in question:
+            phone = normalize_phone(q.get("answer") or "")
+            if phone:
+                return phone
+
+    utm_content = (invitee.get("tracking") or {}).get("utm_content") or ""
+    if utm_content:
+        phone = normalize_phone(utm_content)
+        if phone:
+            return phone
+
+    return ""
+
+
+def booking_from_invitee(event, invitee):
+    """BookingLog field values for an API scheduled event / invitee pair."""
+    event_type, status = booking_status(invitee.get("status", ""))
+    return {
+        "provider": BookingLog.PROVIDER_CALENDLY,
+        "event_type": event_type,
+        "payload": {
+            "event": {
+                "name": event.get("name", "Unknown"),
+                "uri": event.get("uri", ""),
+                "start_time": event.get("start_time", ""),
+                "status": event.get("status", ""),
+            },
+            "invitee": invitee,
+        },
+        "phone": extract_phone_from_invitee(invitee),
+        "guest_name": invitee.get("name") or "",
+        "guest_email": invitee.get("email") or "",
+        "scheduled_at": parse_start_time(event.get("start_time")),
+        "status": status,
+    }
+
+
+def booking_from_export(record):
+    """
+    BookingLog field values for one flattened export record
+    (invitee_uri, invitee_name, invitee_phone, invitee_status, scheduled_at…).
+    """
+    event_type, status = booking_status(record.get("invitee_status"))
+    return {
+        "provider": BookingLog.PROVIDER_CALENDLY,
+        "event_type": event_type,
+        "payload": record,
+        "phone": record.get("invitee_phone") or "",
+        "guest_name": record.get("invitee_name") or "",
+        "guest_email": record.get("invitee_email") or "",
+        "scheduled_at": parse_start_time(record.get("scheduled_at")),
+        "status": status,
+    }
+
+
+def recount_vip_bookings(phones, batch_size=BATCH_SIZE) -> int:
+    """
+    Recompute ``booked`` and ``bookings_count`` for ``phones`` from their
+    scheduled BookingLog rows. Returns the number of VIP rows updated.
+    """
+    phones = sorted(set(p for p in phones if p))
+    scheduled = BookingLog.objects.filter(
+        phone=OuterRef("phone"), status=BookingLog.STATUS_SCHEDULED
+    ).order_by()
+    active_count = scheduled.values("phone").annotate(n=Count("*")).values("n")
+
+    updated = 0
+    for start in range(0, len(phones), batch_size):
+        updated += VIPPhone.objects.filter(phone__in=phones[start:start + batch_size]).update(
+            booked=Exists(scheduled),
+            bookings_count=Coalesce(Subquery(active_count), 0),
+        )
+    vip_profiles.refresh(phones)
+    return updated
+
+
+class BookingIngestor:
+    """
+    Collects BookingLog field dicts keyed by invitee URI and writes them in
+    batches. Call ``finish()`` once at the end to flush and sync VIPs.
+    With ``dry_run`` nothing is read from or written to the database.
+    """
+
+    def __init__(self, batch_size=BATCH_SIZE, dry_run=False, progress=None):
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self._writer = BatchWriter(self._write_batch, batch_size, dry_run=dry_run, progress=progress)
+        # phone -> (name, email) of its latest active booking
+        self._vip_details = {}
+        self._phones = set()
+        self.stats = {
+            "bookings_created": 0,
+            "bookings_updated": 0,
+            "bookings_unchanged": 0,
+            "vips_upserted": 0,
+            "vips_recounted": 0,
+        }
+
+    def add(self, invitee_uri: str, fields: dict):
+        """Queue one booking. ``fields`` holds BOOKING_FIELDS values."""
+        self._writer.add((invitee_uri, fields))
+
+    def recount_phones(self, phones):
+        """Also recount these phones in ``finish()`` (e.g. rows deleted elsewhere)."""
+        self._phones.update(p for p in phones if p)
+
+    def flush(self):
+        self._writer.flush()
+
+    def _write_batch(self, items):
+        # Last occurrence of a URI within the batch wins
+        batch = dict(items)
+
+        existing = {}
+        for row in BookingLog.objects.filter(
+            calendly_event_uri__in=list(batch)
+        ).values("id", "calendly_event_uri", *BOOKING_FIELDS):
+            existing.setdefault(row["calendly_event_uri"], []).append(row)
+
+        new_rows, changed_rows = [], []
+        for uri, fields in batch.items():
+            values = {name: fields[name] for name in BOOKING_FIELDS}
+            if uri in existing:
+                # Re-syncs mostly see unchanged rows; skip rewriting those
+                changed_rows.extend(
+                    BookingLog(id=row["id"], calendly_event_uri=uri, **values)
+                    for row in existing[uri]
+                    if any(row[name] != values[name] for name in BOOKING_FIELDS)
+                )
+            else:
+                new_rows.append(BookingLog(calendly_event_uri=uri, **values))
+
+            phone = values["phone"]
+            if phone:
+                self._phones.add(phone)
+                if values["status"] == BookingLog.STATUS_SCHEDULED:
+                    self._vip_details[phone] = (values["guest_name"] or "", values["guest_email"] or "")
+
+        with transaction.atomic():
+            if new_rows:
+                BookingLog.objects.bulk_create(new_rows)
+            if changed_rows:
+                # bulk_update builds one CASE per field; keep each one short
+                BookingLog.objects.bulk_update(changed_rows, BOOKING_FIELDS, batch_size=UPDATE_BATCH_SIZE)
+        self.stats["bookings_created"] += len(new_rows)
+        self.stats["bookings_updated"] += len(changed_rows)
+        self.stats["bookings_unchanged"] += len(batch) - len(new_rows) - len(
+            {row.calendly_event_uri for row in changed_rows}
+        )
+
+    def finish(self) -> dict:
+        """Flush the last batch and bring the affected VIPs up to date."""
+        self.flush()
+        if self.dry_run:
+            return self.stats
+        with transaction.atomic():
+            vips = [
+                VIPPhone(phone=phone, full_name=name, email=email)
+                for phone, (name, email) in self._vip_details.items()
+            ]
+            VIPPhone.objects.bulk_create(
+                vips,
+                batch_size=self.batch_size,
+                update_conflicts=True,
+                unique_fields=["phone"],
+                update_fields=["full_name", "email"],
+            )
+            self.stats["vips_upserted"] = len(vips)
+            self.stats["vips_recounted"] = recount_vip_bookings(self._phones, self.batch_size)
+        return self.stats
@@ -0,0 +1,154 @@
+"""
+Management command: cleanup_duplicates
+
+Usage:
+  python manage.py cleanup_duplicates --dry-run
+  python manage.py cleanup_duplicates -v 2          # also list sample groups
+  python manage.py cleanup_duplicates --batch-size 50000
+
+Finds Calendly BookingLog rows sharing a calendly_event_uri and keeps one
+per URI: the newest canceled row if there is one, otherwise the newest row.
+
+Set-based: one ROW_NUMBER() OVER (PARTITION BY calendly_event_uri ...)
+pass ranks every row (without reading payloads) into a scratch table of
+duplicate groups, then the losers are deleted in id-ordered chunks, one
+short transaction each. VIP booked / bookings_count are recomputed for the
+phones whose rows were deleted.
+"""
+import uuid
+
+from django.db import connection, transaction
+
+from lodore.calendly_app.ingest import recount_vip_bookings
+from lodore.calendly_app.models import BookingLog
+from lodore.toolkit.command import BatchCommand
+
+# Per-run suffix added in handle(), so overlapping runs never share a table
+DUPLICATES_TABLE_PREFIX = "bookinglog_duplicates"
+SAMPLE_GROUPS = 10
+
+
+class Command(BatchCommand):
+    help = "Delete duplicate Calendly BookingLog rows (same calendly_event_uri)."
+    default_batch_size = 10000
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        batch_size = options["batch_size"]
+        self.announce_dry_run(dry_run)
+        table = BookingLog._meta.db_table
+        duplicates = f"{DUPLICATES_TABLE_PREFIX}_{uuid.uuid4().hex[:12]}"
+
+        with connection.cursor() as cursor:
+            # A regular (unlogged) table rather than TEMPORARY: the chunked deletes
+            # run in separate transactions, which PgBouncer's transaction pooling
+            # may serve from different server connections
+            try:
+                # Every row of every URI that has more than one, ranked by the
+                # keep rule: canceled first, then newest
+                cursor.execute(
+                    f"""
+                    CREATE UNLOGGED TABLE {duplicates} AS
+                    SELECT id, calendly_event_uri, status, phone, rn
+                    FROM (
+                        SELECT id, calendly_event_uri, status, phone,
+                               ROW_NUMBER() OVER w AS rn,
+                               COUNT(*) OVER (PARTITION BY calendly_event_uri) AS copies
+                        FROM {table}
+                        WHERE provider = %s AND calendly_event_uri <> ''
+                        WINDOW w AS (
+                            PARTITION BY calendly_event_uri
+                            ORDER BY (status = %s) DESC, received_at DESC, id DESC
+                        )
+                    ) ranked
+                    WHERE copies > 1
+                    """,
+                    [BookingLog.PROVIDER_CALENDLY, BookingLog.STATUS_CANCELED],
+                )
+                cursor.execute(f"CREATE INDEX ON {duplicates} (id) WHERE rn > 1")
+                cursor.execute(f"ANALYZE {duplicates}")
+                cursor.execute(
+                    f"""
+                    SELECT COUNT(*) FILTER (WHERE rn = 1),
+                           COUNT(*) FILTER (WHERE rn = 1 AND status = %s),
+                           COUNT(*) FILTER (WHERE rn > 1)
+                    FROM {duplicates}
+                    """,
+                    [BookingLog.STATUS_CANCELED],
+                )
+                groups, kept_canceled, losers = cursor.fetchone()
+
+                self.stdout.write(
+                    f"Found {groups} duplicated URIs: {losers} rows to delete, "
+                    f"{kept_canceled} groups keep a canceled row, {groups - kept_canceled} the newest row."
+                )
+                if options["verbosity"] >= 2 and groups:
+                    self._print_sample(cursor, duplicates)
+
+                deleted = 0
+                if not dry_run and losers:
+                    cursor.execute(
+                        f"SELECT DISTINCT phone FROM {duplicates} WHERE rn > 1 AND phone <> ''"
+                    )
+                    phones = [row[0] for row in cursor.fetchall()]
+
+                    progress = self.progress("rows deleted", total=losers)
+                    last_id = 0
+                    while True:
+                        with transaction.atomic():
+                            cursor.execute(
+                                f"""
+                                WITH chunk AS (
+                                    SELECT id FROM {duplicates}
+                                    WHERE rn > 1 AND id > %s
+                                    ORDER BY id
+                                    LIMIT %s
+                                ), gone AS (
+                                    DELETE FROM {table} WHERE id IN (SELECT id FROM chunk)
+                                )
+                                SELECT MAX(id), COUNT(*) FROM chunk
+                                """,
+                                [last_id, batch_size],
+                            )
+                            chunk_max, chunk_rows = cursor.fetchone()
+                        if not chunk_rows:
+                            break
+                        last_id = chunk_max
+                        deleted += chunk_rows
+                        progress.add(chunk_rows)
+                    progress.finish()
+
+                    recounted = recount_vip_bookings(phones)
+                    self.stdout.write(f"  Recomputed bookings for {recounted} VIPs")
+            finally:
+                cursor.execute(f"DROP TABLE IF EXISTS {duplicates}")
+
+        self.stdout.write("")
+        if dry_run:
+            self.stdout.write(self.style.SUCCESS(
+                f"Would delete {losers} duplicate records across {groups} URIs."
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f"Deleted {deleted} duplicate records across {groups} URIs."
+            ))
+
+    def _print_sample(self, cursor, duplicates):
+        cursor.execute(
+            f"""
+            SELECT calendly_event_uri,
+                   array_agg(id ORDER BY rn),
+                   array_agg(status ORDER BY rn)
+            FROM {duplicates}
+            WHERE calendly_event_uri IN (
+                SELECT calendly_event_uri FROM {duplicates}
+                WHERE rn = 1 ORDER BY id LIMIT %s
+            )
+            GROUP BY calendly_event_uri
+            """,
+            [SAMPLE_GROUPS],
+        )
+        for uri, ids, statuses in cursor.fetchall():
+            self.stdout.write(
+                f"  {uri}: keeping {ids[0]} ({statuses[0]}), deleting {ids[1:]}"
+            )
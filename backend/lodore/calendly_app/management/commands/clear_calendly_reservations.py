@@ -0,0 +1,62 @@
+"""
+Management command: clear_calendly_reservations
+
+Usage:
+  python manage.py clear_calendly_reservations            # asks for confirmation
+  python manage.py clear_calendly_reservations --no-input
+  python manage.py clear_calendly_reservations --dry-run
+
+Deletes every Calendly BookingLog row, in id-range batches so no single
+statement locks the whole table. VIP phone records are NOT deleted.
+Afterwards, run ``sync_calendly --full`` to fetch fresh data.
+"""
+from django.db import transaction
+from django.db.models import Max, Min
+
+from lodore.calendly_app.models import BookingLog
+from lodore.toolkit.command import BatchCommand
+
+
+class Command(BatchCommand):
+    help = "Delete all Calendly BookingLog rows (VIP phones are kept)."
+    default_batch_size = 10000
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--no-input",
+            "--noinput",
+            action="store_false",
+            dest="interactive",
+            help="Do not ask for confirmation.",
+        )
+
+    def handle(self, *args, **options):
+        calendly = BookingLog.objects.filter(provider=BookingLog.PROVIDER_CALENDLY)
+        booking_count = calendly.count()
+        self.stdout.write(f"Found {booking_count} Calendly reservations in database")
+
+        if booking_count == 0 or options["dry_run"]:
+            self.announce_dry_run(options["dry_run"])
+            return
+
+        if options["interactive"]:
+            self.stdout.write(self.style.WARNING("This will delete all Calendly booking logs!"))
+            self.stdout.write("VIP phone records will NOT be deleted, only booking logs.")
+            if input("Type 'yes' to confirm deletion: ").lower() != "yes":
+                self.stdout.write("Cancelled. No data was deleted.")
+                return
+
+        bounds = calendly.aggregate(low=Min("id"), high=Max("id"))
+        progress = self.progress("rows deleted", total=booking_count)
+        batch_size = options["batch_size"]
+        for start in range(bounds["low"], bounds["high"] + 1, batch_size):
+            with transaction.atomic():
+                deleted, _ = calendly.filter(id__gte=start, id__lt=start + batch_size).delete()
+            progress.add(deleted)
+        progress.finish()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Deleted {progress.count} Calendly reservations; "
+            f"{BookingLog.objects.count()} booking logs remain."
+        ))
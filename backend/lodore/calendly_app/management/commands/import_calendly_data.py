@@ -0,0 +1,87 @@
+"""
+Management command: import_calendly_data
+
+Usage:
+  python manage.py import_calendly_data --file /tmp/calendly_sync_data.json
+  python manage.py import_calendly_data --file invitees.ndjson --batch-size 5000
+  python manage.py import_calendly_data --file data.json --key to_add --dry-run
+
+Input is either a JSON document whose ``--key`` member (default "to_add")
+is a list of flattened invitee records, or NDJSON (``.ndjson`` / ``.jsonl``)
+with one record per line:
+
+  {"invitee_uri": "...", "invitee_name": "...", "invitee_email": "...",
+   "invitee_phone": "05...", "invitee_status": "active", "scheduled_at": "..."}
+
+The file is streamed, so memory stays flat on multi-gigabyte inputs.
+Rows are upserted by invitee URI in batches; each batch commits on its
+own, so an interrupted import can simply be re-run.
+"""
+import os
+
+from django.core.management.base import CommandError
+
+from lodore.calendly_app.ingest import BookingIngestor, booking_from_export
+from lodore.toolkit.command import BatchCommand
+from lodore.toolkit.streaming import iter_records
+
+
+class Command(BatchCommand):
+    help = "Import flattened Calendly invitee records (JSON or NDJSON) into BookingLog."
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--file",
+            type=str,
+            default="/tmp/calendly_sync_data.json",
+            help="Path to the JSON or NDJSON file.",
+        )
+        parser.add_argument(
+            "--key",
+            type=str,
+            default="to_add",
+            help="Member of the top-level JSON object holding the records (ignored for NDJSON).",
+        )
+
+    def handle(self, *args, **options):
+        filepath = options["file"]
+        dry_run = options["dry_run"]
+
+        if not os.path.isfile(filepath):
+            raise CommandError(f"File not found: {filepath}")
+
+        self.stdout.write(f"Importing Calendly records from: {filepath}")
+        self.announce_dry_run(dry_run)
+
+        progress = self.progress("records")
+        ingestor = BookingIngestor(batch_size=options["batch_size"], dry_run=dry_run, progress=progress)
+        skipped = 0
+        try:
+            for record in iter_records(filepath, key=options["key"]):
+                invitee_uri = record.get("invitee_uri") if isinstance(record, dict) else None
+                if not invitee_uri:
+                    skipped += 1
+                    continue
+                ingestor.add(invitee_uri, booking_from_export(record))
+        except ValueError as exc:
+            # StreamFormatError / JSONDecodeError
+            raise CommandError(f"Invalid input after {progress.count} records: {exc}") from exc
+
+        stats = ingestor.finish()
+        progress.finish()
+
+        self.stdout.write("")
+        if dry_run:
+            self.stdout.write(self.style.SUCCESS(
+                f"Dry run complete: {progress.count} valid records, {skipped} skipped (no invitee_uri)."
+            ))
+            return
+        self.stdout.write(self.style.SUCCESS(
+            f"Import complete: {stats['bookings_created']} created, "
+            f"{stats['bookings_updated']} updated, "
+            f"{stats['bookings_unchanged']} unchanged, "
+            f"{skipped} skipped (no invitee_uri), "
+            f"{stats['vips_upserted']} VIPs upserted, "
+            f"{stats['vips_recounted']} VIP booking counts recomputed."
+        ))
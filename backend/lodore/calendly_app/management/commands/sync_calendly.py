@@ -0,0 +1,202 @@
+"""
+Management command: sync_calendly
+
+Usage:
+  python manage.py sync_calendly                     # incremental
+  python manage.py sync_calendly --full              # refetch all history
+  python manage.py sync_calendly --lookback-hours 72
+  python manage.py sync_calendly --dry-run
+  python manage.py sync_calendly --base-url http://127.0.0.1:8765  # benchmarks/fake_calendly.py
+
+1. Fetches events starting after the last successful sync's high-water
+   mark (minus a lookback window), or every event with --full
+2. Fetches their invitees concurrently (see calendly_app.client)
+3. Upserts one BookingLog row per invitee URI in batches, and recomputes
+   VIP booked / bookings_count for the affected phones
+4. After a run without errors, retires Calendly rows in the synced window
+   that Calendly no longer returns, and advances the high-water mark
+
+Existing rows stay readable throughout; nothing is deleted up front.
+Requires CALENDLY_API_TOKEN.
+"""
+import io
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import CommandError
+from django.db import connection, transaction
+from django.db.models import BooleanField
+from django.db.models.expressions import RawSQL
+from django.utils import timezone
+
+from lodore.calendly_app.client import CalendlyClient, CalendlyError
+from lodore.calendly_app.ingest import BookingIngestor, booking_from_invitee
+from lodore.calendly_app.models import BookingLog, CalendlySyncState
+from lodore.toolkit.command import BatchCommand
+
+SYNC_STATE_NAME = "scheduled_events"
+DEFAULT_LOOKBACK_HOURS = 24
+# Scratch table of the invitee URIs this run returned (dropped at commit)
+SEEN_URIS_TABLE = "calendly_sync_seen_uris"
+# COPY text format escapes
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+class Command(BatchCommand):
+    help = "Sync Calendly scheduled events and invitees into BookingLog."
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Ignore the high-water mark and refetch every event.",
+        )
+        parser.add_argument(
+            "--lookback-hours",
+            type=int,
+            default=DEFAULT_LOOKBACK_HOURS,
+            help=f"Refetch events starting this long before the high-water mark (default {DEFAULT_LOOKBACK_HOURS}).",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=settings.CALENDLY_SYNC_WORKERS,
+            help="Concurrent invitee requests.",
+        )
+        parser.add_argument(
+            "--base-url",
+            default=None,
+            help="Calendly API root (default CALENDLY_API_BASE_URL).",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        base_url = options["base_url"]
+        if not settings.CALENDLY_API_TOKEN and not base_url:
+            raise CommandError("CALENDLY_API_TOKEN is not set.")
+        self.announce_dry_run(dry_run)
+
+        # Everything received after this point is left for the next run to judge
+        run_started_at = timezone.now()
+        started = time.perf_counter()
+
+        state, _ = CalendlySyncState.objects.get_or_create(name=SYNC_STATE_NAME)
+        window_start = None
+        if not options["full"] and state.synced_through:
+            window_start = state.synced_through - timedelta(hours=options["lookback_hours"])
+        if window_start:
+            self.stdout.write(f"Incremental sync: events starting from {window_start.isoformat()}")
+        else:
+            self.stdout.write("Full sync: all events")
+
+        client = CalendlyClient(base_url=base_url, workers=options["workers"])
+        try:
+            user = client.current_user()
+            self.stdout.write(f"Calendly user: {user['name']} ({user['email']})")
+            events = client.scheduled_events(user["uri"], min_start_time=window_start)
+        except CalendlyError as exc:
+            raise CommandError(f"Calendly request failed: {exc}") from exc
+        self.stdout.write(f"Found {len(events)} scheduled events in {time.perf_counter() - started:.1f}s")
+
+        # Fetch every invitee before touching the database
+        fetch = self.progress("invitees")
+        errors = []
+        bookings = {}
+        for event, invitees, error in client.invitees_for_events(events):
+            if error is not None:
+                errors.append(f"Failed to get invitees for event {event.get('name', 'Unknown')}: {error}")
+                continue
+            for invitee in invitees:
+                invitee_uri = invitee.get("uri", "")
+                if not invitee_uri:
+                    errors.append(f"Invitee without URI on event {event.get('name', 'Unknown')}")
+                    continue
+                bookings[invitee_uri] = booking_from_invitee(event, invitee)
+            fetch.add(len(invitees))
+        fetch.finish()
+        self.stdout.write(
+            f"  {client.requests_made} requests, {client.retries} retries, "
+            f"{client.rate_limiter.throttled} rate-limit pauses"
+        )
+
+        # Write bookings, retire stale rows and advance the mark together
+        write = self.progress("bookings written")
+        ingestor = BookingIngestor(batch_size=options["batch_size"], dry_run=dry_run, progress=write)
+        retired = 0
+        with transaction.atomic():
+            for invitee_uri, fields in bookings.items():
+                ingestor.add(invitee_uri, fields)
+            ingestor.flush()
+
+            # Only retire after a run that saw everything
+            if not errors:
+                stale = BookingLog.objects.filter(
+                    provider=BookingLog.PROVIDER_CALENDLY,
+                    received_at__lt=run_started_at,
+                ).filter(self._not_seen(bookings))
+                if window_start:
+                    stale = stale.filter(scheduled_at__gte=window_start)
+
+                if dry_run:
+                    retired = stale.count()
+                else:
+                    ingestor.recount_phones(stale.values_list("phone", flat=True))
+                    retired = stale.delete()[0]
+                    state.synced_through = run_started_at
+                    state.last_success_at = timezone.now()
+                    state.save(update_fields=["synced_through", "last_success_at"])
+
+            stats = ingestor.finish()
+        write.finish()
+
+        for error in errors:
+            self.stdout.write(self.style.ERROR(f"  {error}"))
+        if errors:
+            self.stdout.write(self.style.WARNING(
+                "Run had errors: stale rows kept and high-water mark not advanced."
+            ))
+
+        verb = "Would retire" if dry_run else "Retired"
+        self.stdout.write("")
+        self.stdout.write(
+            (self.style.ERROR if errors else self.style.SUCCESS)(
+                f"Sync {'finished with errors' if errors else 'complete'} "
+                f"({'incremental' if window_start else 'full'}, {time.perf_counter() - started:.1f}s): "
+                f"{len(events)} events, {len(bookings)} invitees, "
+                f"{stats['bookings_created']} created, {stats['bookings_updated']} updated, "
+                f"{stats['bookings_unchanged']} unchanged, {verb.lower()} {retired}, "
+                f"{stats['vips_upserted']} VIPs upserted, {stats['vips_recounted']} recounted, "
+                f"{len(errors)} errors."
+            )
+        )
+        if errors:
+            raise CommandError(f"{len(errors)} Calendly requests failed.")
+
+    def _not_seen(self, uris):
+        """
+        Condition matching BookingLog rows whose URI is not in ``uris``.
+
+        The URIs are copied into a temporary table that is dropped when the
+        surrounding transaction commits, and matched with NOT EXISTS (an
+        anti-join) rather than a NOT IN list with one parameter per URI.
+        """
+        table = BookingLog._meta.db_table
+        with connection.cursor() as cursor:
+            # Left over if a caller's outer transaction has not committed yet
+            cursor.execute(f"DROP TABLE IF EXISTS {SEEN_URIS_TABLE}")
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE {SEEN_URIS_TABLE} (uri varchar(500) PRIMARY KEY) ON COMMIT DROP"
+            )
+            cursor.copy_expert(
+                f"COPY {SEEN_URIS_TABLE} (uri) FROM STDIN",
+                io.StringIO("".join(f"{uri.translate(_COPY_ESCAPES)}\n" for uri in uris)),
+            )
+            cursor.execute(f"ANALYZE {SEEN_URIS_TABLE}")
+        return RawSQL(
+            f"NOT EXISTS (SELECT 1 FROM {SEEN_URIS_TABLE} seen "
+            f"WHERE seen.uri = {table}.calendly_event_uri)",
+            [],
+            output_field=BooleanField(),
+        )
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.9 on 2026-10-19 03:48
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY keeps the tables writable during the build;
+    # it cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('calendly_app', '0002_bookinglog_calendly_event_uri_bookinglog_guest_email_and_more'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='bookinglog',
+            index=models.Index(fields=['-scheduled_at', '-received_at', 'id'], name='bookinglog_sched_recv_id_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.9 on 2026-10-19 03:49
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY: large tables keep taking writes while the
+    # GIN indexes build; it cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('calendly_app', '0003_list_keyset_indexes'),
+        # pg_trgm is installed there
+        ('auth_app', '0006_search_trigram_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='bookinglog',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('guest_name'), name='gin_trgm_ops'), name='bookinglog_name_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='bookinglog',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('phone'), name='gin_trgm_ops'), name='bookinglog_phone_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='bookinglog',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('guest_email'), name='gin_trgm_ops'), name='bookinglog_email_trgm'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.9 on 2026-10-19 03:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calendly_app', '0004_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CalendlySyncState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('synced_through', models.DateTimeField(blank=True, null=True)),
+                ('last_success_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Calendly Sync State',
+                'verbose_name_plural': 'Calendly Sync State',
+            },
+        ),
+    ]
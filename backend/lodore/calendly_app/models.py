@@ -3,6 +3,8 @@ BookingLog model — stores every Calendly webhook event.
 """
 from django.db import models
 
+from lodore.auth_app.models import trigram_index
+
 
 class BookingLog(models.Model):
     PROVIDER_CALENDLY = "calendly"
@@ -37,6 +39,37 @@ class BookingLog(models.Model):
         verbose_name = "Booking Log"
         verbose_name_plural = "Booking Logs"
         ordering = ["-received_at"]
+        indexes = [
+            # Keyset pagination order for the management reservations list
+            models.Index(
+                fields=["-scheduled_at", "-received_at", "id"],
+                name="bookinglog_sched_recv_id_idx",
+            ),
+            # Staff search box
+            trigram_index("guest_name", "bookinglog_name_trgm"),
+            trigram_index("phone", "bookinglog_phone_trgm"),
+            trigram_index("guest_email", "bookinglog_email_trgm"),
+        ]
 
     def __str__(self):
         return f"{self.provider} | {self.event_type} | {self.phone} @ {self.received_at:%Y-%m-%d %H:%M}"
+
+
+class CalendlySyncState(models.Model):
+    """
+    High-water mark for the incremental Calendly sync.
+
+    Events that started before ``synced_through`` were already imported by a
+    successful run and are treated as final; the next run only refetches
+    events starting after it (minus a lookback window).
+    """
+    name = models.CharField(max_length=50, unique=True)
+    synced_through = models.DateTimeField(null=True, blank=True)
+    last_success_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Calendly Sync State"
+        verbose_name_plural = "Calendly Sync State"
+
+    def __str__(self):
+        return f"{self.name} through {self.synced_through or 'never'}"
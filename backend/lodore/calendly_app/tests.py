@@ -0,0 +1,123 @@
+"""
+Tests for calendly_app.
+
+The client tests run CalendlyClient against benchmarks/fake_calendly.py.
+"""
+import time
+from datetime import timedelta
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from benchmarks.fake_calendly import EPOCH, start_server
+from lodore.calendly_app.client import MAX_RETRIES, CalendlyClient, CalendlyError, RateLimiter
+
+
+class FakeCalendlyTestCase(SimpleTestCase):
+    def start(self, **options):
+        server, app = start_server(latency_ms=0, **options)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return app, CalendlyClient(token="test", base_url=app.base_url, workers=4)
+
+
+class PaginationTests(FakeCalendlyTestCase):
+    def test_collections_follow_next_page(self):
+        app, client = self.start(events=250, max_page_size=100)
+        user = client.current_user()
+
+        events = client.scheduled_events(user["uri"])
+
+        self.assertEqual([event["uri"] for event in events], [app.event(i)["uri"] for i in range(250)])
+        # users/me, then three pages of events
+        self.assertEqual(app.requests, 4)
+        self.assertEqual(client.retries, 0)
+
+    def test_next_page_keeps_the_query(self):
+        app, client = self.start(events=250, max_page_size=40)
+
+        events = client.scheduled_events("user", min_start_time=EPOCH + timedelta(hours=100))
+
+        self.assertEqual(len(events), 150)
+        self.assertEqual(events[0]["uri"], app.event(100)["uri"])
+
+    def test_invitees_for_events_keeps_event_order(self):
+        app, client = self.start(events=20, invitees_per_event=3, max_page_size=2)
+        events = client.scheduled_events("user")
+
+        results = client.invitees_for_events(events)
+
+        self.assertEqual([event for event, _, _ in results], events)
+        for index, (_, invitees, error) in enumerate(results):
+            self.assertIsNone(error)
+            self.assertEqual(invitees, [app.invitee(index, j) for j in range(3)])
+
+
+@mock.patch.object(RateLimiter, "pause", autospec=True)
+class RetryTests(FakeCalendlyTestCase):
+    def test_5xx_is_retried_after_retry_after(self, pause):
+        app, client = self.start(events=5, fail_requests=2, fail_status=503, retry_after=7)
+
+        self.assertEqual(len(client.scheduled_events("user")), 5)
+        self.assertEqual(client.retries, 2)
+        self.assertEqual([call.args[1] for call in pause.call_args_list], [7, 7])
+
+    def test_429_is_retried_after_retry_after(self, pause):
+        app, client = self.start(events=5, fail_requests=1, fail_status=429, retry_after=3)
+
+        self.assertEqual(len(client.scheduled_events("user")), 5)
+        pause.assert_called_once_with(client.rate_limiter, 3)
+
+    def test_backoff_is_exponential_without_a_hint(self, pause):
+        app, client = self.start(events=5, fail_requests=3, fail_status=502)
+
+        client.scheduled_events("user")
+
+        delays = [call.args[1] for call in pause.call_args_list]
+        self.assertEqual(len(delays), 3)
+        for attempt, delay in enumerate(delays):
+            # 2 ** attempt seconds with up to 50% jitter
+            self.assertTrue(2 ** attempt / 2 <= delay <= 2 ** attempt, delays)
+
+    def test_gives_up_after_max_retries(self, pause):
+        app, client = self.start(events=5, fail_requests=MAX_RETRIES + 1, fail_status=503)
+
+        with self.assertRaises(CalendlyError) as raised:
+            client.scheduled_events("user")
+        self.assertEqual(raised.exception.status_code, 503)
+        self.assertEqual(app.requests, MAX_RETRIES + 1)
+
+    def test_other_4xx_are_not_retried(self, pause):
+        app, client = self.start(events=5)
+
+        with self.assertRaises(CalendlyError) as raised:
+            client.get(f"{app.base_url}/no/such/resource")
+        self.assertEqual(raised.exception.status_code, 404)
+        self.assertEqual(client.retries, 0)
+        pause.assert_not_called()
+
+
+class RateLimiterTests(FakeCalendlyTestCase):
+    def test_pauses_before_the_budget_runs_out(self):
+        # 3 requests per 1s window; fetching 7 pages needs three windows
+        app, client = self.start(events=7, max_page_size=1, rate_limit=3, rate_window=1)
+
+        started = time.monotonic()
+        self.assertEqual(len(client.scheduled_events("user")), 7)
+
+        # The remaining/reset headers kept every request under the limit
+        self.assertEqual(app.rejected, 0)
+        self.assertEqual(client.retries, 0)
+        self.assertGreater(client.rate_limiter.throttled, 0)
+        self.assertGreaterEqual(time.monotonic() - started, 1.0)
+
+    def test_spreads_the_last_requests_over_the_window(self):
+        limiter = RateLimiter()
+        response = mock.Mock(headers={"X-RateLimit-Remaining": "4", "X-RateLimit-Reset": "10"})
+        with mock.patch.object(RateLimiter, "pause", autospec=True) as pause:
+            limiter.observe(response)
+            response.headers["X-RateLimit-Remaining"] = "0"
+            limiter.observe(response)
+            response.headers["X-RateLimit-Remaining"] = "500"
+            limiter.observe(response)
+        self.assertEqual([call.args[1] for call in pause.call_args_list], [2.0, 10])
@@ -29,8 +29,10 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from lodore.auth_app import vip_profiles
 from lodore.auth_app.models import VIPPhone
 from lodore.auth_app.utils import normalize_phone
+from lodore.metrics import webhook_timer
 from .models import BookingLog
 
 logger = logging.getLogger("lodore")
@@ -162,6 +164,10 @@ class CalendlyWebhookView(APIView):
         event_type = payload.get("event", "unknown")
         logger.info("Calendly webhook received: event=%s", event_type)
 
+        with webhook_timer(event_type):
+            return self._process(payload, event_type)
+
+    def _process(self, payload, event_type):
         # --- Extract invitee info (name, email, phone) ---
         invitee_info = _extract_invitee_info(payload)
         phone = invitee_info.get("phone")
@@ -289,6 +295,7 @@ class CalendlyWebhookView(APIView):
                     if email:
                         vip.email = email
                     vip.save(update_fields=["booked", "bookings_count", "full_name", "email"])
+                    vip_profiles.refresh([phone])
                     logger.info("VIP marked as booked: phone=%s name=%s email=%s", phone, name, email)
                 except VIPPhone.DoesNotExist:
                     logger.info("Calendly booking for non-VIP phone=%s (not updating)", phone)
@@ -302,6 +309,7 @@ class CalendlyWebhookView(APIView):
                 if vip.bookings_count == 0:
                     vip.booked = False
                 vip.save(update_fields=["booked", "bookings_count"])
+                vip_profiles.refresh([phone])
                 logger.info("VIP booking canceled: phone=%s", phone)
             except VIPPhone.DoesNotExist:
                 pass
@@ -318,6 +326,7 @@ class CalendlyWebhookView(APIView):
                 if email:
                     vip.email = email
                 vip.save(update_fields=["full_name", "email"])
+                vip_profiles.refresh([phone])
                 logger.info("VIP booking rescheduled: phone=%s name=%s scheduled=%s", phone, name, scheduled_at)
             except VIPPhone.DoesNotExist:
                 logger.info("Calendly rescheduled for non-VIP phone=%s (not updating)", phone)
@@ -0,0 +1,221 @@
+"""
+Per-request metrics: SQL queries, cache hits/misses, external HTTP time.
+
+RequestMetricsMiddleware opens a RequestMetrics for every request and
+makes it the current one for the code running underneath:
+
+  - every SQL statement goes through a connection execute_wrapper that
+    counts it and adds its duration
+  - the Instrumented* cache backends record hits and misses
+  - ``with track_external("unifonic"):`` times outbound API calls
+
+When the response is ready the totals go to the Prometheus histograms in
+lodore.metrics, are logged on ``lodore.requests``
+(as ``key=value`` text and as a ``metrics`` dict in the record's extra),
+added as a ``Server-Timing`` header, and compared with the configured
+budgets; a request over budget is logged as a warning.
+
+Settings (all optional):
+  REQUEST_METRICS_ENABLED        turn the middleware into a pass-through
+  REQUEST_METRICS_SERVER_TIMING  add the Server-Timing header
+  REQUEST_QUERY_BUDGET           queries per request before warning
+  REQUEST_LATENCY_BUDGET_MS      total milliseconds before warning
+
+Outside a request (management commands, job workers) there is no current
+RequestMetrics and every hook is a no-op.
+"""
+import logging
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache.backends.db import DatabaseCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache
+from django.db import connections
+
+from lodore.metrics import observe_request
+
+logger = logging.getLogger("lodore.requests")
+
+_current = ContextVar("lodore_request_metrics", default=None)
+_in_get = ContextVar("lodore_cache_in_get", default=False)
+_MISSING = object()
+
+
+class RequestMetrics:
+    __slots__ = ("start", "queries", "db_ms", "cache_hits", "cache_misses", "external_ms", "total_ms")
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.queries = 0
+        self.db_ms = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # service name -> [calls, milliseconds]
+        self.external_ms = {}
+        self.total_ms = 0.0
+
+    def finish(self):
+        self.total_ms = (time.perf_counter() - self.start) * 1000
+
+    def as_dict(self) -> dict:
+        data = {
+            "queries": self.queries,
+            "db_ms": round(self.db_ms, 2),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "total_ms": round(self.total_ms, 2),
+        }
+        for service, (calls, elapsed) in self.external_ms.items():
+            data[f"{service}_calls"] = calls
+            data[f"{service}_ms"] = round(elapsed, 2)
+        return data
+
+    def server_timing(self) -> str:
+        parts = [
+            f'db;dur={self.db_ms:.1f};desc="{self.queries} queries"',
+            f'cache;desc="{self.cache_hits} hits {self.cache_misses} misses"',
+        ]
+        for service, (calls, elapsed) in self.external_ms.items():
+            parts.append(f'{service};dur={elapsed:.1f};desc="{calls} calls"')
+        parts.append(f"total;dur={self.total_ms:.1f}")
+        return ", ".join(parts)
+
+
+def current_metrics():
+    """The RequestMetrics of the request being served, or None."""
+    return _current.get()
+
+
+def _count_query(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.queries += 1
+        metrics.db_ms += (time.perf_counter() - start) * 1000
+
+
+@contextmanager
+def track_external(service: str):
+    """Time an outbound call (``service`` names it in logs and headers)."""
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        entry = metrics.external_ms.setdefault(service, [0, 0.0])
+        entry[0] += 1
+        entry[1] += (time.perf_counter() - start) * 1000
+
+
+def record_cache(hits: int = 0, misses: int = 0):
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.cache_hits += hits
+        metrics.cache_misses += misses
+
+
+class CacheMetricsMixin:
+    """Count hits and misses of a cache backend's reads."""
+
+    def get(self, key, default=None, version=None):
+        # Some backends (DatabaseCache) implement get() with get_many();
+        # count the lookup once, here
+        token = _in_get.set(True)
+        try:
+            value = super().get(key, _MISSING, version=version)
+        finally:
+            _in_get.reset(token)
+        if value is _MISSING:
+            record_cache(misses=1)
+            return default
+        record_cache(hits=1)
+        return value
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        found = super().get_many(keys, version=version)
+        if not _in_get.get():
+            record_cache(hits=len(found), misses=len(keys) - len(found))
+        return found
+
+
+class InstrumentedDatabaseCache(CacheMetricsMixin, DatabaseCache):
+    pass
+
+
+class InstrumentedLocMemCache(CacheMetricsMixin, LocMemCache):
+    pass
+
+
+class InstrumentedRedisCache(CacheMetricsMixin, RedisCache):
+    pass
+
+
+class RequestMetricsMiddleware:
+    """Collect, log and expose the metrics of every request (see module docstring)."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, "REQUEST_METRICS_ENABLED", True)
+        self.server_timing = getattr(settings, "REQUEST_METRICS_SERVER_TIMING", True)
+        self.query_budget = getattr(settings, "REQUEST_QUERY_BUDGET", 30)
+        self.latency_budget_ms = getattr(settings, "REQUEST_LATENCY_BUDGET_MS", 500)
+
+    def __call__(self, request):
+        if not self.enabled:
+            return self.get_response(request)
+
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(_count_query))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        metrics.finish()
+        observe_request(request, metrics)
+
+        if self.server_timing:
+            response["Server-Timing"] = metrics.server_timing()
+        self.report(request, response, metrics)
+        return response
+
+    def over_budget(self, metrics) -> list:
+        exceeded = []
+        if self.query_budget and metrics.queries > self.query_budget:
+            exceeded.append("queries")
+        if self.latency_budget_ms and metrics.total_ms > self.latency_budget_ms:
+            exceeded.append("latency")
+        return exceeded
+
+    def report(self, request, response, metrics):
+        exceeded = self.over_budget(metrics)
+        level = logging.WARNING if exceeded else logging.INFO
+        if not logger.isEnabledFor(level):
+            return
+        fields = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            **metrics.as_dict(),
+        }
+        if exceeded:
+            fields["over_budget"] = ",".join(exceeded)
+        logger.log(
+            level,
+            "request %s",
+            " ".join(f"{key}={value}" for key, value in fields.items()),
+            extra={"metrics": fields},
+        )
@@ -0,0 +1,8 @@
+"""
+Database-backed background jobs for long staff operations.
+
+Views enqueue work with ``lodore.jobs.api.enqueue``; ``manage.py run_jobs``
+claims queued rows with SELECT ... FOR UPDATE SKIP LOCKED and runs the
+handler registered for the job's kind. Staff poll
+``GET /api/jobs/<id>`` and fetch files from ``GET /api/jobs/<id>/download``.
+"""
@@ -0,0 +1,48 @@
+"""
+Enqueueing jobs and deciding when a request is big enough to need one.
+"""
+from django.conf import settings
+from rest_framework import status
+from rest_framework.response import Response
+
+from .models import Job
+from .registry import get_handler
+
+
+def enqueue(kind, params=None, input_data=None, input_name="", user=None) -> Job:
+    """Queue a job for ``manage.py run_jobs``; ``kind`` must be registered."""
+    get_handler(kind)
+    return Job.objects.create(
+        kind=kind,
+        params=params or {},
+        input_data=input_data,
+        input_name=input_name,
+        # By id: staff requests carry a token principal, not a User instance
+        created_by_id=user.pk if user is not None and user.is_authenticated else None,
+    )
+
+
+def exceeds_row_threshold(rows: int) -> bool:
+    """True when an operation over ``rows`` rows should run in the background."""
+    threshold = getattr(settings, "JOBS_ROW_THRESHOLD", 0)
+    return threshold > 0 and rows > threshold
+
+
+def exceeds_upload_threshold(size: int) -> bool:
+    """True when an uploaded file of ``size`` bytes should be processed in the background."""
+    threshold = getattr(settings, "JOBS_UPLOAD_BYTES_THRESHOLD", 0)
+    return threshold > 0 and size > threshold
+
+
+def accepted_response(job: Job) -> Response:
+    """202 answer for a request that was turned into a job."""
+    return Response(
+        {
+            "ok": True,
+            "message": "جاري تنفيذ الطلب في الخلفية.",
+            "jobId": job.pk,
+            "status": job.status,
+            "statusUrl": f"/api/jobs/{job.pk}",
+        },
+        status=status.HTTP_202_ACCEPTED,
+    )
@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class JobsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "lodore.jobs"
+    label = "jobs"
+    verbose_name = "Background Jobs"
+
+    def ready(self):
+        # Job handlers are registered by each app's operations module
+        autodiscover_modules("operations")
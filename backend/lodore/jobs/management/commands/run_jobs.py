@@ -0,0 +1,108 @@
+"""
+Management command: run_jobs
+
+Usage:
+  python manage.py run_jobs                  # JOBS_WORKERS threads, runs until stopped
+  python manage.py run_jobs --workers 4
+  python manage.py run_jobs --once           # drain the queue, then exit
+
+Each worker thread (with its own database connection) claims the oldest
+queued job with SELECT ... FOR UPDATE SKIP LOCKED, runs its handler and
+records the result; idle workers poll every --poll-interval seconds.
+Several run_jobs processes can share one queue. SIGTERM / Ctrl+C lets
+running jobs finish before exiting.
+"""
+import logging
+import os
+import signal
+import socket
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+
+from lodore.jobs.worker import claim_job, requeue_stale_jobs, run_job
+
+logger = logging.getLogger("lodore")
+
+# Seconds between sweeps for jobs left running by a dead worker
+STALE_CHECK_INTERVAL = 60
+
+
+class Command(BaseCommand):
+    help = "Run queued background jobs."
+
+    def add_arguments(self, parser):
+        workers = getattr(settings, "JOBS_WORKERS", 2)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=workers,
+            help=f"Jobs run concurrently (default {workers}).",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=getattr(settings, "JOBS_POLL_INTERVAL", 2.0),
+            help="Seconds an idle worker waits before polling again.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit when the queue is empty instead of waiting for new jobs.",
+        )
+
+    def handle(self, *args, **options):
+        self.stop = threading.Event()
+        self.poll_interval = options["poll_interval"]
+        self.once = options["once"]
+        workers = max(1, options["workers"])
+
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self._request_stop)
+            signal.signal(signal.SIGINT, self._request_stop)
+
+        requeue_stale_jobs()
+        prefix = f"{socket.gethostname()}:{os.getpid()}"
+        threads = [
+            threading.Thread(target=self._work, args=(f"{prefix}:{n}",), name=f"job-worker-{n}")
+            for n in range(1, workers + 1)
+        ]
+        self.stdout.write(f"Running jobs with {workers} workers ({prefix}).")
+        for thread in threads:
+            thread.start()
+
+        # Meanwhile, periodically recover jobs from crashed workers
+        last_check = time.monotonic()
+        while True:
+            alive = [thread for thread in threads if thread.is_alive()]
+            if not alive:
+                break
+            alive[0].join(self.poll_interval)
+            if not self.stop.is_set() and time.monotonic() - last_check >= STALE_CHECK_INTERVAL:
+                requeue_stale_jobs()
+                last_check = time.monotonic()
+        self.stdout.write("Job workers stopped.")
+
+    def _request_stop(self, signum, frame):
+        self.stdout.write("Stopping after running jobs finish...")
+        self.stop.set()
+
+    def _work(self, name):
+        try:
+            while not self.stop.is_set():
+                close_old_connections()
+                job = claim_job(name)
+                if job is None:
+                    if self.once:
+                        return
+                    self.stop.wait(self.poll_interval)
+                    continue
+                run_job(job)
+                self.stdout.write(f"  [{name}] job {job.pk} ({job.kind}): {job.status}")
+        except Exception:
+            logger.exception("Job worker %s crashed", name)
+        finally:
+            connection.close()
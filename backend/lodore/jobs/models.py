@@ -0,0 +1,82 @@
+"""
+Job model — one row per background operation, doubling as its queue entry.
+"""
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_SUCCEEDED = "succeeded"
+    STATUS_FAILED = "failed"
+
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, "Queued"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_SUCCEEDED, "Succeeded"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    kind = models.CharField(max_length=50)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+    # Operation arguments (ids, query params) and uploaded file, if any
+    params = models.JSONField(default=dict, blank=True)
+    input_name = models.CharField(max_length=255, blank=True, default="")
+    input_data = models.BinaryField(null=True, blank=True)
+    # Handler result (the JSON the view would have answered with)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True, default="")
+    # Downloadable output, e.g. an export workbook
+    output_name = models.CharField(max_length=255, blank=True, default="")
+    output_content_type = models.CharField(max_length=100, blank=True, default="")
+    output_data = models.BinaryField(null=True, blank=True)
+    progress_done = models.PositiveIntegerField(default=0)
+    progress_total = models.PositiveIntegerField(null=True, blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+    worker = models.CharField(max_length=100, blank=True, default="")
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL, related_name="+"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Job"
+        verbose_name_plural = "Jobs"
+        ordering = ["-created_at"]
+        indexes = [
+            # Queue polling: oldest queued job first
+            models.Index(fields=["status", "id"], name="job_status_id_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} #{self.pk} ({self.status})"
+
+    @property
+    def is_finished(self):
+        return self.status in (self.STATUS_SUCCEEDED, self.STATUS_FAILED)
+
+    def report_progress(self, done, total=None):
+        """Record progress (and a heartbeat) without touching other columns."""
+        self.progress_done = done
+        if total is not None:
+            self.progress_total = total
+        self.heartbeat_at = timezone.now()
+        Job.objects.filter(pk=self.pk).update(
+            progress_done=self.progress_done,
+            progress_total=self.progress_total,
+            heartbeat_at=self.heartbeat_at,
+        )
+
+    def attach_output(self, name, content_type, data: bytes):
+        """Store the file served by the download endpoint."""
+        self.output_name = name
+        self.output_content_type = content_type
+        self.output_data = data
+        Job.objects.filter(pk=self.pk).update(
+            output_name=name, output_content_type=content_type, output_data=data
+        )
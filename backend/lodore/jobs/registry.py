@@ -0,0 +1,24 @@
+"""
+Job kind → handler registry.
+
+Handlers take the running Job and return its JSON result; they are
+registered with ``@register("kind")`` in an app's ``operations`` module,
+which JobsConfig.ready() imports.
+"""
+_handlers = {}
+
+
+def register(kind: str):
+    def decorator(func):
+        if kind in _handlers and _handlers[kind] is not func:
+            raise ValueError(f"Job kind {kind!r} is already registered")
+        _handlers[kind] = func
+        return func
+    return decorator
+
+
+def get_handler(kind: str):
+    try:
+        return _handlers[kind]
+    except KeyError:
+        raise LookupError(f"No handler registered for job kind {kind!r}") from None
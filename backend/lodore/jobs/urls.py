@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import JobStatusView, JobDownloadView
+
+urlpatterns = [
+    path("<int:job_id>", JobStatusView.as_view(), name="job-status"),
+    path("<int:job_id>/download", JobDownloadView.as_view(), name="job-download"),
+]
@@ -0,0 +1,93 @@
+"""
+Job endpoints (staff only):
+  GET /api/jobs/<id>           status, progress and result
+  GET /api/jobs/<id>/download  file produced by the job (e.g. an export)
+"""
+from django.http import HttpResponse
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from lodore.auth_app.authentication import StaffJWTAuthentication
+from lodore.auth_app.permissions import IsStaffUser
+
+from .models import Job
+
+# Everything but the stored files
+_STATUS_FIELDS = (
+    "id", "kind", "status", "result", "error", "output_name",
+    "progress_done", "progress_total", "created_at", "started_at", "finished_at",
+)
+
+
+def _isoformat(value):
+    return value.isoformat() if value else None
+
+
+class JobStatusView(APIView):
+    """
+    GET /api/jobs/<id>
+
+    Poll a background job. ``result`` is the body the original endpoint
+    would have returned once the job has finished.
+    Staff only.
+    """
+    authentication_classes = [StaffJWTAuthentication]
+    permission_classes = [IsStaffUser]
+
+    def get(self, request, job_id):
+        job = Job.objects.filter(pk=job_id).values(*_STATUS_FIELDS).first()
+        if job is None:
+            return Response(
+                {"ok": False, "message": "Job not found."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        return Response(
+            {
+                "ok": True,
+                "job": {
+                    "id": job["id"],
+                    "kind": job["kind"],
+                    "status": job["status"],
+                    "progress": {"done": job["progress_done"], "total": job["progress_total"]},
+                    "result": job["result"],
+                    "error": job["error"],
+                    "download_url": f"/api/jobs/{job['id']}/download" if job["output_name"] else None,
+                    "created_at": _isoformat(job["created_at"]),
+                    "started_at": _isoformat(job["started_at"]),
+                    "finished_at": _isoformat(job["finished_at"]),
+                },
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class JobDownloadView(APIView):
+    """
+    GET /api/jobs/<id>/download
+
+    Download the file a finished job produced.
+    Staff only.
+    """
+    authentication_classes = [StaffJWTAuthentication]
+    permission_classes = [IsStaffUser]
+
+    def get(self, request, job_id):
+        job = (
+            Job.objects.filter(pk=job_id)
+            .values("status", "output_name", "output_content_type", "output_data")
+            .first()
+        )
+        if job is None or job["status"] != Job.STATUS_SUCCEEDED or not job["output_name"]:
+            return Response(
+                {"ok": False, "message": "No file available for this job."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        response = HttpResponse(
+            bytes(job["output_data"]),
+            content_type=job["output_content_type"] or "application/octet-stream",
+        )
+        response["Content-Disposition"] = f'attachment; filename="{job["output_name"]}"'
+        return response
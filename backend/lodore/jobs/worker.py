@@ -0,0 +1,121 @@
+"""
+Claiming and running jobs; used by ``manage.py run_jobs``.
+"""
+import logging
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import Job
+from .registry import get_handler
+
+logger = logging.getLogger("lodore")
+
+
+def claim_job(worker_name: str) -> Job | None:
+    """
+    Mark the oldest queued job as running and return it, or None.
+
+    SKIP LOCKED lets concurrent workers poll the same table without
+    blocking on (or double-claiming) each other's rows.
+    """
+    with transaction.atomic():
+        job = (
+            Job.objects.select_for_update(skip_locked=True)
+            .filter(status=Job.STATUS_QUEUED)
+            .defer("output_data")
+            .order_by("id")
+            .first()
+        )
+        if job is None:
+            return None
+        now = timezone.now()
+        job.status = Job.STATUS_RUNNING
+        job.worker = worker_name
+        job.started_at = now
+        job.heartbeat_at = now
+        job.attempts += 1
+        job.save(update_fields=["status", "worker", "started_at", "heartbeat_at", "attempts"])
+    return job
+
+
+class _Heartbeat:
+    """
+    Refresh a running job's heartbeat_at every JOBS_HEARTBEAT_SECONDS from a
+    background thread, so handlers that report no progress (or report it
+    rarely) are not taken for dead by requeue_stale_jobs().
+    """
+
+    def __init__(self, job: Job):
+        self.job = job
+        self.interval = getattr(settings, "JOBS_HEARTBEAT_SECONDS", 60)
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(
+            target=self._beat, name=f"job-{job.pk}-heartbeat", daemon=True
+        )
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stopped.set()
+        self.thread.join()
+
+    def _beat(self):
+        try:
+            while not self.stopped.wait(self.interval):
+                # Only while this worker still owns the job
+                Job.objects.filter(
+                    pk=self.job.pk, status=Job.STATUS_RUNNING, worker=self.job.worker
+                ).update(heartbeat_at=timezone.now())
+        except Exception:
+            logger.exception("Heartbeat for job %s stopped", self.job.pk)
+        finally:
+            connection.close()
+
+
+def run_job(job: Job):
+    """Run a claimed job's handler and record its result or error."""
+    logger.info("Job %s (%s) started on %s", job.pk, job.kind, job.worker)
+    try:
+        with _Heartbeat(job):
+            result = get_handler(job.kind)(job)
+    except Exception as exc:
+        message = getattr(exc, "message", None) or str(exc) or exc.__class__.__name__
+        logger.exception("Job %s (%s) failed: %s", job.pk, job.kind, message)
+        update = {"status": Job.STATUS_FAILED, "error": message, "result": {"ok": False, "message": message}}
+    else:
+        logger.info("Job %s (%s) succeeded", job.pk, job.kind)
+        # The upload is no longer needed once the job has succeeded
+        update = {"status": Job.STATUS_SUCCEEDED, "result": result, "input_data": None}
+    update["finished_at"] = timezone.now()
+    Job.objects.filter(pk=job.pk).update(**update)
+    for field, value in update.items():
+        setattr(job, field, value)
+    return job
+
+
+def requeue_stale_jobs() -> int:
+    """
+    Put back running jobs whose worker stopped sending heartbeats (e.g. it
+    was killed mid-job); after JOBS_MAX_ATTEMPTS they are failed instead.
+    """
+    stale_seconds = getattr(settings, "JOBS_STALE_SECONDS", 900)
+    max_attempts = getattr(settings, "JOBS_MAX_ATTEMPTS", 3)
+    cutoff = timezone.now() - timedelta(seconds=stale_seconds)
+    stale = Job.objects.filter(status=Job.STATUS_RUNNING, heartbeat_at__lt=cutoff)
+
+    failed = stale.filter(attempts__gte=max_attempts).update(
+        status=Job.STATUS_FAILED,
+        error="Worker stopped responding.",
+        result={"ok": False, "message": "Worker stopped responding."},
+        finished_at=timezone.now(),
+    )
+    requeued = stale.filter(attempts__lt=max_attempts).update(status=Job.STATUS_QUEUED, worker="")
+    if failed or requeued:
+        logger.warning("Stale jobs: %d requeued, %d failed", requeued, failed)
+    return requeued
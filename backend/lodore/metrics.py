@@ -0,0 +1,121 @@
+"""
+Prometheus metrics, served at /metrics.
+
+Metrics are module-level prometheus_client objects; recording one is a
+few microseconds, so they are updated inline on the request path.
+
+Under gunicorn every worker is a separate process. Set
+PROMETHEUS_MULTIPROC_DIR (before the process starts) and each process
+writes its values to memory-mapped files in that directory; /metrics
+then merges all of them, whichever worker answers the scrape.
+gunicorn.conf.py empties the directory on startup and drops the files
+of workers that exit; importing this module creates it if it is missing,
+since management commands (migrate, run_jobs) load it before gunicorn
+starts. Without the variable the process keeps its own values, which is
+fine for runserver.
+
+/metrics needs ``Authorization: Bearer <METRICS_TOKEN>``; with no
+METRICS_TOKEN it is only served when DEBUG is on.
+"""
+import hmac
+import os
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotFound
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144)
+# Webhook events we label by name; anything else is counted as "other"
+WEBHOOK_EVENTS = frozenset({"invitee.created", "invitee.canceled", "invitee.rescheduled"})
+
+# Unlabeled metrics open their file as soon as they are defined below
+if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+    os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+REQUEST_SECONDS = Histogram(
+    "lodore_request_duration_seconds",
+    "Request latency by view.",
+    ["view", "method"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUEST_QUERIES = Histogram(
+    "lodore_request_queries",
+    "SQL queries per request by view.",
+    ["view"],
+    buckets=QUERY_BUCKETS,
+)
+UNIFONIC_SEND_SECONDS = Histogram(
+    "lodore_unifonic_send_duration_seconds",
+    "Unifonic SMS API call latency.",
+    buckets=LATENCY_BUCKETS,
+)
+UNIFONIC_ERRORS = Counter(
+    "lodore_unifonic_errors",
+    "Failed OTP sends by Unifonic HTTP status (\"none\" for timeouts and network errors).",
+    ["status_code"],
+)
+WEBHOOK_SECONDS = Histogram(
+    "lodore_calendly_webhook_duration_seconds",
+    "Calendly webhook processing time by event type.",
+    ["event_type"],
+    buckets=LATENCY_BUCKETS,
+)
+TOKEN_CACHE_LOOKUPS = Counter(
+    "lodore_phone_token_cache_lookups",
+    "PhoneJWTAuthentication verified-token cache lookups by result (hit/miss).",
+    ["result"],
+)
+
+
+def view_label(request) -> str:
+    match = getattr(request, "resolver_match", None)
+    return (match.view_name or match._func_path) if match else "unmatched"
+
+
+def observe_request(request, request_metrics):
+    """Record a finished request (called by RequestMetricsMiddleware)."""
+    view = view_label(request)
+    REQUEST_SECONDS.labels(view, request.method).observe(request_metrics.total_ms / 1000)
+    REQUEST_QUERIES.labels(view).observe(request_metrics.queries)
+
+
+def observe_unifonic_error(exc):
+    UNIFONIC_ERRORS.labels(str(exc.status_code) if exc.status_code else "none").inc()
+
+
+def webhook_timer(event_type: str):
+    """Context manager timing one webhook, e.g. ``with webhook_timer(event): ...``."""
+    return WEBHOOK_SECONDS.labels(event_type if event_type in WEBHOOK_EVENTS else "other").time()
+
+
+def observe_token_cache(hit: bool):
+    TOKEN_CACHE_LOOKUPS.labels("hit" if hit else "miss").inc()
+
+
+def _authorized(request) -> bool:
+    token = getattr(settings, "METRICS_TOKEN", "")
+    if not token:
+        return settings.DEBUG
+    supplied = request.META.get("HTTP_AUTHORIZATION", "").removeprefix("Bearer ")
+    return hmac.compare_digest(supplied.encode(), token.encode())
+
+
+def metrics_view(request):
+    """GET /metrics in the Prometheus text format."""
+    if not _authorized(request):
+        return HttpResponseNotFound()
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return HttpResponse(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
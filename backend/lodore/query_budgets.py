@@ -0,0 +1,100 @@
+"""
+SQL query budgets for every API endpoint, checked by
+``manage.py check_query_budgets`` and by ``manage.py test``.
+
+Each URL name in auth_app/urls.py and calendly_app/urls.py has one entry:
+how to call it against the check's fixture (see the command) and the
+most queries a call may run. The check calls every endpoint at two
+data sizes and fails when a count exceeds its budget or grows with
+the size, which is how per-row lookups and per-row writes show up.
+
+``size`` is the number of rows the request touches: fixture rows for
+lists, exports and conversions, uploaded rows, submitted contacts.
+Endpoints whose input is capped (invitations take at most 3 contacts)
+set their own ``sizes``.
+
+Counts include the DRF throttle, which costs about six queries per
+request against the database cache. When a change legitimately adds a
+query, raise the budget here in the same commit.
+"""
+
+
+class Endpoint:
+    """How to call one URL name and how many queries it may run."""
+
+    def __init__(self, method, queries, auth="anon", data=None, query=None, kwargs=None,
+                 multipart=False, headers=None, sizes=None):
+        self.method = method
+        self.queries = queries
+        # "anon", "vip" (phone JWT) or "staff"
+        self.auth = auth
+        # Callables taking (fixture, size)
+        self.data = data
+        self.query = query
+        self.kwargs = kwargs
+        self.multipart = multipart
+        self.headers = headers or {}
+        self.sizes = sizes
+
+
+def _contacts(fixture, size):
+    return [
+        {"name": f"مدعو {i}", "phone": fixture.new_phone(i)} for i in range(size)
+    ]
+
+
+BUDGETS = {
+    # --- Public / VIP ---
+    "request-otp": Endpoint(
+        "post", 15, data=lambda f, n: {"phone": f.request_phone},
+    ),
+    "verify-otp": Endpoint(
+        "post", 10,
+        data=lambda f, n: {"phone": f.unbooked_phone, "requestId": f.otp_reference, "code": f.otp_code},
+    ),
+    "token-refresh": Endpoint("post", 12, data=lambda f, n: {"refresh": f.vip_refresh}),
+    "me": Endpoint("get", 7, auth="vip"),
+    "invitations": Endpoint(
+        "post", 9, auth="vip", data=lambda f, n: {"contacts": _contacts(f, n)}, sizes=(1, 3),
+    ),
+    "visitor-nominations": Endpoint(
+        "post", 15,
+        data=lambda f, n: {"submitter_phone": f.unbooked_phone, "contacts": _contacts(f, n)},
+        sizes=(1, 3),
+    ),
+    "calendly-webhook": Endpoint(
+        "post", 21, data=lambda f, n: f.webhook_payload(),
+        headers={"HTTP_X_WEBHOOK_SECRET": "query-budget-secret"},
+    ),
+    # --- Staff ---
+    "staff-login": Endpoint(
+        "post", 13, data=lambda f, n: {"username": f.staff_username, "password": f.staff_password},
+    ),
+    "dashboard-stats": Endpoint("get", 29, auth="staff"),
+    "nominations-list": Endpoint("get", 9, auth="staff", query=lambda f, n: {"page_size": n}),
+    "export-nominations": Endpoint(
+        "get", 8, auth="staff", query=lambda f, n: {"ids": ",".join(map(str, f.nomination_ids[:n]))},
+    ),
+    "convert-nominations-to-vip": Endpoint(
+        "post", 11, auth="staff", data=lambda f, n: {"ids": f.nomination_ids[:n]},
+    ),
+    "update-nomination-status": Endpoint(
+        "patch", 8, auth="staff", data=lambda f, n: {"status": "contacted"},
+        kwargs=lambda f: {"nomination_id": f.nomination_ids[0]},
+    ),
+    "reservations-list": Endpoint("get", 9, auth="staff", query=lambda f, n: {"page_size": n}),
+    "convert-to-vip": Endpoint(
+        "post", 11, auth="staff", data=lambda f, n: {"ids": f.booking_ids[:n]},
+    ),
+    "upload-vip-data": Endpoint(
+        "post", 10, auth="staff", data=lambda f, n: {"file": f.workbook(n)}, multipart=True,
+    ),
+    "vip-list": Endpoint("get", 8, auth="staff", query=lambda f, n: {"page_size": n}),
+    "manage-vip": Endpoint(
+        "post", 10, auth="staff",
+        data=lambda f, n: {"phone": f.vip_phones[0], "full_name": "تحديث", "email": ""},
+    ),
+    "delete-vip": Endpoint(
+        "delete", 8, auth="staff", kwargs=lambda f: {"vip_id": f.vip_ids[-1]},
+    ),
+}
@@ -0,0 +1,87 @@
+"""
+Fast JSON rendering for the hot API endpoints.
+
+FastJSONRenderer writes the same JSON as DRF's JSONRenderer does with
+this project's settings: compact, with Arabic text as UTF-8 rather than
+\\u escapes. It serializes with orjson when it is installed, and
+otherwise with one JSONEncoder built at import time instead of one per
+response. Values neither handles natively (Decimals, lazy translation
+strings, datetimes that were not already formatted, ...) go through
+DRF's encoder, so they render exactly as before.
+
+PreSerialized wraps a constant payload that is encoded once, when the
+module defining it is imported; the renderer sends its bytes as they
+are.
+
+JSONOnlyNegotiation skips Accept-header parsing for views whose only
+renderer is JSON. A view opts in with::
+
+    renderer_classes = [FastJSONRenderer]
+    content_negotiation_class = JSONOnlyNegotiation
+"""
+from rest_framework.negotiation import DefaultContentNegotiation
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None
+
+# DRF escapes these two for JavaScript (they end a line inside a JS string)
+_JS_ESCAPES = (("\u2028".encode(), b"\\u2028"), ("\u2029".encode(), b"\\u2029"))
+
+_encoder = JSONEncoder(ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def dumps(data) -> bytes:
+        """Encode ``data`` as compact UTF-8 JSON."""
+        content = orjson.dumps(data, default=_encoder.default, option=_ORJSON_OPTIONS)
+        return _escape_js(content)
+else:
+    def dumps(data) -> bytes:
+        """Encode ``data`` as compact UTF-8 JSON."""
+        return _escape_js(_encoder.encode(data).encode())
+
+
+def _escape_js(content: bytes) -> bytes:
+    for raw, escaped in _JS_ESCAPES:
+        if raw in content:
+            content = content.replace(raw, escaped)
+    return content
+
+
+class PreSerialized:
+    """A constant response body, encoded once: ``Response(PreSerialized({...}))``."""
+
+    __slots__ = ("data", "content")
+
+    def __init__(self, data):
+        self.data = data
+        self.content = dumps(data)
+
+    def __repr__(self):
+        return f"PreSerialized({self.data!r})"
+
+
+class FastJSONRenderer(BaseRenderer):
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if isinstance(data, PreSerialized):
+            return data.content
+        return dumps(data)
+
+
+class JSONOnlyNegotiation(DefaultContentNegotiation):
+    """Always pick the view's first renderer, whatever the Accept header says."""
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        renderer = renderers[0]
+        return renderer, renderer.media_type
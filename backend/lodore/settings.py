@@ -4,6 +4,7 @@ Django settings for Lodore Villa VIP Booking System.
 import os
 from datetime import timedelta
 from decouple import config, Csv
+from django.core.exceptions import ImproperlyConfigured
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
@@ -20,6 +21,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # Third-party
     "rest_framework",
     "rest_framework_simplejwt",
@@ -27,9 +29,11 @@ INSTALLED_APPS = [
     # Local
     "lodore.auth_app",
     "lodore.calendly_app",
+    "lodore.jobs",
 ]
 
 MIDDLEWARE = [
+    "lodore.instrumentation.RequestMetricsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -72,6 +76,26 @@ DATABASES = {
     }
 }
 
+# --- Database connections ---
+# DB_POOL_MODE:
+#   "off"         open and close a connection for every request (Django's default)
+#   "persistent"  each worker keeps its connection for up to DB_CONN_MAX_AGE seconds
+#   "pgbouncer"   POSTGRES_HOST/PORT point at PgBouncer in transaction pooling mode:
+#                 persistent client connections, no server-side cursors (a cursor
+#                 cannot outlive the transaction that pins a server connection)
+DB_POOL_MODE = config("DB_POOL_MODE", default="persistent")
+if DB_POOL_MODE not in ("off", "persistent", "pgbouncer"):
+    raise ImproperlyConfigured(
+        f"DB_POOL_MODE must be 'off', 'persistent' or 'pgbouncer', not {DB_POOL_MODE!r}"
+    )
+DATABASES["default"].update({
+    "CONN_MAX_AGE": 0 if DB_POOL_MODE == "off" else config("DB_CONN_MAX_AGE", default=60, cast=int),
+    # Ping a reused connection at the start of each request, so a connection
+    # dropped by Postgres / PgBouncer is replaced instead of failing the request
+    "CONN_HEALTH_CHECKS": config("DB_CONN_HEALTH_CHECKS", default=True, cast=bool),
+    "DISABLE_SERVER_SIDE_CURSORS": DB_POOL_MODE == "pgbouncer",
+})
+
 # --- Password validation ---
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
@@ -90,11 +114,29 @@ STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # --- Cache (shared across workers) ---
+# Redis for the caches that must not cost a query; give it a database of its
+# own (e.g. redis://redis:6379/1), since large VIP imports flush it
+REDIS_URL = config("REDIS_URL", default="")
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        # DatabaseCache that reports hits/misses to the request metrics
+        "BACKEND": "lodore.instrumentation.InstrumentedDatabaseCache",
         "LOCATION": "django_cache_table",
-    }
+    },
+    # Per-process, for short-lived state that must not cost a query (staff auth)
+    "local": {
+        "BACKEND": "lodore.instrumentation.InstrumentedLocMemCache",
+        "LOCATION": "lodore-local",
+    },
+    # Profiles behind /api/auth/me (see auth_app.vip_profiles); must be shared by
+    # every process, so it is only enabled with Redis
+    "vip_profiles": {
+        "BACKEND": "lodore.instrumentation.InstrumentedRedisCache",
+        "LOCATION": REDIS_URL,
+        "TIMEOUT": config("VIP_PROFILE_CACHE_SECONDS", default=600, cast=int),
+    } if REDIS_URL else {
+        "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+    },
 }
 
 # --- REST Framework ---
@@ -110,13 +152,18 @@ REST_FRAMEWORK = {
         "rest_framework.throttling.UserRateThrottle",
     ],
     "DEFAULT_THROTTLE_RATES": {
-        "anon": "1000/day",
-        "user": "1000/day",
+        "anon": config("THROTTLE_RATE_ANON", default="1000/day"),
+        "user": config("THROTTLE_RATE_USER", default="1000/day"),
         "request_otp": "100/hour",   # loosened for testing — tighten in production
         "verify_otp": "100/hour",    # loosened for testing — tighten in production
     },
 }
 
+# --- Management lists ---
+# "estimate" keeps list responses constant-time on large tables; "exact" always runs COUNT(*)
+LIST_COUNT_MODE = config("LIST_COUNT_MODE", default="estimate")
+LIST_COUNT_CAP = config("LIST_COUNT_CAP", default=10000, cast=int)
+
 # --- JWT ---
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=15),
@@ -127,6 +174,12 @@ SIMPLE_JWT = {
     "USER_ID_FIELD": "id",
     "USER_ID_CLAIM": "user_id",
 }
+# Staff tokens carry their staff flags; re-read the User row at most this often
+# per process so deactivated/demoted accounts lose access (0 = trust the token)
+STAFF_AUTH_RECHECK_SECONDS = config("STAFF_AUTH_RECHECK_SECONDS", default=30, cast=int)
+# Verified VIP access tokens kept per process until they expire, so repeat
+# requests skip signature and claim checks (0 = verify every request)
+PHONE_TOKEN_CACHE_SIZE = config("PHONE_TOKEN_CACHE_SIZE", default=4096, cast=int)
 
 # --- CORS ---
 CORS_ALLOWED_ORIGINS = config(
@@ -142,12 +195,44 @@ CSRF_TRUSTED_ORIGINS = config(
 # --- Unifonic ---
 UNIFONIC_APP_SID = config("UNIFONIC_APP_SID", default="")
 UNIFONIC_API_KEY = config("UNIFONIC_API_KEY", default="")
+UNIFONIC_SMS_URL = config(
+    "UNIFONIC_SMS_URL", default="https://el.cloud.unifonic.com/rest/SMS/messages"
+)
 UNIFONIC_VERIFY_BASE_URL = config(
     "UNIFONIC_VERIFY_BASE_URL", default="https://verifyapi.unifonic.com/api/v1"
 )
 
 # --- Calendly ---
 CALENDLY_WEBHOOK_SECRET = config("CALENDLY_WEBHOOK_SECRET", default="changeme")
+# Personal access token and API root used by the sync tooling
+CALENDLY_API_TOKEN = config("CALENDLY_API_TOKEN", default="")
+CALENDLY_API_BASE_URL = config("CALENDLY_API_BASE_URL", default="https://api.calendly.com")
+CALENDLY_SYNC_WORKERS = config("CALENDLY_SYNC_WORKERS", default=8, cast=int)
+
+# --- Imports ---
+# Processes normalizing rows in the VIP imports and Excel upload (1 = inline)
+IMPORT_WORKERS = config("IMPORT_WORKERS", default=1, cast=int)
+
+# --- Background jobs (manage.py run_jobs) ---
+# Staff operations above these sizes return a job id instead of running in the request
+JOBS_ROW_THRESHOLD = config("JOBS_ROW_THRESHOLD", default=2000, cast=int)
+JOBS_UPLOAD_BYTES_THRESHOLD = config("JOBS_UPLOAD_BYTES_THRESHOLD", default=1_000_000, cast=int)
+JOBS_WORKERS = config("JOBS_WORKERS", default=2, cast=int)
+JOBS_POLL_INTERVAL = config("JOBS_POLL_INTERVAL", default=2.0, cast=float)
+# Running jobs without a heartbeat for this long are retried (up to JOBS_MAX_ATTEMPTS)
+JOBS_STALE_SECONDS = config("JOBS_STALE_SECONDS", default=900, cast=int)
+# How often a worker refreshes the heartbeat of the job it is running
+JOBS_HEARTBEAT_SECONDS = config("JOBS_HEARTBEAT_SECONDS", default=60, cast=int)
+JOBS_MAX_ATTEMPTS = config("JOBS_MAX_ATTEMPTS", default=3, cast=int)
+
+# --- Request metrics (lodore.instrumentation) ---
+# Logged on "lodore.requests"; requests over either budget are logged as warnings
+REQUEST_METRICS_ENABLED = config("REQUEST_METRICS_ENABLED", default=True, cast=bool)
+REQUEST_METRICS_SERVER_TIMING = config("REQUEST_METRICS_SERVER_TIMING", default=True, cast=bool)
+REQUEST_QUERY_BUDGET = config("REQUEST_QUERY_BUDGET", default=30, cast=int)
+REQUEST_LATENCY_BUDGET_MS = config("REQUEST_LATENCY_BUDGET_MS", default=500, cast=int)
+# Bearer token Prometheus scrapes /metrics with (empty: /metrics only in DEBUG)
+METRICS_TOKEN = config("METRICS_TOKEN", default="")
 
 # --- OTP Settings ---
 OTP_EXPIRY_MINUTES = 30           # loosened for testing — use 5 in production
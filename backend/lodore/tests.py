@@ -0,0 +1,28 @@
+"""
+Tests for the project-level modules (settings, urls, metrics).
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+
+class MetricsMultiprocessTests(SimpleTestCase):
+    def test_urls_import_creates_a_missing_multiprocess_dir(self):
+        # A fresh process: the metrics are created when lodore.metrics is first imported
+        with tempfile.TemporaryDirectory() as parent:
+            path = os.path.join(parent, "prometheus")
+            result = subprocess.run(
+                [sys.executable, "-c", "import django; django.setup(); import lodore.urls"],
+                cwd=settings.BASE_DIR,
+                env={**os.environ, "DJANGO_SETTINGS_MODULE": "lodore.settings", "PROMETHEUS_MULTIPROC_DIR": path},
+                capture_output=True,
+                text=True,
+                timeout=60,
+            )
+            self.assertEqual(result.returncode, 0, result.stderr)
+            self.assertTrue(os.path.isdir(path))
+            self.assertTrue(any(name.startswith("histogram_") for name in os.listdir(path)))
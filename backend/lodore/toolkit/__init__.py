@@ -0,0 +1,9 @@
+"""
+Shared building blocks for the data management commands.
+
+  streaming  incremental JSON / NDJSON / CSV readers and ``chunked``
+  batching   BatchWriter: buffer items, hand them to a writer in batches
+  progress   ProgressReporter: periodic "N rows (X rows/s)" lines
+  pipeline   parallel_map: ordered, bounded process-pool stage
+  command    BatchCommand: BaseCommand with --dry-run / --batch-size
+"""
@@ -0,0 +1,51 @@
+"""
+Batch writer shared by the import commands.
+"""
+
+
+class BatchWriter:
+    """
+    Buffer items and pass them to ``write_batch(items)`` ``batch_size`` at
+    a time. Use as a context manager (or call ``flush()``) so the last
+    partial batch is written.
+
+    With ``dry_run`` the batches are counted but never written. When a
+    ProgressReporter is given it is advanced as batches go out.
+    """
+
+    def __init__(self, write_batch, batch_size: int = 1000, dry_run: bool = False, progress=None):
+        self.write_batch = write_batch
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self.progress = progress
+        self.batches = 0
+        self.items = 0
+        self._buffer = []
+
+    def add(self, item):
+        self._buffer.append(item)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def extend(self, items):
+        for item in items:
+            self.add(item)
+
+    def flush(self):
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        if not self.dry_run:
+            self.write_batch(batch)
+        self.batches += 1
+        self.items += len(batch)
+        if self.progress is not None:
+            self.progress.add(len(batch))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+        return False
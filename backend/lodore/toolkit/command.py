@@ -0,0 +1,54 @@
+"""
+Base class for the batch data management commands.
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from .progress import ProgressReporter
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class BatchCommand(BaseCommand):
+    """
+    BaseCommand with the options every data command shares:
+
+      --dry-run      read and validate everything, write nothing
+      --batch-size   rows per database batch
+      --workers      normalization processes (only when ``parallel``)
+
+    Subclasses extend ``add_arguments`` via ``super()`` and use
+    ``self.progress(label)`` for throughput reporting.
+    """
+
+    default_batch_size = DEFAULT_BATCH_SIZE
+    # Commands that clean rows through toolkit.pipeline set this
+    parallel = False
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Read and validate without saving to the database.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=self.default_batch_size,
+            help=f"Rows per database batch (default {self.default_batch_size}).",
+        )
+        if self.parallel:
+            workers = getattr(settings, "IMPORT_WORKERS", 1)
+            parser.add_argument(
+                "--workers",
+                type=int,
+                default=workers,
+                help=f"Processes normalizing rows; 1 runs inline (default {workers}).",
+            )
+
+    def progress(self, label: str = "rows", total: int | None = None) -> ProgressReporter:
+        return ProgressReporter(self.stdout.write, label=label, total=total)
+
+    def announce_dry_run(self, dry_run: bool):
+        if dry_run:
+            self.stdout.write(self.style.WARNING("DRY RUN — no changes will be saved."))
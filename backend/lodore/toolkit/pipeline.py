@@ -0,0 +1,53 @@
+"""
+Reader → process pool → writer pipeline for CPU-bound row cleanup.
+
+The caller's loop is both ends of the pipeline: it produces chunks (the
+reader stage) and consumes results (the single writer stage), while the
+chunks in between are normalized in worker processes:
+
+    for result in parallel_map(normalize_chunk, chunked(rows, 5000), workers=4):
+        write(result)
+
+Results come back in input order. At most ``max_pending`` chunks are in
+flight, so a slow writer stops the reader instead of letting parsed rows
+pile up in memory.
+
+``func`` runs in other processes: it must be a module-level function and
+should only depend on pure-Python helpers (no ORM access).
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+def parallel_map(func, chunks, workers: int = 1, max_pending: int | None = None):
+    """
+    Yield ``func(chunk)`` for every chunk of ``chunks``, in order.
+
+    ``workers <= 1`` runs inline with no pool. Otherwise up to
+    ``max_pending`` chunks (default ``2 * workers``) are submitted to a
+    ProcessPoolExecutor before the oldest result is waited for.
+    """
+    if workers <= 1:
+        for chunk in chunks:
+            yield func(chunk)
+        return
+
+    max_pending = max(1, max_pending or 2 * workers)
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        try:
+            for chunk in chunks:
+                pending.append(pool.submit(func, chunk))
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # Consumer stopped early or a stage failed: drop queued work
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,47 @@
+"""
+Throughput reporting for long-running commands.
+"""
+import time
+
+
+class ProgressReporter:
+    """
+    Count processed rows and write a progress line at most every
+    ``interval`` seconds, plus a final summary from ``finish()``.
+
+    ``write`` is any callable taking a string (e.g. ``self.stdout.write``).
+    """
+
+    def __init__(self, write, label: str = "rows", interval: float = 2.0, total: int | None = None):
+        self.write = write
+        self.label = label
+        self.interval = interval
+        self.total = total
+        self.count = 0
+        self.started = time.perf_counter()
+        self._last_report = self.started
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def rate(self) -> float:
+        elapsed = self.elapsed
+        return self.count / elapsed if elapsed > 0 else 0.0
+
+    def _line(self) -> str:
+        done = f"{self.count:,}" if self.total is None else f"{self.count:,}/{self.total:,}"
+        return f"  {self.label}: {done} in {self.elapsed:.1f}s ({self.rate:,.0f} rows/s)"
+
+    def add(self, n: int = 1):
+        self.count += n
+        now = time.perf_counter()
+        if now - self._last_report >= self.interval:
+            self._last_report = now
+            self.write(self._line())
+
+    def finish(self) -> str:
+        line = self._line()
+        self.write(line)
+        return line
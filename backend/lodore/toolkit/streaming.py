@@ -0,0 +1,172 @@
+"""
+Incremental readers for import files.
+
+Nothing here loads a whole file: JSON arrays are decoded one element at a
+time from a bounded buffer, NDJSON line by line, and CSV through
+``csv.DictReader``, so memory stays flat however large the input is.
+"""
+import csv
+import json
+from itertools import islice
+
+READ_SIZE = 1 << 16
+
+_WHITESPACE = " \t\r\n"
+_decoder = json.JSONDecoder()
+
+
+class StreamFormatError(ValueError):
+    """The input is not the JSON shape the reader was asked for."""
+
+
+def chunked(iterable, size: int):
+    """Yield lists of up to ``size`` items from ``iterable``."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class _JSONStream:
+    """Cursor over a text file that decodes one JSON value at a time."""
+
+    def __init__(self, fh):
+        self.fh = fh
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        data = self.fh.read(READ_SIZE)
+        if not data:
+            self.eof = True
+            return False
+        # Drop what has been consumed so the buffer stays bounded
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at end of input)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise StreamFormatError(f"expected one of {chars!r}, found {char or 'end of input'!r}")
+        self.pos += 1
+        return char
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number at the edge of the buffer may continue in the next read
+            if end == len(self.buf) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def array_items(self):
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(",]") == "]":
+                return
+
+
+def iter_json_records(fh, key: str | None = None):
+    """
+    Yield records from a JSON file without loading it.
+
+    Accepts a top-level array, or (with ``key``) a top-level object whose
+    ``key`` member is the array, e.g. ``{"summary": {...}, "to_add": [...]}``.
+    Other members of that object are decoded and discarded, so they should
+    be small.
+    """
+    stream = _JSONStream(fh)
+    if key is None:
+        yield from stream.array_items()
+        return
+
+    stream.expect("{")
+    if stream.peek() == "}":
+        return
+    while True:
+        name = stream.value()
+        stream.expect(":")
+        if name == key:
+            yield from stream.array_items()
+            return
+        stream.value()
+        if stream.expect(",}") == "}":
+            return
+
+
+def iter_ndjson_records(fh):
+    """Yield one record per non-blank line."""
+    for line_num, line in enumerate(fh, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise StreamFormatError(f"line {line_num}: {exc}") from exc
+
+
+def iter_records(path: str, key: str | None = None):
+    """
+    Yield records from ``path``: NDJSON for ``.ndjson``/``.jsonl`` files,
+    otherwise JSON as described in ``iter_json_records``.
+    """
+    with open(path, encoding="utf-8") as fh:
+        if path.endswith((".ndjson", ".jsonl")):
+            yield from iter_ndjson_records(fh)
+        else:
+            yield from iter_json_records(fh, key=key)
+
+
+def csv_reader(fh) -> csv.DictReader:
+    """
+    ``csv.DictReader`` over ``fh`` with lower-cased, stripped column names.
+
+    The delimiter (comma, semicolon or tab) is sniffed from the first 2KB,
+    falling back to comma. Raises StreamFormatError on a missing header.
+    """
+    sample = fh.read(2048)
+    fh.seek(0)
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        reader = csv.DictReader(fh, dialect=dialect)
+    except csv.Error:
+        reader = csv.DictReader(fh)
+
+    if reader.fieldnames is None:
+        raise StreamFormatError("CSV file appears to be empty or has no header row.")
+    reader.fieldnames = [f.strip().lower() for f in reader.fieldnames]
+    return reader
+
+
+def iter_csv_rows(fh):
+    """Yield rows of ``csv_reader(fh)`` as dicts."""
+    yield from csv_reader(fh)
@@ -0,0 +1,112 @@
+"""
+Tests for the toolkit's streaming readers.
+"""
+import io
+import json
+import os
+import tempfile
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from lodore.toolkit import streaming
+from lodore.toolkit.streaming import (
+    StreamFormatError,
+    iter_json_records,
+    iter_ndjson_records,
+    iter_records,
+)
+
+RECORDS = [
+    {"phone": "0512345678", "name": "سارة القحطاني", "n": 1234567890},
+    {"phone": "0598765432", "name": 'quote " and [brackets], {braces}', "n": -1.5e3},
+    {"phone": "", "name": "back\\slash", "tags": [1, [2, 3], {"x": None}]},
+    [],
+    1234567,
+    "tail",
+]
+
+
+class JSONRecordsTests(SimpleTestCase):
+    def read(self, text, key=None, read_size=streaming.READ_SIZE):
+        with mock.patch.object(streaming, "READ_SIZE", read_size):
+            return list(iter_json_records(io.StringIO(text), key=key))
+
+    def test_values_split_across_chunk_boundaries(self):
+        text = json.dumps(RECORDS, ensure_ascii=False, indent=1)
+        for read_size in (1, 2, 3, 7, 64, len(text)):
+            with self.subTest(read_size=read_size):
+                self.assertEqual(self.read(text, read_size=read_size), RECORDS)
+
+    def test_named_member(self):
+        text = json.dumps({
+            "summary": {"total": 3, "skipped": [1, 2]},
+            "to_remove": [{"phone": "x"}],
+            "to_add": RECORDS,
+            "after": "ignored",
+        })
+        for read_size in (1, 5, 4096):
+            with self.subTest(read_size=read_size):
+                self.assertEqual(self.read(text, key="to_add", read_size=read_size), RECORDS)
+
+    def test_empty_and_missing(self):
+        self.assertEqual(self.read("  [ ]  "), [])
+        self.assertEqual(self.read("{}", key="to_add"), [])
+        self.assertEqual(self.read('{"to_add": []}', key="to_add"), [])
+        self.assertEqual(self.read('{"summary": {"total": 0}}', key="to_add"), [])
+
+    def test_buffer_stays_bounded(self):
+        record = {"phone": "0512345678", "name": "x" * 50}
+        text = json.dumps([record] * 2000)
+        stream = streaming._JSONStream(io.StringIO(text))
+        largest = 0
+        with mock.patch.object(streaming, "READ_SIZE", 256):
+            for _ in stream.array_items():
+                largest = max(largest, len(stream.buf))
+        self.assertLess(largest, 2 * 256 + len(json.dumps(record)))
+
+    def test_malformed_input(self):
+        cases = [
+            ('{"to_add": []}', None),  # object where an array is expected
+            ("[1, 2", None),  # truncated
+            ("[1 2]", None),  # missing comma
+            ("[1, }", None),
+            ('[{"phone": "05}]', None),  # unterminated string
+            ('{"to_add" [1]}', "to_add"),  # missing colon
+            ("[1]", "to_add"),  # array where an object is expected
+            ("", None),
+        ]
+        for text, key in cases:
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    self.read(text, key=key, read_size=3)
+
+    def test_shape_errors_are_stream_format_errors(self):
+        with self.assertRaises(StreamFormatError):
+            self.read('{"to_add": []}')
+        with self.assertRaises(StreamFormatError):
+            self.read("[1 2]")
+
+
+class NDJSONRecordsTests(SimpleTestCase):
+    def test_one_record_per_line(self):
+        text = "\n".join(json.dumps(record, ensure_ascii=False) for record in RECORDS)
+        self.assertEqual(list(iter_ndjson_records(io.StringIO("\n" + text + "\n\n  \n"))), RECORDS)
+
+    def test_malformed_line_is_reported(self):
+        records = iter_ndjson_records(io.StringIO('{"a": 1}\n\n{"a": \n{"a": 3}\n'))
+        self.assertEqual(next(records), {"a": 1})
+        with self.assertRaisesMessage(StreamFormatError, "line 3"):
+            next(records)
+
+    def test_iter_records_picks_the_reader_by_extension(self):
+        with tempfile.TemporaryDirectory() as directory:
+            ndjson = os.path.join(directory, "bookings.jsonl")
+            with open(ndjson, "w", encoding="utf-8") as fh:
+                fh.write("\n".join(json.dumps(record) for record in RECORDS))
+            array = os.path.join(directory, "bookings.json")
+            with open(array, "w", encoding="utf-8") as fh:
+                json.dump({"to_add": RECORDS}, fh)
+
+            self.assertEqual(list(iter_records(ndjson)), RECORDS)
+            self.assertEqual(list(iter_records(array, key="to_add")), RECORDS)
@@ -3,10 +3,14 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 
+from lodore.metrics import metrics_view
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/auth/", include("lodore.auth_app.urls")),
     path("api/calendly/", include("lodore.calendly_app.urls")),
+    path("api/jobs/", include("lodore.jobs.urls")),
+    path("metrics", metrics_view, name="metrics"),
 ]
 
 # Serve static files in development
@@ -59,3 +59,52 @@ export const getDashboardStats = async () => {
   const { data } = await apiClient.get("/api/auth/management/dashboard/stats");
   return data;
 };
+
+// ----- Background jobs -----
+// Large uploads, exports and conversions answer 202 { jobId } instead of
+// their result; poll the job until it finishes.
+
+const JOB_POLL_INTERVAL_MS = 2000;
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+/**
+ * Poll a background job until it succeeds or fails
+ * @param {number} jobId
+ * @returns {Promise<{id: number, status: string, result: Object, error: string, download_url: string|null}>}
+ */
+export const waitForJob = async (jobId) => {
+  for (;;) {
+    const { data } = await apiClient.get(`/api/jobs/${jobId}`);
+    if (data.job.status === "succeeded" || data.job.status === "failed") {
+      return data.job;
+    }
+    await sleep(JOB_POLL_INTERVAL_MS);
+  }
+};
+
+/**
+ * Body of a management response, waiting for the job first when the
+ * request was queued (202)
+ * @param {Response} response - fetch() response
+ * @returns {Promise<{ok: boolean, data: Object, job: Object|null}>}
+ */
+export const resolveJobResponse = async (response) => {
+  const data = await response.json();
+  if (response.status !== 202 || !data.jobId) {
+    return { ok: response.ok, data, job: null };
+  }
+  const job = await waitForJob(data.jobId);
+  const result = job.result || { ok: false, message: job.error };
+  return { ok: job.status === "succeeded", data: result, job };
+};
+
+/**
+ * Download the file a finished job produced (e.g. an export)
+ * @param {Object} job - as returned by waitForJob
+ * @returns {Promise<Blob>}
+ */
+export const downloadJobOutput = async (job) => {
+  const { data } = await apiClient.get(job.download_url, { responseType: "blob" });
+  return data;
+};
@@ -4,7 +4,12 @@
  */
 import { useState, useEffect } from "react";
 import { useNavigate } from "react-router-dom";
-import { getNominations, updateNominationStatus } from "../api/staff";
+import {
+  downloadJobOutput,
+  getNominations,
+  resolveJobResponse,
+  updateNominationStatus,
+} from "../api/staff";
 import { clearTokens } from "../api/client";
 import ManagementLayout from "../components/ManagementLayout";
 
@@ -121,7 +126,17 @@ export default function ManagementDashboardPage() {
         throw new Error('Export failed');
       }
 
-      const blob = await response.blob();
+      // Large exports are built by a background job
+      let blob;
+      if (response.status === 202) {
+        const { ok, job } = await resolveJobResponse(response);
+        if (!ok || !job.download_url) {
+          throw new Error(job.error || 'Export failed');
+        }
+        blob = await downloadJobOutput(job);
+      } else {
+        blob = await response.blob();
+      }
       const url = window.URL.createObjectURL(blob);
       const a = document.createElement('a');
       a.href = url;
@@ -198,9 +213,9 @@ export default function ManagementDashboardPage() {
         }
       );
 
-      const data = await response.json();
+      const { ok, data } = await resolveJobResponse(response);
 
-      if (response.ok && data.ok) {
+      if (ok && data.ok) {
         alert(data.message);
         setSelectedRows(new Set());
         setSelectAll(false);
@@ -5,6 +5,7 @@
 import { useState, useEffect } from "react";
 import { useNavigate } from "react-router-dom";
 import { clearTokens } from "../api/client";
+import { resolveJobResponse } from "../api/staff";
 import ManagementLayout from "../components/ManagementLayout";
 
 export default function VIPManagementPage() {
@@ -233,9 +234,10 @@ export default function VIPManagementPage() {
         }
       );
 
-      const data = await response.json();
+      // Large files are imported by a background job; this waits for it
+      const { ok, data } = await resolveJobResponse(response);
 
-      if (response.ok && data.ok) {
+      if (ok && data.ok) {
         setUploadResult({
           success: true,
           message: data.message,